@@ -0,0 +1,37 @@
+"""
+JSON parser for the REST API built on orjson.
+
+``ORJSONParser`` reads UTF-8 request bodies with orjson; bodies in another
+declared charset, or rejected by orjson, are reparsed by DRF's
+``JSONParser`` so errors and edge cases are reported exactly as before.
+orjson reads integers wider than 64 bits as floats.
+"""
+
+import io
+
+import orjson
+from django.conf import settings  # type: ignore
+from rest_framework.parsers import JSONParser  # type: ignore
+
+from .renderers import ORJSONRenderer
+
+
+class ORJSONParser(JSONParser):
+    """Parses JSON-serialized data with orjson."""
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if not self.strict or encoding.lower().replace("_", "-") not in (
+            "utf-8",
+            "utf8",
+        ):
+            return super().parse(stream, media_type, parser_context)
+
+        data = stream.read()
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return super().parse(io.BytesIO(data), media_type, parser_context)
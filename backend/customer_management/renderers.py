@@ -0,0 +1,46 @@
+"""
+JSON renderer for the REST API built on orjson.
+
+``ORJSONRenderer`` is a drop-in replacement for DRF's ``JSONRenderer``:
+orjson serializes straight to bytes and encodes datetimes, dates, times
+and UUIDs natively, and anything else is handed to DRF's
+``JSONEncoder.default`` (Decimals, lazy strings, querysets, ...), so the
+output matches ``JSONRenderer`` byte for byte.  Indented output, ASCII-only
+output and data orjson rejects (integers wider than 64 bits,
+timezone-aware times) go through ``JSONRenderer`` itself.  Two cases
+differ on purpose: NaN and infinities render as ``null`` instead of
+raising, and floats use orjson's exponent format (``1e16``, not
+``1e+16``).
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer  # type: ignore
+from rest_framework.utils.encoders import JSONEncoder  # type: ignore
+
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+_default = JSONEncoder().default
+
+
+class ORJSONRenderer(JSONRenderer):
+    """Renderer which serializes to JSON with orjson."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if self.ensure_ascii or not self.compact or indent is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=_default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Like JSONRenderer, escape U+2028 and U+2029 so the output is also
+        # valid JavaScript.
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return ret
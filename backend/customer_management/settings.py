@@ -49,6 +49,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "corsheaders",
     "django_filters",
@@ -147,7 +148,12 @@ REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "customer_management.renderers.ORJSONRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "customer_management.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework.authentication.SessionAuthentication",
@@ -157,6 +163,63 @@ REST_FRAMEWORK = {
     ],
 }
 
+# Cache
+# Cached list counts are invalidated by bumping a version key in this cache,
+# so deployments running several worker processes need a shared backend
+# (e.g. django.core.cache.backends.redis.RedisCache); the per-process default
+# only suits a single worker.
+CACHES = {
+    "default": {
+        "BACKEND": config.get("cache", {}).get(
+            "backend", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": config.get("cache", {}).get("location", ""),
+    }
+}
+
+# Customer list
+CUSTOMER_LIST = {
+    # Seconds a cached list count is kept; writes invalidate it sooner.
+    "COUNT_CACHE_TIMEOUT": int(config.get("list", {}).get("count_cache_timeout", 300)),
+    # Planner row estimate above which list counts are estimated rather than
+    # counted (PostgreSQL only); 0 always estimates.
+    "COUNT_ESTIMATE_THRESHOLD": int(
+        config.get("list", {}).get("count_estimate_threshold", 100000)
+    ),
+}
+
+# Customer statistics
+CUSTOMER_STATS = {
+    # Seconds before the incrementally maintained dashboard counts are
+    # recomputed from the database.
+    "RECONCILE_INTERVAL": int(config.get("stats", {}).get("reconcile_interval", 600)),
+}
+
+# Customer change feed
+CUSTOMER_SYNC = {
+    # Changes newer than this many seconds are held back so writes that
+    # commit slightly out of order are not skipped.
+    "SETTLE_SECONDS": int(config.get("sync", {}).get("settle_seconds", 5)),
+    # Days tombstones of deleted customers are kept; older delta tokens
+    # require a full resync.
+    "TOMBSTONE_RETENTION_DAYS": int(
+        config.get("sync", {}).get("tombstone_retention_days", 30)
+    ),
+}
+
+# Customer search
+CUSTOMER_SEARCH = {
+    # Dotted path to a customers.search backend; chosen from the database
+    # vendor when unset.
+    "BACKEND": config.get("search", {}).get("backend"),
+    # Minimum pg_trgm word similarity for ``search_mode=fuzzy`` matches.
+    "TRIGRAM_THRESHOLD": float(config.get("search", {}).get("trigram_threshold", 0.3)),
+    # Seconds before the in-memory backend reloads its index from the database.
+    "MEMORY_INDEX_TTL": int(config.get("search", {}).get("memory_index_ttl", 300)),
+    # Most customers an in-memory backend search returns, best ranked first.
+    "MEMORY_MAX_MATCHES": int(config.get("search", {}).get("memory_max_matches", 1000)),
+}
+
 # CORS settings
 CORS_ALLOWED_ORIGINS = config.get("cors", {}).get(
     "allowed_origins",
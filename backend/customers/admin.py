@@ -9,7 +9,7 @@ class CustomerAdmin(admin.ModelAdmin):
 
     list_display = ("full_name", "email", "phone", "is_active", "created_at")
     list_filter = ("is_active", "created_at", "updated_at")
-    search_fields = ("first_name", "last_name", "email", "phone")
+    search_fields = ("full_name", "email", "phone")
     list_editable = ("is_active",)
     readonly_fields = ("created_at", "updated_at")
 
@@ -28,4 +28,4 @@ class CustomerAdmin(admin.ModelAdmin):
         return obj.full_name
 
     full_name.short_description = "Full Name"  # type: ignore
-    full_name.admin_order_field = "last_name"  # type: ignore
+    full_name.admin_order_field = "full_name"  # type: ignore
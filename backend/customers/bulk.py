@@ -0,0 +1,161 @@
+"""
+Set-based validation and writes for batches of customers.
+
+Each record is validated by ``CustomerBulkItemSerializer`` (field rules
+only), and the batch by ``customers.validation.clean_records`` (the rules
+of ``Customer.clean``), in memory; it is then matched against existing
+customers by email with a single ``email IN (...)`` query plus an in-batch
+duplicate check, and the valid records are written with one
+``bulk_create``.  Errors are reported per record by its index in the batch.
+"""
+
+from django.db import IntegrityError, transaction  # type: ignore
+from django.db.models import F  # type: ignore
+
+from .models import Customer
+from .serializers import CustomerBulkItemSerializer
+from .validation import clean_records
+
+DUPLICATE_IN_BATCH = "This email appears more than once in the batch."
+DUPLICATE_EXISTING = "A customer with this email already exists."
+
+# Columns an upsert compares and overwrites; ``email`` is the key.
+UPSERT_FIELDS = ("first_name", "last_name", "phone", "is_active")
+INSERTED = "inserted"
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+
+
+def validate_records(records):
+    """
+    Validate ``records`` without touching the database.
+
+    Returns ``(valid, errors)``: ``(customer, fields)`` pairs of an unsaved,
+    cleaned ``Customer`` and the fields the record provided, and error
+    dicts, each keyed by record index.  Emails repeated within the batch
+    are rejected after their first occurrence.
+    """
+    errors = {}
+    validated = {}
+    for index, record in enumerate(records):
+        serializer = CustomerBulkItemSerializer(data=record)
+        if serializer.is_valid():
+            validated[index] = serializer.validated_data
+        else:
+            errors[index] = serializer.errors
+
+    # The model rules of ``Customer.clean``, applied to the batch at once.
+    indexes = list(validated)
+    cleaned, clean_errors = clean_records([validated[i] for i in indexes])
+    for position, error in clean_errors.items():
+        errors[indexes[position]] = error
+
+    valid = {}
+    seen = set()
+    for position, data in cleaned.items():
+        index = indexes[position]
+        customer = Customer(**data)
+        if customer.email in seen:
+            errors[index] = {"email": [DUPLICATE_IN_BATCH]}
+            continue
+        seen.add(customer.email)
+        valid[index] = customer, set(data)
+    return valid, dict(sorted(errors.items()))
+
+
+def existing_emails(emails, using="default"):
+    """Return which of ``emails`` already belong to a customer, in one query."""
+    return set(
+        Customer.objects.using(using)
+        .filter(email__in=list(emails))
+        .values_list("email", flat=True)
+    )
+
+
+def bulk_create_customers(records, using="default"):
+    """
+    Create the valid customers among ``records``.
+
+    Returns ``(created, errors)``: the created ``Customer`` instances keyed by
+    record index, and error dicts keyed by record index.  If a concurrent
+    writer takes one of the emails between the check and the insert, the
+    check is repeated once and the insert retried without the conflicts.
+    """
+    valid, errors = validate_records(records)
+    customers = {index: customer for index, (customer, _) in valid.items()}
+    for attempt in range(2):
+        taken = existing_emails(
+            (customer.email for customer in customers.values()), using
+        )
+        for index in [i for i, c in customers.items() if c.email in taken]:
+            del customers[index]
+            errors[index] = {"email": [DUPLICATE_EXISTING]}
+        if not customers:
+            break
+        try:
+            with transaction.atomic(using=using):
+                Customer.objects.using(using).bulk_create(list(customers.values()))
+            break
+        except IntegrityError:
+            if attempt:
+                raise
+    return customers, errors
+
+
+def upsert_customers(records, using="default", batch_size=500):
+    """
+    Insert or update customers from ``records``, keyed on email.
+
+    Existing customers are read with one ``email IN (...)`` query and each
+    record is classified as inserted, updated or unchanged; only inserted
+    and updated records are written, with ``INSERT ... ON CONFLICT (email)
+    DO UPDATE`` in batches of ``batch_size``, so unchanged customers keep
+    their ``updated_at`` and version.  A record that omits ``is_active``
+    keeps the stored status.
+
+    Returns ``(results, errors)``: ``(status, customer)`` pairs and error
+    dicts, each keyed by record index.
+    """
+    valid, errors = validate_records(records)
+    existing = {
+        row["email"]: row
+        for row in Customer.objects.using(using)
+        .filter(email__in=[customer.email for customer, _ in valid.values()])
+        .values("id", "email", "version", *UPSERT_FIELDS)
+    }
+
+    results = {}
+    updated_ids = []
+    for index, (customer, fields) in valid.items():
+        row = existing.get(customer.email)
+        if row is None:
+            results[index] = INSERTED, customer
+            continue
+        for field in UPSERT_FIELDS:
+            if field not in fields:
+                setattr(customer, field, row[field])
+        customer.version = row["version"]
+        if all(getattr(customer, field) == row[field] for field in UPSERT_FIELDS):
+            customer.id = row["id"]
+            results[index] = UNCHANGED, customer
+        else:
+            customer.version += 1
+            updated_ids.append(row["id"])
+            results[index] = UPDATED, customer
+
+    writes = [customer for status, customer in results.values() if status != UNCHANGED]
+    if writes:
+        customers = Customer.objects.using(using)
+        with transaction.atomic(using=using):
+            customers.bulk_create(
+                writes,
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=["email"],
+                update_fields=[*UPSERT_FIELDS, "updated_at"],
+            )
+            # The conflict update cannot increment, so the updated rows'
+            # versions are bumped while the upsert still holds their locks.
+            if updated_ids:
+                customers.filter(id__in=updated_ids).update(version=F("version") + 1)
+    return results, errors
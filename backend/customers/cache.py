@@ -0,0 +1,70 @@
+"""
+Cache helpers for derived customer data.
+
+Cached values that depend on the customer table (list counts, and anything
+else keyed off the collection) embed a *collection version* in their cache
+keys.  Every write moves the version, so stale entries are never read
+again and simply expire.  On PostgreSQL the version is read from the
+database: it is the number of write statements counted by the triggers of
+``customers.counters``, so every worker process sees the same version and
+writes that bypass the ORM move it too.  Other databases keep it in the
+default cache, bumped by ``collection_changed``; deployments running
+several processes on them need a shared cache (Redis, Memcached or the
+database cache).
+"""
+
+import hashlib
+import time
+
+from django.core.cache import cache  # type: ignore
+from django.db import transaction  # type: ignore
+
+from .counters import counters_available, read_change_count
+
+COLLECTION_VERSION_KEY = "customers:collection-version"
+
+
+def get_collection_version(using="default"):
+    """Return the current collection version of ``using``."""
+    if counters_available(using):
+        return read_change_count(using)
+    version = cache.get(COLLECTION_VERSION_KEY)
+    if version is None:
+        # Seed from the clock so an evicted version never repeats.
+        cache.add(COLLECTION_VERSION_KEY, time.time_ns(), None)
+        version = cache.get(COLLECTION_VERSION_KEY)
+    return version
+
+
+def bump_collection_version():
+    """Invalidate every entry keyed by the current collection version."""
+    try:
+        cache.incr(COLLECTION_VERSION_KEY)
+    except ValueError:
+        cache.set(COLLECTION_VERSION_KEY, time.time_ns(), None)
+
+
+def collection_changed(using="default"):
+    """
+    Record a write to the customer table in the cached version.
+
+    The version is bumped straight away and again once the surrounding
+    transaction commits, so a value computed by another request between
+    the write and the commit cannot outlive the commit.
+    """
+    bump_collection_version()
+    connection = transaction.get_connection(using)
+    if connection.in_atomic_block:
+        transaction.on_commit(bump_collection_version, using=using)
+
+
+def versioned_key(prefix, *parts, using="default", version=None):
+    """
+    Return a cache key for ``parts`` under the collection version of ``using``.
+
+    ``version`` saves reading the version again when the caller has it.
+    """
+    if version is None:
+        version = get_collection_version(using)
+    digest = hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+    return f"customers:{prefix}:{version}:{digest}"
@@ -0,0 +1,83 @@
+"""
+Trigger-maintained customer counts on PostgreSQL.
+
+Migration ``0006_customer_counters`` creates ``customers_counters``, a small
+table of shards holding running ``total`` and ``active`` counts, and
+statement-level triggers on ``customers`` that add each write's delta to
+one shard.  Summing the shards gives exact counts without scanning the
+customer table.  Migration ``0012_customer_counter_changes`` adds a
+``changes`` column that every write statement increments, whose sum serves
+as the collection version in ``customers.cache``.  Other databases have no
+counter table and fall back to ``COUNT``.
+"""
+
+from django.db import connections, transaction  # type: ignore
+from django.db.models import Count, Q  # type: ignore
+
+COUNTER_TABLE = "customers_counters"
+
+# Aliases whose counter table has been seen; it is never dropped once
+# migrated, so the lookup is not repeated for them.
+_available = set()
+
+
+def counters_available(using="default"):
+    """Return whether the counter table exists on ``using``."""
+    if using in _available:
+        return True
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [COUNTER_TABLE])
+        available = cursor.fetchone()[0]
+    if available:
+        _available.add(using)
+    return available
+
+
+def read_counters(using="default"):
+    """Return ``{"total": n, "active": n}`` from the counter shards."""
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT coalesce(sum(total), 0), coalesce(sum(active), 0) "
+            f"FROM {COUNTER_TABLE}"
+        )
+        total, active = cursor.fetchone()
+    return {"total": int(total), "active": int(active)}
+
+
+def read_change_count(using="default"):
+    """Return how many write statements have changed ``customers``."""
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"SELECT coalesce(sum(changes), 0) FROM {COUNTER_TABLE}")
+        return int(cursor.fetchone()[0])
+
+
+def count_customers(using="default"):
+    """Count total and active customers in a single query."""
+    from .models import Customer
+
+    return Customer.objects.using(using).aggregate(
+        total=Count("id"), active=Count("id", filter=Q(is_active=True))
+    )
+
+
+def reset_counters(using="default"):
+    """
+    Recount the customer table and store the result in the shards.
+
+    Writes to ``customers`` are blocked while the table is recounted, so
+    the stored counts are exact when the transaction commits.
+    """
+    connection = connections[using]
+    with transaction.atomic(using=using), connection.cursor() as cursor:
+        cursor.execute("LOCK TABLE customers IN SHARE MODE")
+        counts = count_customers(using)
+        cursor.execute(f"UPDATE {COUNTER_TABLE} SET total = 0, active = 0")
+        cursor.execute(
+            f"UPDATE {COUNTER_TABLE} SET total = %s, active = %s "
+            f"WHERE shard = (SELECT min(shard) FROM {COUNTER_TABLE})",
+            [counts["total"], counts["active"]],
+        )
+    return counts
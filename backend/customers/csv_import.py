@@ -0,0 +1,223 @@
+"""
+Streaming CSV import of customers.
+
+The file is read through a generator pipeline: rows are parsed and
+stripped, grouped into batches, and each batch is validated with the rules
+of the bulk API (``customers.bulk.validate_records``, i.e. the serializer
+field rules and ``Customer.clean``).  Only one batch is held in memory at
+a time, whatever the size of the file.
+
+On PostgreSQL the valid rows are streamed with ``COPY FROM STDIN`` into a
+temporary staging table and merged into ``customers`` with a single
+``INSERT ... ON CONFLICT (email) DO UPDATE`` that skips unchanged rows.
+Other databases upsert each batch with ``upsert_customers`` instead.
+Either way, rows are keyed on email and an existing customer keeps its
+status.
+"""
+
+import csv
+import io
+from itertools import islice
+
+from django.db import connections, transaction  # type: ignore
+from django.utils import timezone  # type: ignore
+
+from .bulk import INSERTED, UNCHANGED, UPDATED, upsert_customers, validate_records
+from .cache import collection_changed
+from .exceptions import CustomerImportError
+from .phone import normalize_phone
+from .stats import adjust_customer_stats
+
+CSV_COLUMNS = ("first_name", "last_name", "email", "phone")
+STAGING_TABLE = "customers_import"
+# Errors beyond this many are counted but not returned.
+MAX_REPORTED_ERRORS = 100
+
+# Keeps the first row per email and only rewrites customers whose fields
+# differ; ``xmax = 0`` tells inserted rows from updated ones.
+MERGE_SQL = f"""
+    WITH merged AS (
+        INSERT INTO customers AS c (
+            first_name, last_name, email, phone, phone_digits,
+            is_active, created_at, updated_at, version
+        )
+        SELECT DISTINCT ON (email)
+            first_name, last_name, email, phone, phone_digits,
+            true, %s, %s, 1
+        FROM {STAGING_TABLE}
+        ORDER BY email, line
+        ON CONFLICT (email) DO UPDATE SET
+            first_name = EXCLUDED.first_name,
+            last_name = EXCLUDED.last_name,
+            phone = EXCLUDED.phone,
+            phone_digits = EXCLUDED.phone_digits,
+            updated_at = EXCLUDED.updated_at,
+            version = c.version + 1
+        WHERE (c.first_name, c.last_name, c.phone)
+            IS DISTINCT FROM (EXCLUDED.first_name, EXCLUDED.last_name, EXCLUDED.phone)
+        RETURNING xmax = 0 AS inserted
+    )
+    SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted)
+    FROM merged
+"""
+
+
+def read_records(stream):
+    """Yield ``(line, record)`` for each data row of the CSV text ``stream``."""
+    reader = csv.DictReader(stream)
+    try:
+        missing = set(CSV_COLUMNS) - set(reader.fieldnames or ())
+        if missing:
+            raise CustomerImportError(
+                f"CSV is missing columns: {', '.join(sorted(missing))}."
+            )
+        for row in reader:
+            yield reader.line_num, {
+                column: (row[column] or "").strip() for column in CSV_COLUMNS
+            }
+    except (csv.Error, UnicodeDecodeError) as exc:
+        raise CustomerImportError(
+            f"Line {reader.line_num + 1} could not be read: {exc}"
+        )
+
+
+def batched(records, size):
+    """Group ``records`` into lists of at most ``size`` items."""
+    records = iter(records)
+    while batch := list(islice(records, size)):
+        yield batch
+
+
+def import_customers(stream, using="default", batch_size=1000):
+    """
+    Import customers from the CSV text ``stream``.
+
+    Returns a summary dict with the number of ``rows`` read, how many were
+    ``inserted``, ``updated``, ``unchanged`` or ``invalid``, how many
+    repeated an email seen earlier in the file (``duplicates``), and up to
+    ``MAX_REPORTED_ERRORS`` ``errors`` as ``{"line": n, "errors": {...}}``.
+
+    On PostgreSQL the whole file is merged in one transaction.  Elsewhere
+    each batch commits on its own, and a repeated email in a later batch
+    updates the customer instead of counting as a duplicate.
+    """
+    result = {
+        "rows": 0,
+        INSERTED: 0,
+        UPDATED: 0,
+        UNCHANGED: 0,
+        "invalid": 0,
+        "duplicates": 0,
+        "errors": [],
+    }
+    batches = batched(read_records(stream), batch_size)
+    if connections[using].vendor == "postgresql":
+        _copy_import(batches, result, using)
+    else:
+        _upsert_import(batches, result, using)
+    return result
+
+
+def _report(result, batch, errors):
+    result["rows"] += len(batch)
+    result["invalid"] += len(errors)
+    for index in sorted(errors):
+        if len(result["errors"]) >= MAX_REPORTED_ERRORS:
+            break
+        result["errors"].append({"line": batch[index][0], "errors": errors[index]})
+
+
+def _upsert_import(batches, result, using):
+    for batch in batches:
+        results, errors = upsert_customers([record for _, record in batch], using)
+        _report(result, batch, errors)
+        for status, _ in results.values():
+            result[status] += 1
+
+
+def _copy_rows(batches, result):
+    """Yield the valid rows of each batch as CSV text for ``COPY``."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for batch in batches:
+        valid, errors = validate_records([record for _, record in batch])
+        _report(result, batch, errors)
+        for index, (customer, _) in valid.items():
+            writer.writerow(
+                [
+                    batch[index][0],
+                    customer.first_name,
+                    customer.last_name,
+                    customer.email,
+                    customer.phone,
+                    normalize_phone(customer.phone),
+                ]
+            )
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+class _ChunkReader:
+    """
+    Minimal file object reading from an iterator of strings.
+
+    ``COPY`` reports an exception raised while reading as a cancelled
+    query, so the original is kept in ``error`` for the caller to re-raise.
+    """
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = ""
+        self.error = None
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            try:
+                chunk = next(self._chunks, None)
+            except Exception as exc:
+                self.error = exc
+                raise
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def _copy_import(batches, result, using):
+    connection = connections[using]
+    now = timezone.now()
+    with transaction.atomic(using=using), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {STAGING_TABLE} ("
+            "line bigint, first_name varchar(50), last_name varchar(50), "
+            "email varchar(254), phone varchar(15), phone_digits varchar(15)"
+            ") ON COMMIT DROP"
+        )
+        reader = _ChunkReader(_copy_rows(batches, result))
+        try:
+            cursor.copy_expert(
+                f"COPY {STAGING_TABLE} FROM STDIN WITH (FORMAT csv)", reader
+            )
+        except Exception:
+            if reader.error is not None:
+                raise reader.error
+            raise
+        cursor.execute(f"SELECT count(DISTINCT email) FROM {STAGING_TABLE}")
+        (distinct,) = cursor.fetchone()
+        cursor.execute(MERGE_SQL, [now, now])
+        inserted, updated = cursor.fetchone()
+        # Dropped now in case this runs inside a longer transaction.
+        cursor.execute(f"DROP TABLE {STAGING_TABLE}")
+
+        result["duplicates"] = result["rows"] - result["invalid"] - distinct
+        result[INSERTED] = inserted
+        result[UPDATED] = updated
+        result[UNCHANGED] = distinct - inserted - updated
+        if inserted or updated:
+            collection_changed(using)
+            # New customers are active and updates leave the status alone.
+            adjust_customer_stats(total=inserted, active=inserted, using=using)
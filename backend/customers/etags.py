@@ -0,0 +1,64 @@
+"""
+Validators for conditional GET on the customer endpoints.
+
+Detail ETags are derived from a customer's id, version and ``updated_at``
+and start with ``<id>-<version>-`` so ``If-Match`` on writes can be checked
+against the version alone; list ETags come from the collection version in
+``customers.cache``, which on PostgreSQL is read from the database so every
+worker process agrees on it.  Both also cover the query string and the
+negotiated media type, since either changes the representation.  The
+inputs are cheap to read, so a request whose ``If-None-Match`` still
+matches is answered with a 304 before any customer is loaded or
+serialized.
+"""
+
+import hashlib
+import re
+
+from django.utils.http import parse_etags  # type: ignore
+
+_DETAIL_ETAG_RE = re.compile(r'^"(\d+)-(\d+)-[0-9a-f]+"$')
+
+
+def _etag(*parts):
+    digest = hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def _representation(request):
+    params = sorted(
+        (key, tuple(values)) for key, values in request.query_params.lists()
+    )
+    return getattr(request, "accepted_media_type", None), params
+
+
+def list_etag(request, version):
+    """Return the strong ETag of a list response at collection ``version``."""
+    return _etag("list", version, *_representation(request))
+
+
+def customer_etag(request, customer_id, version, updated_at):
+    """Return the strong ETag of a detail response for ``request``."""
+    digest = _etag(updated_at.isoformat(), *_representation(request)).strip('"')
+    return f'"{customer_id}-{version}-{digest[:16]}"'
+
+
+def if_match_versions(request, customer_id):
+    """
+    Return the versions of ``customer_id`` listed in ``If-Match``.
+
+    Returns ``None`` when the header is absent or ``*``, and an empty set
+    when it names no version of this customer.
+    """
+    header = request.headers.get("If-Match")
+    if not header:
+        return None
+    tags = parse_etags(header)
+    if tags == ["*"]:
+        return None
+    versions = set()
+    for tag in tags:
+        match = _DETAIL_ETAG_RE.match(tag)
+        if match and int(match.group(1)) == customer_id:
+            versions.add(int(match.group(2)))
+    return versions
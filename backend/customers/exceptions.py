@@ -0,0 +1,27 @@
+from django.db import DatabaseError  # type: ignore
+from rest_framework import status  # type: ignore
+from rest_framework.exceptions import APIException  # type: ignore
+
+
+class StaleCustomerError(DatabaseError):
+    """A save found the customer's row at a different version than it read."""
+
+
+class CustomerImportError(ValueError):
+    """A customer import file is missing columns or cannot be parsed."""
+
+
+class PreconditionFailed(APIException):
+    """The client's If-Match version no longer matches the customer."""
+
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = "The customer has been modified since it was read."
+    default_code = "precondition_failed"
+
+
+class ResyncRequired(APIException):
+    """A change-feed token predates the tombstones still kept."""
+
+    status_code = status.HTTP_410_GONE
+    default_detail = "The delta token has expired; start a full sync without a token."
+    default_code = "resync_required"
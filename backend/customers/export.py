@@ -0,0 +1,230 @@
+"""
+Streaming export of customers as CSV, NDJSON, Parquet or Arrow.
+
+Rows are read with ``values_list(...).iterator()``, which uses a
+server-side cursor on PostgreSQL, and encoded as they arrive, so memory
+stays flat however many customers are exported.  Text formats are flushed
+in chunks of about ``FLUSH_SIZE`` characters; the columnar formats are
+written one row group (or record batch) of ``ROW_GROUP_SIZE`` rows at a
+time.
+
+Parquet and Arrow need the optional ``pyarrow`` package (the
+``analytics`` extra); ``columnar_available()`` reports whether it is
+installed.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+
+from rest_framework.exceptions import ValidationError  # type: ignore
+from rest_framework.negotiation import BaseContentNegotiation  # type: ignore
+
+from .csv_import import batched
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    pa = pq = None
+
+EXPORT_FIELDS = (
+    "id",
+    "first_name",
+    "last_name",
+    "email",
+    "phone",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+COLUMNAR_FORMATS = ("parquet", "arrow")
+EXPORT_CHUNK_SIZE = 2000
+# Encoded text is yielded once it grows past this many characters.
+FLUSH_SIZE = 64 * 1024
+ROW_GROUP_SIZE = 50_000
+
+
+def columnar_available():
+    """Return whether the Parquet and Arrow formats can be written."""
+    return pa is not None
+
+
+def parse_columns(value):
+    """
+    Return the export columns named in the comma-separated ``value``.
+
+    All of ``EXPORT_FIELDS`` are exported when ``value`` is empty.
+    """
+    if not value:
+        return EXPORT_FIELDS
+    columns = tuple(column.strip() for column in value.split(",") if column.strip())
+    unknown = [column for column in columns if column not in EXPORT_FIELDS]
+    if unknown or len(set(columns)) != len(columns):
+        raise ValidationError(
+            {"columns": f"Choose distinct columns from: {', '.join(EXPORT_FIELDS)}."}
+        )
+    return columns
+
+
+def export_rows(queryset, columns=EXPORT_FIELDS, chunk_size=EXPORT_CHUNK_SIZE):
+    """Iterate over ``queryset`` as tuples of ``columns``."""
+    return queryset.values_list(*columns).iterator(chunk_size=chunk_size)
+
+
+def _csv_value(value):
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def csv_chunks(rows, columns=EXPORT_FIELDS):
+    """Encode ``rows`` as CSV with a header line."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow([_csv_value(value) for value in row])
+        if buffer.tell() >= FLUSH_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def ndjson_chunks(rows, columns=EXPORT_FIELDS):
+    """Encode ``rows`` as one JSON object per line."""
+    lines = []
+    size = 0
+    for row in rows:
+        line = json.dumps(
+            dict(zip(columns, row)), default=_json_default, ensure_ascii=False
+        )
+        lines.append(line)
+        size += len(line) + 1
+        if size >= FLUSH_SIZE:
+            yield "\n".join(lines) + "\n"
+            lines, size = [], 0
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def arrow_schema(columns=EXPORT_FIELDS):
+    """Return the Arrow schema of an export of ``columns``."""
+    types = {
+        "id": pa.int64(),
+        "first_name": pa.string(),
+        "last_name": pa.string(),
+        "email": pa.string(),
+        "phone": pa.string(),
+        "is_active": pa.bool_(),
+        "created_at": pa.timestamp("us", tz="UTC"),
+        "updated_at": pa.timestamp("us", tz="UTC"),
+    }
+    return pa.schema([(column, types[column]) for column in columns])
+
+
+class _ByteSink:
+    """Write-only file object whose contents are drained as they are written."""
+
+    closed = False
+
+    def __init__(self):
+        self._buffer = io.BytesIO()
+        self._position = 0
+
+    def write(self, data):
+        self._buffer.write(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+
+def columnar_chunks(
+    rows, columns=EXPORT_FIELDS, export_format="parquet", row_group_size=None
+):
+    """
+    Encode ``rows`` as a Parquet file or an Arrow IPC stream.
+
+    Each ``row_group_size`` rows become one Parquet row group or Arrow
+    record batch, whose bytes are yielded as soon as they are written.
+    """
+    schema = arrow_schema(columns)
+    sink = _ByteSink()
+    if export_format == "parquet":
+        writer = pq.ParquetWriter(sink, schema)
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+    with writer:
+        for batch in batched(rows, row_group_size or ROW_GROUP_SIZE):
+            writer.write_table(
+                pa.Table.from_arrays(
+                    [
+                        pa.array(values, type=field.type)
+                        for values, field in zip(zip(*batch), schema)
+                    ],
+                    schema=schema,
+                )
+            )
+            yield sink.drain()
+    yield sink.drain()
+
+
+def export_customers(
+    queryset,
+    export_format,
+    columns=EXPORT_FIELDS,
+    chunk_size=EXPORT_CHUNK_SIZE,
+    row_group_size=None,
+):
+    """Yield ``queryset`` encoded in ``export_format``, in chunks."""
+    rows = export_rows(queryset, columns, chunk_size)
+    if export_format in COLUMNAR_FORMATS:
+        return columnar_chunks(rows, columns, export_format, row_group_size)
+    encode = csv_chunks if export_format == "csv" else ndjson_chunks
+    return encode(rows, columns)
+
+
+class ExportContentNegotiation(BaseContentNegotiation):
+    """
+    Negotiation for the export action, whose format is part of its URL.
+
+    The response body is not rendered by DRF, so the client's ``Accept``
+    header is ignored rather than answered with 406; errors are rendered by
+    the first renderer.
+    """
+
+    def select_parser(self, request, parsers):
+        return parsers[0]
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return renderers[0], renderers[0].media_type
@@ -0,0 +1,67 @@
+"""
+Sparse fieldsets for the customer list and detail endpoints.
+
+``?fields=id,email`` keeps only the named serializer fields and
+``?exclude=phone`` drops fields; both take comma-separated names and may
+be combined.  The selection also narrows the columns read from the
+database: the list reads value rows of just those columns, and a detail
+request loads the customer with ``only()``.
+"""
+
+from rest_framework.exceptions import ValidationError  # type: ignore
+
+FIELDS_PARAM = "fields"
+EXCLUDE_PARAM = "exclude"
+
+# Serializer fields that are not model columns, and the columns they read.
+FIELD_COLUMNS = {"full_name": ("first_name", "last_name")}
+
+
+def _names(value):
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+def parse_fieldset(query_params, available):
+    """
+    Return the fields of ``available`` selected by ``query_params``.
+
+    The result keeps the order of ``available``.  Returns ``None`` when
+    neither parameter is given, so callers can keep their full
+    representation.
+    """
+    fields = query_params.get(FIELDS_PARAM)
+    exclude = query_params.get(EXCLUDE_PARAM)
+    if fields is None and exclude is None:
+        return None
+
+    errors = {}
+    selected = set(available)
+    for param, value in ((FIELDS_PARAM, fields), (EXCLUDE_PARAM, exclude)):
+        if value is None:
+            continue
+        names = _names(value)
+        unknown = [name for name in names if name not in available]
+        if unknown:
+            errors[param] = (
+                f"Unknown fields: {', '.join(unknown)}. "
+                f"Choose from: {', '.join(available)}."
+            )
+        elif param == FIELDS_PARAM:
+            selected &= set(names)
+        else:
+            selected -= set(names)
+    if errors:
+        raise ValidationError(errors)
+    if not selected:
+        raise ValidationError({FIELDS_PARAM: "Select at least one field."})
+    return tuple(name for name in available if name in selected)
+
+
+def fieldset_columns(fields):
+    """Return the model columns needed to render ``fields``."""
+    columns = []
+    for field in fields:
+        for column in FIELD_COLUMNS.get(field, (field,)):
+            if column not in columns:
+                columns.append(column)
+    return columns
@@ -0,0 +1,102 @@
+import django_filters  # type: ignore
+from rest_framework import filters  # type: ignore
+from rest_framework.exceptions import ValidationError  # type: ignore
+
+from .models import Customer
+from .phone import phone_filter
+from .search import SEARCH_MODES, search_customers
+
+
+class CustomerFilterSet(django_filters.FilterSet):
+    """
+    Field filters applied by ``DjangoFilterBackend``.
+
+    ``created_at`` and ``updated_at`` take inclusive ISO 8601 bounds as
+    ``<field>_after`` and ``<field>_before``.
+    """
+
+    created_at = django_filters.IsoDateTimeFromToRangeFilter()
+    updated_at = django_filters.IsoDateTimeFromToRangeFilter()
+
+    class Meta:
+        model = Customer
+        fields = ["is_active", "created_at", "updated_at"]
+
+
+def filterset_params(filterset_class):
+    """
+    Return the query parameters read by the filters of ``filterset_class``.
+
+    Range filters read one parameter per bound, e.g. ``created_at_after``
+    and ``created_at_before``.
+    """
+    params = []
+    for name, filter_ in filterset_class.base_filters.items():
+        widget = filter_.field.widget
+        suffixes = getattr(widget, "suffixes", None)
+        if suffixes:
+            params.extend(widget.suffixed(name, suffix) for suffix in suffixes)
+        else:
+            params.append(name)
+    return params
+
+
+# Query parameters that select customers, in ``CustomerFilterSet`` or
+# ``filter_customers``.
+FILTER_PARAMS = [
+    *filterset_params(CustomerFilterSet),
+    "phone",
+    "phone_prefix",
+    "search",
+]
+
+
+def filter_customers(queryset, params):
+    """
+    Restrict ``queryset`` by the list endpoint's query parameters.
+
+    ``params`` is a mapping such as ``request.query_params``.  Raises
+    ``ValidationError`` for an unknown ``search_mode``.
+    """
+    # Filter by active status
+    is_active = params.get("is_active")
+    if is_active is not None:
+        queryset = queryset.filter(is_active=is_active.lower() == "true")
+
+    # Match phone numbers on their normalized digits, whole or by prefix
+    phone = params.get("phone")
+    if phone:
+        queryset = queryset.filter(phone_filter(phone))
+    phone_prefix = params.get("phone_prefix")
+    if phone_prefix:
+        queryset = queryset.filter(phone_filter(phone_prefix, prefix=True))
+
+    # Search names, email and phone through the configured backend
+    search = params.get("search")
+    if search:
+        mode = params.get("search_mode", "fulltext")
+        if mode not in SEARCH_MODES:
+            raise ValidationError(
+                {"search_mode": f"Must be one of: {', '.join(SEARCH_MODES)}."}
+            )
+        queryset = search_customers(queryset, search, mode)
+
+    return queryset
+
+
+class CustomerOrderingFilter(filters.OrderingFilter):
+    """
+    Ordering filter that puts the most relevant search results first.
+
+    When the queryset carries a ``search_rank`` annotation and the client did
+    not ask for an explicit ordering, results are ordered by rank and then by
+    the view's default ordering.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if request.query_params.get(self.ordering_param):
+            return ordering
+        if "search_rank" in queryset.query.annotations:
+            return ["-search_rank", *(ordering or [])]
+        return ordering
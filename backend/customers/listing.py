@@ -0,0 +1,78 @@
+"""
+Fast read path for the customer list endpoint.
+
+``CustomerListSerializer`` would build a ``Customer`` per row and run DRF's
+field machinery on it.  The list view instead reads named tuples holding
+only the columns it needs and turns each into the serializer's
+representation with ``encode_list_rows``.  The encoder must stay in step
+with ``CustomerListSerializer``; the test suite checks that both render to
+identical bytes, including for sparse fieldsets.
+"""
+
+from html import escape
+from operator import attrgetter
+
+from django.db.models import F  # type: ignore
+
+# Columns read for ``CustomerListSerializer``'s fields.
+LIST_COLUMNS = ("id", "full_name", "email", "phone", "is_active")
+
+
+def _full_name(row):
+    # ``html.escape`` is what ``django.utils.html.escape`` (and so the
+    # serializer's ``EscapedReadOnlyField``) applies, minus the SafeString
+    # wrapper.
+    return escape(row.full_name)
+
+
+# How each ``CustomerListSerializer`` field is read from a row.
+LIST_ENCODERS = {
+    "id": attrgetter("id"),
+    "full_name": _full_name,
+    "email": attrgetter("email"),
+    "phone": attrgetter("phone"),
+    "is_active": attrgetter("is_active"),
+}
+
+
+def list_rows(queryset, fields=None):
+    """
+    Return ``queryset`` as named rows of the columns ``fields``.
+
+    All of ``LIST_COLUMNS`` are read when ``fields`` is ``None``.  ``id`` and
+    the ordering fields are always selected, because keyset pagination
+    reads the position of the last row from them.  ``full_name`` is
+    selected from the alias ``Customer.objects`` computes it under.
+    """
+    if fields is None:
+        columns = list(LIST_COLUMNS)
+    else:
+        columns = ["id", *(field for field in fields if field != "id")]
+    for field in queryset.query.order_by:
+        if isinstance(field, str) and field.lstrip("-") not in columns:
+            columns.append(field.lstrip("-"))
+    if "full_name" in columns:
+        queryset = queryset.annotate(full_name=F("full_name"))
+    return queryset.values_list(*columns, named=True)
+
+
+def encode_list_rows(rows, fields=None):
+    """
+    Return the ``CustomerListSerializer`` representation of ``rows``.
+
+    Only ``fields`` are rendered when given.
+    """
+    if fields is not None:
+        encoders = [(field, LIST_ENCODERS[field]) for field in fields]
+        return [{field: encode(row) for field, encode in encoders} for row in rows]
+    # The full representation is spelled out, which is faster than looping.
+    return [
+        {
+            "id": row.id,
+            "full_name": _full_name(row),
+            "email": row.email,
+            "phone": row.phone,
+            "is_active": row.is_active,
+        }
+        for row in rows
+    ]
@@ -0,0 +1,64 @@
+from django.core.management.base import BaseCommand, CommandError  # type: ignore
+from django.db import DEFAULT_DB_ALIAS, transaction  # type: ignore
+
+from customers.models import Customer
+from customers.phone import normalize_phone
+
+
+class Command(BaseCommand):
+    """
+    Fill ``Customer.phone_digits`` for rows written before it existed.
+
+    Rows are read in id order in short batches, each written in its own
+    transaction, and only rows whose stored digits differ are updated, so
+    the command can run against a live database and be re-run safely.
+    """
+
+    help = "Backfill the normalized phone_digits column."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of rows processed per transaction (default: 5000).",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database alias to backfill (default: default).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be a positive integer.")
+
+        using = options["database"]
+        customers = Customer.objects.using(using).order_by("id")
+        last_id = 0
+        updated = 0
+        while True:
+            with transaction.atomic(using=using):
+                batch = list(
+                    customers.filter(id__gt=last_id).only(
+                        "id", "phone", "phone_digits"
+                    )[:batch_size]
+                )
+                if not batch:
+                    break
+                changed = []
+                for customer in batch:
+                    digits = normalize_phone(customer.phone)
+                    if customer.phone_digits != digits:
+                        customer.phone_digits = digits
+                        changed.append(customer)
+                if changed:
+                    Customer.objects.using(using).bulk_update(changed, ["phone_digits"])
+                updated += len(changed)
+            last_id = batch[-1].id
+            self.stdout.write(f"Processed customers up to id {last_id}")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Backfilled phone digits for {updated} customers.")
+        )
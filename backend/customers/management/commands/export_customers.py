@@ -0,0 +1,130 @@
+from django.core.management.base import BaseCommand, CommandError  # type: ignore
+from django.db import DEFAULT_DB_ALIAS  # type: ignore
+from rest_framework.exceptions import ValidationError  # type: ignore
+
+from customers.export import (
+    COLUMNAR_FORMATS,
+    EXPORT_CHUNK_SIZE,
+    EXPORT_FORMATS,
+    ROW_GROUP_SIZE,
+    columnar_available,
+    export_customers,
+    parse_columns,
+)
+from customers.filters import CustomerFilterSet, filter_customers
+from customers.models import Customer
+
+
+class Command(BaseCommand):
+    """
+    Export customers as CSV, NDJSON, Parquet or Arrow, optionally filtered
+    like the list endpoint.
+
+    Rows are streamed from a database cursor in id order, so memory use
+    does not grow with the number of customers.  Parquet and Arrow need
+    ``pyarrow`` and an ``--output`` file.
+    """
+
+    help = "Export customers to a file or (CSV and NDJSON only) standard output."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--format",
+            dest="export_format",
+            choices=sorted(EXPORT_FORMATS),
+            default="csv",
+            help="Output format (default: csv).",
+        )
+        parser.add_argument(
+            "-o",
+            "--output",
+            help="File to write to (default: standard output).",
+        )
+        parser.add_argument(
+            "--columns",
+            help="Comma-separated columns to export (default: all).",
+        )
+        parser.add_argument("--is-active", choices=["true", "false"])
+        parser.add_argument("--phone", help="Exact phone number.")
+        parser.add_argument("--phone-prefix", help="Leading digits of the phone.")
+        parser.add_argument("--search", help="Search names, email and phone.")
+        parser.add_argument("--search-mode", help="Search mode (default: fulltext).")
+        for field in ("created_at", "updated_at"):
+            for bound in ("after", "before"):
+                parser.add_argument(
+                    f"--{field.replace('_', '-')}-{bound}",
+                    dest=f"{field}_{bound}",
+                    help=f"Inclusive ISO 8601 {bound} bound on {field}.",
+                )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=EXPORT_CHUNK_SIZE,
+            help=f"Rows fetched per round trip (default: {EXPORT_CHUNK_SIZE}).",
+        )
+        parser.add_argument(
+            "--row-group-size",
+            type=int,
+            default=ROW_GROUP_SIZE,
+            help=f"Rows per Parquet row group (default: {ROW_GROUP_SIZE}).",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database alias to export from (default: default).",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        row_group_size = options["row_group_size"]
+        if chunk_size < 1 or row_group_size < 1:
+            raise CommandError(
+                "--chunk-size and --row-group-size must be positive integers."
+            )
+        export_format = options["export_format"]
+        if export_format in COLUMNAR_FORMATS:
+            if not columnar_available():
+                raise CommandError(
+                    f"The {export_format} format requires pyarrow; install the "
+                    "analytics extra."
+                )
+            if not options["output"]:
+                raise CommandError(f"The {export_format} format needs --output.")
+
+        params = {
+            name: options[name]
+            for name in (
+                "is_active",
+                "phone",
+                "phone_prefix",
+                "search",
+                "search_mode",
+                "created_at_after",
+                "created_at_before",
+                "updated_at_after",
+                "updated_at_before",
+            )
+            if options[name] is not None
+        }
+        queryset = Customer.objects.using(options["database"]).order_by("id")
+        filterset = CustomerFilterSet(params, queryset=queryset)
+        if not filterset.is_valid():
+            raise CommandError(filterset.errors.as_text())
+        try:
+            columns = parse_columns(options["columns"])
+            queryset = filter_customers(filterset.qs, params)
+        except ValidationError as exc:
+            raise CommandError(str(exc.detail))
+
+        chunks = export_customers(
+            queryset, export_format, columns, chunk_size, row_group_size
+        )
+        if export_format in COLUMNAR_FORMATS:
+            with open(options["output"], "wb") as out:
+                out.writelines(chunks)
+        elif options["output"]:
+            with open(options["output"], "w", newline="", encoding="utf-8") as out:
+                out.writelines(chunks)
+        else:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
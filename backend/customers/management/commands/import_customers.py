@@ -0,0 +1,63 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError  # type: ignore
+from django.db import DEFAULT_DB_ALIAS  # type: ignore
+
+from customers.csv_import import import_customers
+from customers.exceptions import CustomerImportError
+
+
+class Command(BaseCommand):
+    """
+    Import customers from a CSV file with first_name, last_name, email and
+    phone columns.
+
+    The file is streamed, so it can be larger than memory.  Rows are keyed
+    on email: new emails are inserted and existing customers updated when
+    their fields differ.
+    """
+
+    help = "Import customers from a CSV file ('-' reads standard input)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV file to import, or '-' for stdin.")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows validated at a time (default: 1000).",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database alias to import into (default: default).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be a positive integer.")
+
+        path = options["path"]
+        try:
+            if path == "-":
+                result = import_customers(sys.stdin, options["database"], batch_size)
+            else:
+                with open(path, newline="", encoding="utf-8-sig") as stream:
+                    result = import_customers(stream, options["database"], batch_size)
+        except (OSError, CustomerImportError) as exc:
+            raise CommandError(str(exc))
+
+        for error in result["errors"]:
+            messages = "; ".join(
+                f"{field}: {' '.join(map(str, errors))}"
+                for field, errors in error["errors"].items()
+            )
+            self.stderr.write(f"Line {error['line']}: {messages}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Read {result['rows']} rows: {result['inserted']} inserted, "
+                f"{result['updated']} updated, {result['unchanged']} unchanged, "
+                f"{result['invalid']} invalid, {result['duplicates']} duplicates."
+            )
+        )
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError  # type: ignore
+from django.db import DEFAULT_DB_ALIAS  # type: ignore
+
+from customers.sync import purge_tombstones
+
+
+class Command(BaseCommand):
+    """
+    Delete tombstones of customers deleted before the retention period.
+
+    Change-feed tokens older than the period are answered with 410 and the
+    client resyncs from scratch, so the purged tombstones are never needed.
+    """
+
+    help = "Purge expired customer tombstones used by the change feed."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            help="Keep tombstones this many days (default: CUSTOMER_SYNC setting).",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database alias to purge (default: default).",
+        )
+
+    def handle(self, *args, **options):
+        days = options["days"]
+        if days is not None and days < 0:
+            raise CommandError("--days must not be negative.")
+        purged = purge_tombstones(options["database"], days)
+        self.stdout.write(self.style.SUCCESS(f"Purged {purged} customer tombstones."))
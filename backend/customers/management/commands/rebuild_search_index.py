@@ -0,0 +1,63 @@
+from django.core.management.base import BaseCommand, CommandError  # type: ignore
+from django.db import DEFAULT_DB_ALIAS  # type: ignore
+
+from customers.search import get_search_backend
+from customers.search.postgres import PostgresSearchBackend
+
+
+class Command(BaseCommand):
+    """
+    Backfill or rebuild the index behind the configured search backend.
+
+    On PostgreSQL rows are recomputed in short id-range batches, each in its
+    own transaction, and only rows whose stored vector differs are written,
+    so the command can run against a live database.
+    """
+
+    help = "Backfill or rebuild the customer search index."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of rows recomputed per transaction (default: 5000).",
+        )
+        parser.add_argument(
+            "--reindex",
+            action="store_true",
+            help="Rebuild the PostgreSQL GIN index with REINDEX CONCURRENTLY.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database alias to rebuild (default: default).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be a positive integer.")
+
+        using = options["database"]
+        backend = get_search_backend(using)
+        if options["reindex"] and not isinstance(backend, PostgresSearchBackend):
+            raise CommandError("--reindex requires the PostgreSQL search backend.")
+
+        updated = backend.rebuild(
+            using,
+            batch_size=batch_size,
+            progress=lambda last_id: self.stdout.write(
+                f"Processed customers up to id {last_id}"
+            ),
+        )
+
+        if options["reindex"]:
+            backend.reindex(using)
+            self.stdout.write("Rebuilt the search_vector GIN index")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{type(backend).__name__}: indexed {updated} customers."
+            )
+        )
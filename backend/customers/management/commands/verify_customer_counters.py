@@ -0,0 +1,75 @@
+from django.core.management.base import BaseCommand, CommandError  # type: ignore
+from django.db import DEFAULT_DB_ALIAS, connections, transaction  # type: ignore
+
+from customers.counters import (
+    count_customers,
+    counters_available,
+    read_counters,
+    reset_counters,
+)
+from customers.stats import invalidate_customer_stats
+
+
+class Command(BaseCommand):
+    """
+    Compare the trigger-maintained customer counters with a full count.
+
+    Exits with an error when they disagree unless ``--fix`` is given, in
+    which case the counters are recomputed while writes are briefly blocked.
+    """
+
+    help = "Verify (and optionally repair) the customer counter table."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Reset the counters from a full count when they disagree.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database alias to verify (default: default).",
+        )
+
+    def handle(self, *args, **options):
+        using = options["database"]
+        if not counters_available(using):
+            raise CommandError(
+                "The customer counter table exists only on PostgreSQL; "
+                "run migrations first."
+            )
+
+        # Both reads share one snapshot, so a write committed between them
+        # is not reported as drift.  The isolation level can only be set by
+        # the first statement of a transaction, so a caller's open
+        # transaction is used as it is.
+        connection = connections[using]
+        outermost = not connection.in_atomic_block
+        with transaction.atomic(using=using):
+            if outermost:
+                with connection.cursor() as cursor:
+                    cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+            counters = read_counters(using)
+            counts = count_customers(using)
+        self.stdout.write(
+            f"Counters: {counters['total']} total, {counters['active']} active"
+        )
+        self.stdout.write(
+            f"Table:    {counts['total']} total, {counts['active']} active"
+        )
+
+        if counters == counts:
+            self.stdout.write(self.style.SUCCESS("Customer counters are accurate."))
+            return
+        if not options["fix"]:
+            raise CommandError("Customer counters have drifted; rerun with --fix.")
+
+        counts = reset_counters(using)
+        invalidate_customer_stats(using)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Reset customer counters to {counts['total']} total, "
+                f"{counts['active']} active."
+            )
+        )
@@ -0,0 +1,77 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:10
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="Customer",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "first_name",
+                    models.CharField(help_text="Customer's first name", max_length=50),
+                ),
+                (
+                    "last_name",
+                    models.CharField(help_text="Customer's last name", max_length=50),
+                ),
+                (
+                    "email",
+                    models.EmailField(
+                        help_text="Customer's email address",
+                        max_length=254,
+                        unique=True,
+                        validators=[django.core.validators.EmailValidator()],
+                    ),
+                ),
+                (
+                    "phone",
+                    models.CharField(
+                        help_text="Customer's phone number",
+                        max_length=15,
+                        validators=[
+                            django.core.validators.RegexValidator(
+                                message="Phone number must be in format: 'XXX-XXXX' or '1234567890'",
+                                regex="^\\d{3}-\\d{4}$|^\\d{10}$|^\\+?1?\\d{9,15}$",
+                            )
+                        ],
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("is_active", models.BooleanField(default=True)),
+            ],
+            options={
+                "verbose_name": "Customer",
+                "verbose_name_plural": "Customers",
+                "db_table": "customers",
+                "ordering": ["last_name", "first_name"],
+                "indexes": [
+                    models.Index(fields=["email"], name="customers_email_92e882_idx"),
+                    models.Index(
+                        fields=["last_name", "first_name"],
+                        name="customers_last_na_89bb5f_idx",
+                    ),
+                    models.Index(
+                        fields=["created_at"], name="customers_created_c63477_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:11
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce({row}first_name, '') || ' ' || "
+    "coalesce({row}last_name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce({row}email, '') || ' ' || "
+    "translate(coalesce({row}email, ''), '@.', '  ')), 'B') || "
+    "setweight(to_tsvector('simple', "
+    "regexp_replace(coalesce({row}phone, ''), '\\D', '', 'g') || ' ' || "
+    "regexp_replace(coalesce({row}phone, ''), '\\D', ' ', 'g')), 'C')"
+)
+
+
+def install_search_trigger(apps, schema_editor):
+    """Create the search_vector trigger and GIN index (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE OR REPLACE FUNCTION customers_search_vector_update() "
+        "RETURNS trigger AS $$ BEGIN NEW.search_vector := "
+        + SEARCH_VECTOR_SQL.format(row="NEW.")
+        + "; RETURN NEW; END $$ LANGUAGE plpgsql"
+    )
+    schema_editor.execute(
+        "CREATE TRIGGER customers_search_vector_trigger "
+        "BEFORE INSERT OR UPDATE OF first_name, last_name, email, phone "
+        "ON customers FOR EACH ROW "
+        "EXECUTE FUNCTION customers_search_vector_update()"
+    )
+    # Existing rows are backfilled by ``manage.py rebuild_search_index`` so
+    # the migration never holds a long lock on a large table.
+    schema_editor.execute(
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS customers_search_vector_gin "
+        "ON customers USING gin (search_vector)"
+    )
+
+
+def remove_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "DROP INDEX CONCURRENTLY IF EXISTS customers_search_vector_gin"
+    )
+    schema_editor.execute(
+        "DROP TRIGGER IF EXISTS customers_search_vector_trigger ON customers"
+    )
+    schema_editor.execute("DROP FUNCTION IF EXISTS customers_search_vector_update()")
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("customers", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customer",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(install_search_trigger, remove_search_trigger),
+    ]
@@ -0,0 +1,47 @@
+from django.db import migrations
+
+PREFIX_FIELDS = ("first_name", "last_name", "email")
+
+
+def create_prefix_indexes(apps, schema_editor):
+    """
+    Create sorted-key indexes on lower(col) for typeahead suggestions.
+
+    PostgreSQL indexes use the "C" collation so prefix ranges and
+    ``ORDER BY`` are both served in byte order.
+    """
+    vendor = schema_editor.connection.vendor
+    for field in PREFIX_FIELDS:
+        if vendor == "postgresql":
+            schema_editor.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS customers_{field}_prefix "
+                f'ON customers ((lower({field})) COLLATE "C")'
+            )
+        elif vendor == "sqlite":
+            schema_editor.execute(
+                f"CREATE INDEX IF NOT EXISTS customers_{field}_prefix "
+                f"ON customers (lower({field}))"
+            )
+
+
+def drop_prefix_indexes(apps, schema_editor):
+    concurrently = (
+        " CONCURRENTLY" if schema_editor.connection.vendor == "postgresql" else ""
+    )
+    for field in PREFIX_FIELDS:
+        schema_editor.execute(
+            f"DROP INDEX{concurrently} IF EXISTS customers_{field}_prefix"
+        )
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("customers", "0003_customer_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_prefix_indexes, drop_prefix_indexes),
+    ]
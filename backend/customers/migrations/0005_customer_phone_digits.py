@@ -0,0 +1,61 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:22
+
+from django.db import migrations, models
+
+PHONE_DIGITS_INDEX = models.Index(
+    fields=["phone_digits"],
+    name="customers_phone_digits_idx",
+    opclasses=["varchar_pattern_ops"],
+)
+
+
+def create_phone_digits_index(apps, schema_editor):
+    """Build the index without blocking writes on PostgreSQL."""
+    Customer = apps.get_model("customers", "Customer")
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.add_index(Customer, PHONE_DIGITS_INDEX, concurrently=True)
+    else:
+        schema_editor.add_index(Customer, PHONE_DIGITS_INDEX)
+
+
+def drop_phone_digits_index(apps, schema_editor):
+    Customer = apps.get_model("customers", "Customer")
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.remove_index(Customer, PHONE_DIGITS_INDEX, concurrently=True)
+    else:
+        schema_editor.remove_index(Customer, PHONE_DIGITS_INDEX)
+
+
+class Migration(migrations.Migration):
+    """
+    Add the normalized phone column.
+
+    Existing rows keep an empty ``phone_digits`` until
+    ``manage.py backfill_phone_digits`` has run.
+    """
+
+    atomic = False
+
+    dependencies = [
+        ("customers", "0004_customer_prefix_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customer",
+            name="phone_digits",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=15
+            ),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name="customer", index=PHONE_DIGITS_INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(
+                    create_phone_digits_index, drop_phone_digits_index
+                ),
+            ],
+        ),
+    ]
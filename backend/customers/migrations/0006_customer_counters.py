@@ -0,0 +1,98 @@
+from django.db import migrations
+
+COUNTER_SHARDS = 16
+
+COUNTER_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION customers_counters_apply() RETURNS trigger AS $$
+DECLARE
+    delta_total bigint := 0;
+    delta_active bigint := 0;
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        UPDATE customers_counters SET total = 0, active = 0;
+        RETURN NULL;
+    ELSIF TG_OP = 'INSERT' THEN
+        SELECT count(*), count(*) FILTER (WHERE is_active)
+        INTO delta_total, delta_active FROM new_rows;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT -count(*), -count(*) FILTER (WHERE is_active)
+        INTO delta_total, delta_active FROM old_rows;
+    ELSE
+        SELECT coalesce(sum(n.is_active::int - o.is_active::int), 0)
+        INTO delta_active
+        FROM new_rows n JOIN old_rows o ON o.id = n.id;
+    END IF;
+    IF delta_total <> 0 OR delta_active <> 0 THEN
+        UPDATE customers_counters
+        SET total = total + delta_total, active = active + delta_active
+        WHERE shard = mod(pg_backend_pid(), {shards});
+    END IF;
+    RETURN NULL;
+END $$ LANGUAGE plpgsql
+""".format(shards=COUNTER_SHARDS)
+
+COUNTER_TRIGGERS = {
+    "customers_counters_insert": "AFTER INSERT ON customers "
+    "REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT",
+    "customers_counters_update": "AFTER UPDATE ON customers "
+    "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT",
+    "customers_counters_delete": "AFTER DELETE ON customers "
+    "REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT",
+    "customers_counters_truncate": "AFTER TRUNCATE ON customers FOR EACH STATEMENT",
+}
+
+
+def install_counters(apps, schema_editor):
+    """
+    Create the sharded counter table and the triggers that maintain it.
+
+    Statement-level triggers read the transition tables, so a bulk insert or
+    update touches one counter row however many customers it writes.  Each
+    connection adds to the shard picked by its backend pid, so concurrent
+    writers rarely wait on the same row.  Writes are blocked while the
+    counters are seeded so none are missed or counted twice.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE TABLE customers_counters ("
+        "shard smallint PRIMARY KEY, "
+        "total bigint NOT NULL DEFAULT 0, "
+        "active bigint NOT NULL DEFAULT 0)"
+    )
+    schema_editor.execute(
+        "INSERT INTO customers_counters (shard) "
+        f"SELECT generate_series(0, {COUNTER_SHARDS - 1})"
+    )
+    schema_editor.execute("LOCK TABLE customers IN SHARE MODE")
+    schema_editor.execute(COUNTER_FUNCTION_SQL)
+    for name, timing in COUNTER_TRIGGERS.items():
+        schema_editor.execute(
+            f"CREATE TRIGGER {name} {timing} "
+            "EXECUTE FUNCTION customers_counters_apply()"
+        )
+    schema_editor.execute(
+        "UPDATE customers_counters SET (total, active) = "
+        "(SELECT count(*), count(*) FILTER (WHERE is_active) FROM customers) "
+        "WHERE shard = 0"
+    )
+
+
+def remove_counters(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in COUNTER_TRIGGERS:
+        schema_editor.execute(f"DROP TRIGGER IF EXISTS {name} ON customers")
+    schema_editor.execute("DROP FUNCTION IF EXISTS customers_counters_apply()")
+    schema_editor.execute("DROP TABLE IF EXISTS customers_counters")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("customers", "0005_customer_phone_digits"),
+    ]
+
+    operations = [
+        migrations.RunPython(install_counters, remove_counters),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("customers", "0006_customer_counters"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customer",
+            name="version",
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+    ]
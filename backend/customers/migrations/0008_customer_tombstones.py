@@ -0,0 +1,74 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:57
+
+import django.utils.timezone
+from django.db import migrations, models
+
+UPDATED_ID_INDEX = models.Index(
+    fields=["updated_at", "id"], name="customers_updated_id_idx"
+)
+
+
+def create_updated_id_index(apps, schema_editor):
+    """Build the index without blocking writes on PostgreSQL."""
+    Customer = apps.get_model("customers", "Customer")
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.add_index(Customer, UPDATED_ID_INDEX, concurrently=True)
+    else:
+        schema_editor.add_index(Customer, UPDATED_ID_INDEX)
+
+
+def drop_updated_id_index(apps, schema_editor):
+    Customer = apps.get_model("customers", "Customer")
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.remove_index(Customer, UPDATED_ID_INDEX, concurrently=True)
+    else:
+        schema_editor.remove_index(Customer, UPDATED_ID_INDEX)
+
+
+class Migration(migrations.Migration):
+    """Add customer tombstones and the change feed's ``(updated_at, id)`` index."""
+
+    atomic = False
+
+    dependencies = [
+        ("customers", "0007_customer_version"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CustomerTombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "customer_id",
+                    models.BigIntegerField(help_text="Id of the deleted customer"),
+                ),
+                ("deleted_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                "db_table": "customer_tombstones",
+            },
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name="customer", index=UPDATED_ID_INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(create_updated_id_index, drop_updated_id_index),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="customertombstone",
+            index=models.Index(
+                fields=["deleted_at", "id"], name="customer_to_deleted_d05e76_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:06
+
+import django.db.models.functions.text
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import migrations, models
+from django.db.models.functions import Upper
+
+FULL_NAME = django.db.models.functions.text.Concat(
+    "first_name", models.Value(" "), "last_name", output_field=models.CharField()
+)
+
+FULL_NAME_INDEX = models.Index(FULL_NAME, "id", name="customers_full_name_id_idx")
+
+# Serves ``full_name__icontains``, which PostgreSQL compiles to
+# ``UPPER(<full name>::text) LIKE UPPER(...)``.
+FULL_NAME_TRIGRAM_INDEX = GinIndex(
+    OpClass(Upper(FULL_NAME), name="gin_trgm_ops"), name="customers_full_name_trgm"
+)
+
+
+def create_full_name_indexes(apps, schema_editor):
+    """
+    Build the ordering index, and on PostgreSQL the trigram index serving
+    ``full_name__icontains``, without blocking writes.
+    """
+    Customer = apps.get_model("customers", "Customer")
+    if schema_editor.connection.vendor != "postgresql":
+        schema_editor.add_index(Customer, FULL_NAME_INDEX)
+        return
+    schema_editor.add_index(Customer, FULL_NAME_INDEX, concurrently=True)
+    schema_editor.add_index(Customer, FULL_NAME_TRIGRAM_INDEX, concurrently=True)
+
+
+def drop_full_name_indexes(apps, schema_editor):
+    Customer = apps.get_model("customers", "Customer")
+    if schema_editor.connection.vendor != "postgresql":
+        schema_editor.remove_index(Customer, FULL_NAME_INDEX)
+        return
+    schema_editor.remove_index(Customer, FULL_NAME_TRIGRAM_INDEX, concurrently=True)
+    schema_editor.remove_index(Customer, FULL_NAME_INDEX, concurrently=True)
+
+
+class Migration(migrations.Migration):
+    """
+    Index the full name as computed by ``Customer.objects``.
+
+    Only expression indexes are added, so the table is not rewritten and
+    writes continue while they build.
+    """
+
+    atomic = False
+
+    dependencies = [
+        ("customers", "0008_customer_tombstones"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name="customer", index=FULL_NAME_INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(create_full_name_indexes, drop_full_name_indexes),
+            ],
+        ),
+    ]
@@ -0,0 +1,83 @@
+from django.db import migrations, models
+
+# The initial schema's ordering indexes, replaced by ones ending in ``id``
+# that serve the keyset pagination in ``customers.pagination``.
+OLD_INDEXES = [
+    models.Index(
+        fields=["last_name", "first_name"], name="customers_last_na_89bb5f_idx"
+    ),
+    models.Index(fields=["created_at"], name="customers_created_c63477_idx"),
+]
+KEYSET_INDEXES = [
+    models.Index(
+        fields=["last_name", "first_name", "id"], name="customers_last_na_406ef2_idx"
+    ),
+    models.Index(fields=["first_name", "id"], name="customers_first_n_d1492f_idx"),
+    models.Index(fields=["created_at", "id"], name="customers_created_7adb58_idx"),
+]
+
+
+def _create(schema_editor, indexes):
+    """
+    Create ``indexes`` unless they exist, without blocking writes on
+    PostgreSQL.  Databases migrated with an earlier revision of 0001 already
+    have the keyset indexes, so both directions tolerate either state.
+    """
+    quote = schema_editor.quote_name
+    concurrently = (
+        "CONCURRENTLY " if schema_editor.connection.vendor == "postgresql" else ""
+    )
+    for index in indexes:
+        columns = ", ".join(quote(field) for field in index.fields)
+        schema_editor.execute(
+            f"CREATE INDEX {concurrently}IF NOT EXISTS {quote(index.name)} "
+            f"ON {quote('customers')} ({columns})"
+        )
+
+
+def _drop(schema_editor, indexes):
+    concurrently = (
+        "CONCURRENTLY " if schema_editor.connection.vendor == "postgresql" else ""
+    )
+    for index in indexes:
+        schema_editor.execute(
+            f"DROP INDEX {concurrently}IF EXISTS {schema_editor.quote_name(index.name)}"
+        )
+
+
+def add_keyset_indexes(apps, schema_editor):
+    _create(schema_editor, KEYSET_INDEXES)
+    _drop(schema_editor, OLD_INDEXES)
+
+
+def remove_keyset_indexes(apps, schema_editor):
+    _create(schema_editor, OLD_INDEXES)
+    _drop(schema_editor, KEYSET_INDEXES)
+
+
+class Migration(migrations.Migration):
+    """Replace the initial ordering indexes with the keyset pagination ones."""
+
+    atomic = False
+
+    dependencies = [
+        ("customers", "0009_customer_full_name"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                *(
+                    migrations.RemoveIndex(model_name="customer", name=index.name)
+                    for index in OLD_INDEXES
+                ),
+                *(
+                    migrations.AddIndex(model_name="customer", index=index)
+                    for index in KEYSET_INDEXES
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(add_keyset_indexes, remove_keyset_indexes),
+            ],
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:19
+
+from django.db import migrations
+
+# The phone column is indexed as typed plus its digits.
+PHONE_DIGITS_SQL = (
+    "replace(replace(replace(replace(replace(replace({row}phone, '-', ''), "
+    "' ', ''), '+', ''), '(', ''), ')', ''), '.', '')"
+)
+ROW_SQL = (
+    "{row}id, {row}first_name, {row}last_name, {row}email, "
+    "{row}phone || ' ' || " + PHONE_DIGITS_SQL
+)
+INSERT_SQL = (
+    "INSERT INTO customers_fts(rowid, first_name, last_name, email, phone) "
+    "VALUES (" + ROW_SQL + ")"
+)
+
+
+def install_fts_index(apps, schema_editor):
+    """Create and fill the FTS5 search table and its triggers (SQLite only)."""
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS customers_fts USING fts5("
+        "first_name, last_name, email, phone, "
+        "tokenize = 'unicode61 remove_diacritics 0')"
+    )
+    schema_editor.execute(
+        "CREATE TRIGGER IF NOT EXISTS customers_fts_insert "
+        "AFTER INSERT ON customers BEGIN "
+        + INSERT_SQL.format(row="new.")
+        + "; END"
+    )
+    schema_editor.execute(
+        "CREATE TRIGGER IF NOT EXISTS customers_fts_update "
+        "AFTER UPDATE ON customers BEGIN "
+        "DELETE FROM customers_fts WHERE rowid = old.id; "
+        + INSERT_SQL.format(row="new.")
+        + "; END"
+    )
+    schema_editor.execute(
+        "CREATE TRIGGER IF NOT EXISTS customers_fts_delete "
+        "AFTER DELETE ON customers BEGIN "
+        "DELETE FROM customers_fts WHERE rowid = old.id; END"
+    )
+    # Replace whatever an earlier lazily created table held.
+    schema_editor.execute("DELETE FROM customers_fts")
+    schema_editor.execute(
+        "INSERT INTO customers_fts(rowid, first_name, last_name, email, phone) "
+        "SELECT " + ROW_SQL.format(row="") + " FROM customers"
+    )
+
+
+def remove_fts_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    for trigger in ("insert", "update", "delete"):
+        schema_editor.execute(f"DROP TRIGGER IF EXISTS customers_fts_{trigger}")
+    schema_editor.execute("DROP TABLE IF EXISTS customers_fts")
+
+
+class Migration(migrations.Migration):
+    """Add the FTS5 table behind the SQLite search backend."""
+
+    dependencies = [
+        ("customers", "0010_customer_keyset_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(install_fts_index, remove_fts_index),
+    ]
@@ -0,0 +1,98 @@
+from django.db import migrations
+
+COUNTER_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION customers_counters_apply() RETURNS trigger AS $$
+DECLARE
+    delta_total bigint := 0;
+    delta_active bigint := 0;
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        UPDATE customers_counters
+        SET total = 0, active = 0, changes = changes + 1;
+        RETURN NULL;
+    ELSIF TG_OP = 'INSERT' THEN
+        SELECT count(*), count(*) FILTER (WHERE is_active)
+        INTO delta_total, delta_active FROM new_rows;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT -count(*), -count(*) FILTER (WHERE is_active)
+        INTO delta_total, delta_active FROM old_rows;
+    ELSE
+        SELECT coalesce(sum(n.is_active::int - o.is_active::int), 0)
+        INTO delta_active
+        FROM new_rows n JOIN old_rows o ON o.id = n.id;
+    END IF;
+    UPDATE customers_counters
+    SET total = total + delta_total,
+        active = active + delta_active,
+        changes = changes + 1
+    WHERE shard = mod(pg_backend_pid(), {shards});
+    RETURN NULL;
+END $$ LANGUAGE plpgsql
+"""
+
+# The function as created by 0006, restored on reversal.
+PREVIOUS_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION customers_counters_apply() RETURNS trigger AS $$
+DECLARE
+    delta_total bigint := 0;
+    delta_active bigint := 0;
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        UPDATE customers_counters SET total = 0, active = 0;
+        RETURN NULL;
+    ELSIF TG_OP = 'INSERT' THEN
+        SELECT count(*), count(*) FILTER (WHERE is_active)
+        INTO delta_total, delta_active FROM new_rows;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT -count(*), -count(*) FILTER (WHERE is_active)
+        INTO delta_total, delta_active FROM old_rows;
+    ELSE
+        SELECT coalesce(sum(n.is_active::int - o.is_active::int), 0)
+        INTO delta_active
+        FROM new_rows n JOIN old_rows o ON o.id = n.id;
+    END IF;
+    IF delta_total <> 0 OR delta_active <> 0 THEN
+        UPDATE customers_counters
+        SET total = total + delta_total, active = active + delta_active
+        WHERE shard = mod(pg_backend_pid(), {shards});
+    END IF;
+    RETURN NULL;
+END $$ LANGUAGE plpgsql
+"""
+
+COUNTER_SHARDS = 16
+
+
+def add_change_counter(apps, schema_editor):
+    """
+    Count write statements on ``customers`` in the counter shards.
+
+    The sum of ``changes`` is the collection version of ``customers.cache``:
+    it moves with every committed write, however it was made, and every
+    worker process reads the same value.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "ALTER TABLE customers_counters "
+        "ADD COLUMN IF NOT EXISTS changes bigint NOT NULL DEFAULT 0"
+    )
+    schema_editor.execute(COUNTER_FUNCTION_SQL.format(shards=COUNTER_SHARDS))
+
+
+def remove_change_counter(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(PREVIOUS_FUNCTION_SQL.format(shards=COUNTER_SHARDS))
+    schema_editor.execute("ALTER TABLE customers_counters DROP COLUMN changes")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("customers", "0011_customer_fts"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_change_counter, remove_change_counter),
+    ]
@@ -1,7 +1,223 @@
+from django.contrib.postgres.search import SearchVectorField  # type: ignore
 from django.core.validators import EmailValidator, RegexValidator  # type: ignore
-from django.db import models  # type: ignore
+from django.db import connections, models, transaction  # type: ignore
+from django.db.models import F, Value  # type: ignore
+from django.db.models.functions import Concat  # type: ignore
+from django.utils import timezone  # type: ignore
 from django.utils.html import escape  # type: ignore
 
+from .cache import collection_changed
+from .exceptions import StaleCustomerError
+from .phone import normalize_phone
+from .stats import adjust_customer_stats, invalidate_customer_stats
+from .validation import FIELDS as VALIDATED_FIELDS
+from .validation import clean_fields
+
+# Columns read back by ``CustomerQuerySet.set_active``.
+ACTIVE_COLUMNS = ("id", "first_name", "last_name", "is_active", "version")
+
+# ``Customer.full_name`` as computed by the database, so it can be sorted
+# and searched there.  ``Customer.objects`` aliases it on every queryset;
+# it is selected only when asked for, e.g. with
+# ``annotate(full_name=F("full_name"))``.  Expression indexes serve the
+# ordering and the trigram search, so nothing is stored.
+FULL_NAME = Concat(
+    "first_name", Value(" "), "last_name", output_field=models.CharField()
+)
+
+# Derived columns no client sees; writing only these keeps the version.
+UNVERSIONED_FIELDS = frozenset({"phone_digits", "search_vector"})
+
+
+def _can_update_returning(connection):
+    return connection.vendor in ("postgresql", "sqlite") and (
+        connection.features.can_return_columns_from_insert
+    )
+
+
+class CustomerQuerySet(models.QuerySet):
+    """
+    QuerySet that keeps derived data in sync on bulk writes.
+
+    ``bulk_create``, ``bulk_update`` and ``update`` bypass ``Customer.save``
+    and its signals, so each recomputes the normalized phone column itself,
+    bumps the version of the rows it changes unless only
+    ``UNVERSIONED_FIELDS`` are written, and invalidates the cached
+    collection data and statistics.
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        for obj in objs:
+            obj.phone_digits = normalize_phone(obj.phone)
+        update_fields = kwargs.get("update_fields")
+        if update_fields and "phone" in update_fields:
+            kwargs["update_fields"] = [*update_fields, "phone_digits"]
+        created = super().bulk_create(objs, *args, **kwargs)
+        collection_changed(self.db)
+        if kwargs.get("ignore_conflicts") or kwargs.get("update_conflicts"):
+            invalidate_customer_stats(self.db)
+        else:
+            adjust_customer_stats(
+                total=len(objs),
+                active=sum(1 for obj in objs if obj.is_active),
+                using=self.db,
+            )
+        return created
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        fields = list(fields)
+        if not set(fields) <= UNVERSIONED_FIELDS:
+            fields.append("version")
+            for obj in objs:
+                obj.version += 1
+        if "phone" in fields and "phone_digits" not in fields:
+            for obj in objs:
+                obj.phone_digits = normalize_phone(obj.phone)
+            fields.append("phone_digits")
+        updated = super().bulk_update(objs, fields, *args, **kwargs)
+        collection_changed(self.db)
+        if "is_active" in fields:
+            invalidate_customer_stats(self.db)
+        return updated
+
+    def update(self, **kwargs):
+        if isinstance(kwargs.get("phone"), str):
+            kwargs.setdefault("phone_digits", normalize_phone(kwargs["phone"]))
+        if not set(kwargs) <= UNVERSIONED_FIELDS:
+            kwargs.setdefault("version", F("version") + 1)
+        updated = super().update(**kwargs)
+        collection_changed(self.db)
+        if "is_active" in kwargs:
+            invalidate_customer_stats(self.db)
+        return updated
+
+    def bulk_set_active(self, is_active, batch_size=1000):
+        """
+        Set ``is_active`` on every customer in this queryset, in id batches.
+
+        Each batch is one ``UPDATE ... WHERE id IN (...) AND is_active <> x``
+        in its own short transaction, so rows already in the target state
+        are not rewritten and no lock is held for the whole run.  The cached
+        stats are adjusted by the number of rows each batch changed.
+        Returns the number of customers changed.
+        """
+        candidates = self.filter(is_active=not is_active).order_by("id")
+        last_id = 0
+        affected = 0
+        while True:
+            ids = list(
+                candidates.filter(id__gt=last_id).values_list("id", flat=True)[
+                    :batch_size
+                ]
+            )
+            if not ids:
+                return affected
+            with transaction.atomic(using=self.db):
+                batch = self.model._default_manager.using(self.db).filter(
+                    id__in=ids, is_active=not is_active
+                )
+                changed = super(CustomerQuerySet, batch).update(
+                    is_active=is_active,
+                    updated_at=timezone.now(),
+                    version=F("version") + 1,
+                )
+                if changed:
+                    collection_changed(self.db)
+                    adjust_customer_stats(
+                        active=changed if is_active else -changed, using=self.db
+                    )
+            affected += changed
+            last_id = ids[-1]
+
+    def set_active(self, pk, is_active, versions=None):
+        """
+        Set one customer's ``is_active`` with a single conditional UPDATE.
+
+        Only ``is_active``, ``updated_at`` and ``version`` are written, and
+        only when the status actually changes and, if ``versions`` is given,
+        the row is at one of those versions.  ``Customer.clean`` is skipped
+        since none of the validated fields change.  Where the database
+        supports ``UPDATE ... RETURNING`` (PostgreSQL, SQLite 3.35+) the
+        changed row comes back from the same statement.
+
+        Returns ``(row, changed)`` with ``row`` a dict of ``ACTIVE_COLUMNS``
+        plus ``updated_at``, or ``(None, False)`` when there is no such
+        customer.  Raises ``StaleCustomerError`` when the row is at another
+        version.
+        """
+        connection = connections[self.db]
+        table = connection.ops.quote_name(self.model._meta.db_table)
+        now = timezone.now()
+        columns = ", ".join(connection.ops.quote_name(c) for c in ACTIVE_COLUMNS)
+
+        sql = (
+            f"UPDATE {table} SET is_active = %s, updated_at = %s, "
+            "version = version + 1 WHERE id = %s AND is_active <> %s"
+        )
+        params = [
+            is_active,
+            connection.ops.adapt_datetimefield_value(now),
+            pk,
+            is_active,
+        ]
+        if versions is not None:
+            sql += f" AND version IN ({', '.join(['%s'] * len(versions))})"
+            params.extend(versions)
+
+        with connection.cursor() as cursor:
+            if _can_update_returning(connection):
+                cursor.execute(f"{sql} RETURNING {columns}", params)
+                returned = cursor.fetchone()
+                row = dict(zip(ACTIVE_COLUMNS, returned)) if returned else None
+            else:
+                cursor.execute(sql, params)
+                row = None
+                if cursor.rowcount:
+                    row = self.filter(pk=pk).values(*ACTIVE_COLUMNS).first()
+
+        if row is not None:
+            row["is_active"] = bool(row["is_active"])
+            row["updated_at"] = now
+            collection_changed(self.db)
+            adjust_customer_stats(active=1 if is_active else -1, using=self.db)
+            return row, True
+
+        row = self.filter(pk=pk).values(*ACTIVE_COLUMNS, "updated_at").first()
+        if row is None:
+            return None, False
+        if versions is not None and row["version"] not in versions:
+            raise StaleCustomerError(f"Customer {pk} is at version {row['version']}.")
+        return row, False
+
+    def lock_at_version(self, pk, versions):
+        """
+        Lock one customer's row for the rest of the transaction, provided it
+        is at one of ``versions``.
+
+        The lock is taken by a conditional ``UPDATE`` that changes nothing,
+        so a concurrent writer is waited for and the version rechecked after
+        it commits; a following ``save`` then writes on top of exactly the
+        version the client read.  Returns whether the customer exists and
+        raises ``StaleCustomerError`` when it is at another version.
+        """
+        row = self.filter(pk=pk, version__in=versions)
+        matched = super(CustomerQuerySet, row).update(version=F("version"))
+        if matched:
+            return True
+        version = self.filter(pk=pk).values_list("version", flat=True).first()
+        if version is None:
+            return False
+        raise StaleCustomerError(f"Customer {pk} is at version {version}.")
+
+
+class CustomerManager(models.Manager.from_queryset(CustomerQuerySet)):
+    """Manager whose querysets can filter and order on ``full_name``."""
+
+    def get_queryset(self):
+        return super().get_queryset().alias(full_name=FULL_NAME)
+
 
 class Customer(models.Model):
     """Customer model based on the sample CSV data structure."""
@@ -25,80 +241,120 @@ class Customer(models.Model):
         help_text="Customer's phone number",
     )
 
+    # ``phone`` reduced to normalized digits for exact and prefix lookups;
+    # see customers.phone.
+    phone_digits = models.CharField(
+        max_length=15, blank=True, default="", editable=False
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_active = models.BooleanField(default=True)
 
+    # Incremented by every write.  Writes sent with ``If-Match`` only apply
+    # at the version the client read; see ``lock_at_version``.
+    version = models.PositiveIntegerField(default=1, editable=False)
+
+    # Maintained by a database trigger on PostgreSQL; see customers.search.
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = CustomerManager()
+
+    # ``is_active`` as last read from or written to the database, so the
+    # signal handlers can tell activations apart from other saves.
+    _stored_is_active = None
+
     class Meta:
         db_table = "customers"
         verbose_name = "Customer"
         verbose_name_plural = "Customers"
         ordering = ["last_name", "first_name"]
+        # Composite indexes ending in ``id`` back the keyset pagination in
+        # ``customers.pagination`` for each of the viewset's ordering fields.
         indexes = [
             models.Index(fields=["email"]),
-            models.Index(fields=["last_name", "first_name"]),
-            models.Index(fields=["created_at"]),
+            models.Index(fields=["last_name", "first_name", "id"]),
+            models.Index(fields=["first_name", "id"]),
+            models.Index(FULL_NAME, "id", name="customers_full_name_id_idx"),
+            models.Index(fields=["created_at", "id"]),
+            # Keyset order of the change feed in ``customers.sync``.
+            models.Index(fields=["updated_at", "id"], name="customers_updated_id_idx"),
+            # The pattern opclass lets PostgreSQL serve ``LIKE 'digits%'``
+            # from the index whatever the database collation.
+            models.Index(
+                fields=["phone_digits"],
+                name="customers_phone_digits_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
         ]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._stored_is_active = instance.__dict__.get("is_active")
+        return instance
+
     def __str__(self):
         return escape(f"{self.first_name} {self.last_name} ({self.email})")
 
     @property
     def full_name(self):
-        """Returns the customer's full name."""
-        return escape(f"{self.first_name} {self.last_name}")
+        """Returns the customer's raw full name, as ``FULL_NAME`` does."""
+        return f"{self.first_name} {self.last_name}"
 
     def clean(self):
-        """Custom validation for the model with security checks."""
-        import re
-        from django.core.exceptions import ValidationError
-        
-        # Security patterns to detect potential XSS/injection attempts
-        dangerous_patterns = re.compile(
-            r'<script|<iframe|<object|<embed|javascript:|data:|on\w+='
-            r'|<\s*\/?\s*(script|iframe|object|embed|svg|img)',
-            re.IGNORECASE
+        """Normalize the fields and reject markup; see customers.validation."""
+        self.first_name, self.last_name, self.email, self.phone = clean_fields(
+            self.first_name, self.last_name, self.email, self.phone
         )
-        
-        # Validate and clean first name
-        if self.first_name:
-            self.first_name = self.first_name.strip()
-            if dangerous_patterns.search(self.first_name):
-                raise ValidationError({'first_name': 'First name contains invalid characters.'})
-            if len(self.first_name) > 50:
-                raise ValidationError({'first_name': 'First name is too long.'})
-            if not re.match(r'^[a-zA-Z\s\-\'\.]+$', self.first_name):
-                raise ValidationError({'first_name': 'First name contains invalid characters.'})
-            self.first_name = self.first_name.title()
-            
-        # Validate and clean last name
-        if self.last_name:
-            self.last_name = self.last_name.strip()
-            if dangerous_patterns.search(self.last_name):
-                raise ValidationError({'last_name': 'Last name contains invalid characters.'})
-            if len(self.last_name) > 50:
-                raise ValidationError({'last_name': 'Last name is too long.'})
-            if not re.match(r'^[a-zA-Z\s\-\'\.]+$', self.last_name):
-                raise ValidationError({'last_name': 'Last name contains invalid characters.'})
-            self.last_name = self.last_name.title()
-
-        # Validate and clean email
-        if self.email:
-            self.email = self.email.lower().strip()
-            if dangerous_patterns.search(self.email):
-                raise ValidationError({'email': 'Email contains invalid characters.'})
-            if len(self.email) > 254:  # RFC5321 limit
-                raise ValidationError({'email': 'Email is too long.'})
-                
-        # Validate phone
-        if self.phone:
-            self.phone = self.phone.strip()
-            if dangerous_patterns.search(self.phone):
-                raise ValidationError({'phone': 'Phone number contains invalid characters.'})
-            if len(self.phone) > 15:
-                raise ValidationError({'phone': 'Phone number is too long.'})
 
     def save(self, *args, **kwargs):
-        """Override save to call clean method."""
-        self.clean()
-        super().save(*args, **kwargs)
+        """
+        Override save to call clean method.
+
+        Saves of an existing customer bump its version in SQL, with
+        ``version = version + 1``, unless only ``UNVERSIONED_FIELDS`` are
+        written, and read the new value back.
+        """
+        update_fields = kwargs.get("update_fields")
+        # Saves that write none of the validated fields skip the checks.
+        if update_fields is None or set(VALIDATED_FIELDS) & set(update_fields):
+            self.clean()
+        self.phone_digits = normalize_phone(self.phone)
+        versioned = update_fields is None or bool(
+            set(update_fields) - UNVERSIONED_FIELDS
+        )
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            if versioned:
+                update_fields.add("version")
+            if "phone" in update_fields:
+                update_fields.add("phone_digits")
+            kwargs["update_fields"] = update_fields
+
+        if self._state.adding or not versioned:
+            super().save(*args, **kwargs)
+            return
+
+        version = self.version
+        self.version = F("version") + 1
+        try:
+            super().save(*args, **kwargs)
+        except BaseException:
+            self.version = version
+            raise
+        self.refresh_from_db(fields=["version"])
+
+
+class CustomerTombstone(models.Model):
+    """Record of a deleted customer, served by the change feed in customers.sync."""
+
+    customer_id = models.BigIntegerField(help_text="Id of the deleted customer")
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = "customer_tombstones"
+        indexes = [models.Index(fields=["deleted_at", "id"])]
+
+    def __str__(self):
+        return f"Customer {self.customer_id} deleted at {self.deleted_at}"
@@ -0,0 +1,318 @@
+import base64
+import binascii
+import datetime
+import json
+
+from django.conf import settings  # type: ignore
+from django.core.cache import cache  # type: ignore
+from django.core.exceptions import EmptyResultSet, FieldDoesNotExist  # type: ignore
+from django.core.exceptions import ValidationError as DjangoValidationError  # type: ignore  # noqa: E501
+from django.core.paginator import Paginator  # type: ignore
+from django.db import connections  # type: ignore
+from django.db.models import Q, QuerySet  # type: ignore
+from django.utils.functional import cached_property  # type: ignore
+from rest_framework.exceptions import NotFound  # type: ignore
+from rest_framework.pagination import PageNumberPagination  # type: ignore
+from rest_framework.response import Response  # type: ignore
+from rest_framework.utils.urls import (  # type: ignore
+    remove_query_param,
+    replace_query_param,
+)
+
+from .cache import versioned_key
+from .filters import CustomerOrderingFilter
+
+
+def get_list_setting(name, default):
+    """Return a ``CUSTOMER_LIST`` setting, falling back to ``default``."""
+    return getattr(settings, "CUSTOMER_LIST", {}).get(name, default)
+
+
+def estimate_count(queryset):
+    """
+    Return the PostgreSQL planner's row estimate for ``queryset``.
+
+    An unfiltered queryset reads ``pg_class.reltuples``; anything else uses
+    the top-level row estimate of its ``EXPLAIN`` plan.  Returns ``None`` on
+    other databases and for tables that have never been analyzed.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+
+    if not queryset.query.where:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        return row[0] if row and row[0] >= 0 else None
+
+    plan = json.loads(queryset.explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class CustomerPaginator(Paginator):
+    """
+    Paginator that avoids a ``COUNT(*)`` per page.
+
+    Counts are cached per normalized filter set: the cache key hashes the SQL
+    and parameters of the unordered queryset under the collection version,
+    so equivalent query strings share an entry and any write to the table
+    invalidates it.  On a miss, when the planner expects at least
+    ``CUSTOMER_LIST["COUNT_ESTIMATE_THRESHOLD"]`` rows its estimate is used
+    instead of counting, and ``count_exact`` is set to ``False``.  Pages past
+    an underestimated count are not reachable by number; clients that need
+    to walk everything should use the cursor mode.
+    """
+
+    count_exact = True
+
+    def __init__(self, *args, collection_version=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.collection_version = collection_version
+
+    @cached_property
+    def count(self):
+        if not isinstance(self.object_list, QuerySet):
+            return len(self.object_list)
+
+        queryset = self.object_list.order_by()
+        try:
+            sql, params = queryset.query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+
+        key = versioned_key(
+            "count",
+            sql,
+            params,
+            using=queryset.db,
+            version=self.collection_version,
+        )
+        cached = cache.get(key)
+        if cached is None:
+            cached = self.compute_count(queryset)
+            cache.set(key, cached, get_list_setting("COUNT_CACHE_TIMEOUT", 300))
+        count, self.count_exact = cached
+        return count
+
+    def compute_count(self, queryset):
+        """Return ``(count, exact)`` for ``queryset``."""
+        threshold = get_list_setting("COUNT_ESTIMATE_THRESHOLD", 100000)
+        if threshold is not None:
+            estimate = estimate_count(queryset)
+            if estimate is not None and estimate >= threshold:
+                return estimate, False
+        return queryset.count(), True
+
+
+class CustomerPagination(PageNumberPagination):
+    """
+    Page-number pagination with an opt-in keyset (cursor) mode.
+
+    Requests without a ``cursor`` query parameter keep the classic
+    ``?page=N`` behaviour. Passing ``?cursor=`` (empty for the first page)
+    switches to seek-based paging: each page is fetched with a
+    ``WHERE (ordering..., id) > (last row)`` predicate instead of an
+    ``OFFSET``, and no ``COUNT(*)`` is issued, so every page costs the same
+    regardless of depth.
+
+    Page-number responses take their ``count`` from ``CustomerPaginator``
+    and say whether it is exact in ``count_exact``.
+    """
+
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+    keyset = False
+    # Set by the view when it has already read the collection version.
+    collection_version = None
+
+    def django_paginator_class(self, object_list, per_page):
+        return CustomerPaginator(
+            object_list, per_page, collection_version=self.collection_version
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param not in request.query_params:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.keyset = True
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_keyset_ordering(request, queryset, view)
+
+        position, self.reverse = self.decode_cursor(request, queryset)
+        ordering = self.ordering
+        if self.reverse:
+            ordering = [_flip(field) for field in ordering]
+
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(seek_filter(ordering, position))
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+        if self.reverse:
+            results.reverse()
+
+        if self.reverse:
+            self.has_next = position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+
+        self.first_row = results[0] if results else None
+        self.last_row = results[-1] if results else None
+        return results
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return Response(
+                {
+                    "count": self.page.paginator.count,
+                    "count_exact": self.page.paginator.count_exact,
+                    "next": self.get_next_link(),
+                    "previous": self.get_previous_link(),
+                    "results": data,
+                }
+            )
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count_exact"] = {
+            "type": "boolean",
+            "example": True,
+        }
+        return response_schema
+
+    def get_next_link(self):
+        if not self.keyset:
+            return super().get_next_link()
+        if not self.has_next or self.last_row is None:
+            return None
+        return self.encode_cursor(self.last_row, reverse=False)
+
+    def get_previous_link(self):
+        if not self.keyset:
+            return super().get_previous_link()
+        if not self.has_previous or self.first_row is None:
+            return None
+        return self.encode_cursor(self.first_row, reverse=True)
+
+    def get_keyset_ordering(self, request, queryset, view):
+        """
+        Resolve the ordering the same way ``CustomerOrderingFilter`` does and
+        append ``id`` as a tiebreaker so every row has a unique position.
+        """
+        ordering = list(CustomerOrderingFilter().get_ordering(request, queryset, view))
+        if not ordering:
+            ordering = ["id"]
+        if not any(field.lstrip("-") in ("id", "pk") for field in ordering):
+            ordering.append("-id" if ordering[-1].startswith("-") else "id")
+        return ordering
+
+    def encode_cursor(self, row, reverse):
+        position = [
+            _encode_value(getattr(row, field.lstrip("-"))) for field in self.ordering
+        ]
+        payload = {"o": ",".join(self.ordering), "p": position}
+        if reverse:
+            payload["r"] = 1
+        data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        cursor = base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request, queryset):
+        """
+        Return ``(position, reverse)`` for the requested cursor.
+
+        Position values are converted by the fields they order on, so a
+        tampered cursor is rejected like any other invalid one.
+        """
+        encoded = request.query_params.get(self.cursor_query_param, "")
+        if not encoded:
+            return None, False
+
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            ordering = payload["o"]
+            position = payload["p"]
+            reverse = bool(payload.get("r", 0))
+        except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError):
+            raise NotFound(self.invalid_cursor_message)
+
+        # A cursor is only meaningful for the ordering it was issued under.
+        if ordering != ",".join(self.ordering) or not isinstance(position, list):
+            raise NotFound(self.invalid_cursor_message)
+        if len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        try:
+            position = [
+                _to_python(queryset, field.lstrip("-"), value)
+                for field, value in zip(self.ordering, position)
+            ]
+        except (DjangoValidationError, FieldDoesNotExist, ValueError, TypeError):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+
+def _flip(field):
+    return field[1:] if field.startswith("-") else f"-{field}"
+
+
+def _to_python(queryset, name, value):
+    if value is None:
+        raise ValueError("Cursor positions cannot be null.")
+    annotation = queryset.query.annotations.get(name)
+    if annotation is not None:
+        field = annotation.output_field
+    elif name == "pk":
+        field = queryset.model._meta.pk
+    else:
+        field = queryset.model._meta.get_field(name)
+    return field.to_python(value)
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    return value
+
+
+def seek_filter(ordering, position):
+    """
+    Build the predicate selecting rows strictly after ``position``.
+
+    For ``(a, b, id)`` this produces
+    ``a >= x AND (a > x OR (a = x AND (b > y OR (b = y AND id > z))))``;
+    the leading range condition lets the composite index drive the scan and
+    the nested form handles mixed ascending/descending orderings.
+    """
+    fields = [(field.lstrip("-"), field.startswith("-")) for field in ordering]
+
+    condition = None
+    for (name, descending), value in reversed(list(zip(fields, position))):
+        after = Q(**{f"{name}__{'lt' if descending else 'gt'}": value})
+        if condition is None:
+            condition = after
+        else:
+            condition = after | (Q(**{name: value}) & condition)
+
+    name, descending = fields[0]
+    leading = Q(**{f"{name}__{'lte' if descending else 'gte'}": position[0]})
+    return leading & condition
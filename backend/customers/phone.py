@@ -0,0 +1,53 @@
+"""
+Phone number normalization.
+
+``Customer.phone`` accepts several formats ("555-1234", "5551234567",
+"+15551234567"), so lookups go through the ``phone_digits`` shadow column
+instead: the number reduced to its digits, E.164-style without the ``+``.
+Ten-digit numbers are taken to be North American and get the ``1`` country
+code, so "5551234567" and "+1 555 123 4567" normalize alike.  Seven-digit
+local numbers are kept as they are.
+"""
+
+import re
+
+from django.db.models import Q  # type: ignore
+
+_NON_DIGIT_RE = re.compile(r"\D")
+
+NANP_COUNTRY_CODE = "1"
+
+
+def phone_digits(value):
+    """Return the digits of ``value`` without any normalization."""
+    return _NON_DIGIT_RE.sub("", value or "")
+
+
+def normalize_phone(value):
+    """Return the normalized digits stored in ``Customer.phone_digits``."""
+    digits = phone_digits(value)
+    if len(digits) == 10:
+        digits = NANP_COUNTRY_CODE + digits
+    return digits
+
+
+def phone_filter(value, prefix=False):
+    """
+    Return a ``Q`` matching customers by phone number.
+
+    Exact lookups compare normalized numbers.  Prefix lookups match the
+    digits typed so far, with or without the country code, so "555123"
+    finds "5551234567"; both branches are range scans on the
+    ``phone_digits`` index.  A value without digits matches nothing.
+    """
+    if not prefix:
+        digits = normalize_phone(value)
+        return Q(phone_digits=digits) if digits else Q(pk__in=[])
+
+    digits = phone_digits(value)
+    if not digits:
+        return Q(pk__in=[])
+    condition = Q(phone_digits__startswith=digits)
+    if len(digits) < 11:
+        condition |= Q(phone_digits__startswith=NANP_COUNTRY_CODE + digits)
+    return condition
@@ -0,0 +1,46 @@
+"""
+Customer search.
+
+``search_customers`` filters a ``Customer`` queryset through the configured
+search backend.  ``CUSTOMER_SEARCH["BACKEND"]`` names the backend class by
+dotted path; when it is unset the backend is chosen from the database
+vendor: PostgreSQL full-text/trigram search, SQLite FTS5, or the in-memory
+inverted index for anything else.
+"""
+
+from django.conf import settings  # type: ignore
+from django.db import connections  # type: ignore
+from django.utils.module_loading import import_string  # type: ignore
+
+from .base import SEARCH_MODES, BaseSearchBackend
+
+__all__ = [
+    "SEARCH_MODES",
+    "BaseSearchBackend",
+    "get_search_backend",
+    "search_customers",
+]
+
+VENDOR_BACKENDS = {
+    "postgresql": "customers.search.postgres.PostgresSearchBackend",
+    "sqlite": "customers.search.sqlite.SQLiteSearchBackend",
+}
+DEFAULT_BACKEND = "customers.search.memory.InMemorySearchBackend"
+
+_backends: dict = {}
+
+
+def get_search_backend(using="default"):
+    """Return the shared search backend instance for a database alias."""
+    path = getattr(settings, "CUSTOMER_SEARCH", {}).get("BACKEND")
+    if not path:
+        path = VENDOR_BACKENDS.get(connections[using].vendor, DEFAULT_BACKEND)
+    backend = _backends.get(path)
+    if backend is None:
+        backend = _backends[path] = import_string(path)()
+    return backend
+
+
+def search_customers(queryset, term, mode="fulltext"):
+    """Filter ``queryset`` to customers matching ``term``."""
+    return get_search_backend(queryset.db).search(queryset, term, mode)
@@ -0,0 +1,95 @@
+import re
+
+from django.db.models import Q  # type: ignore
+
+from ..phone import phone_filter
+from .query import PHONE, parse_query, tokenize
+
+SEARCH_MODES = ("fulltext", "substring", "fuzzy")
+
+# Relative weight of a match in each column.  Every backend ranks a customer
+# whose name matches above one whose email matches above one whose phone
+# matches; PostgreSQL expresses these as tsvector weights A, B and C.
+FIELD_WEIGHTS = {
+    "first_name": 1.0,
+    "last_name": 1.0,
+    "email": 0.4,
+    "phone": 0.2,
+}
+
+_NON_DIGIT_RE = re.compile(r"\D")
+
+
+def document_tokens(field, value):
+    """
+    Return the words indexed for ``value`` stored in ``field``.
+
+    Phone numbers are indexed both as digit groups and as a single run of
+    digits so ``555`` and ``5551234`` both match ``555-1234``.
+    """
+    if not value:
+        return []
+    words = tokenize(value)
+    if field == "phone":
+        digits = _NON_DIGIT_RE.sub("", value)
+        if digits and digits not in words:
+            words.append(digits)
+    return words
+
+
+class BaseSearchBackend:
+    """
+    Interface for customer search engines.
+
+    ``search`` filters a ``Customer`` queryset to the rows matching a query
+    and annotates each with ``search_rank`` (higher is more relevant).  In
+    ``fulltext`` mode every backend applies the same semantics: the query is
+    split by ``parse_query``, each word of each token must be a prefix of a
+    word indexed in one of the columns the token is routed to, and matches
+    are weighted by ``FIELD_WEIGHTS``.  Backends that have no trigram
+    support serve ``substring`` with ``icontains`` and ``fuzzy`` with
+    ``fulltext``.
+    """
+
+    def search(self, queryset, term, mode="fulltext"):
+        if mode == "substring":
+            return self.substring(queryset, term)
+        if mode == "fuzzy":
+            return self.fuzzy(queryset, term)
+        return self.fulltext(queryset, term)
+
+    def fulltext(self, queryset, term):
+        raise NotImplementedError
+
+    def substring(self, queryset, term):
+        """
+        Every token must occur inside one of the columns it is routed to.
+
+        Phone tokens are instead matched as a prefix of the normalized
+        ``phone_digits`` column, which its B-tree index serves.
+        """
+        tokens = parse_query(term)
+        if not tokens:
+            return queryset.none()
+        for token in tokens:
+            if token.kind == PHONE:
+                queryset = queryset.filter(phone_filter(token.text, prefix=True))
+                continue
+            condition = Q()
+            for field in token.fields:
+                condition |= Q(**{f"{field}__icontains": token.text})
+            queryset = queryset.filter(condition)
+        return queryset
+
+    def fuzzy(self, queryset, term):
+        return self.fulltext(queryset, term)
+
+    def rebuild(self, using="default", batch_size=5000, progress=None):
+        """Rebuild any index the backend maintains; returns rows indexed."""
+        return 0
+
+    def customer_saved(self, instance):
+        """Called after a customer is saved through the ORM."""
+
+    def customer_deleted(self, instance):
+        """Called after a customer is deleted through the ORM."""
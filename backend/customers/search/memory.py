@@ -0,0 +1,201 @@
+import bisect
+import heapq
+import threading
+import time
+from operator import itemgetter
+
+from django.conf import settings  # type: ignore
+from django.db import connections  # type: ignore
+from django.db.models import Case, FloatField, Value, When  # type: ignore
+
+from .base import FIELD_WEIGHTS, BaseSearchBackend, document_tokens
+from .query import parse_query
+
+
+def _search_settings():
+    return getattr(settings, "CUSTOMER_SEARCH", {})
+
+
+class InMemorySearchBackend(BaseSearchBackend):
+    """
+    Search served by an in-process inverted index.
+
+    The index maps every indexed word to the customers containing it, with
+    the columns it appears in, and keeps the words in a
+    sorted list so prefix lookups are a bisect plus a range scan.  It is
+    loaded from the database on first use, updated incrementally from the
+    model's save/delete signals, and reloaded after
+    ``CUSTOMER_SEARCH["MEMORY_INDEX_TTL"]`` seconds to pick up bulk writes
+    that bypass signals.  The reload runs in a background thread while
+    searches keep using the old index; writes made meanwhile are replayed
+    onto the new one.  Searches return at most
+    ``CUSTOMER_SEARCH["MEMORY_MAX_MATCHES"]`` best-ranked customers.  It
+    suits small tables and single-process setups; each worker process
+    holds its own copy.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._loaded_at = None
+        self._postings = {}
+        self._documents = {}
+        self._words = []
+        # ``(customer_id, values or None)`` written during a background
+        # reload, or ``None`` when no reload is running.
+        self._changes = None
+
+    def fulltext(self, queryset, term):
+        tokens = parse_query(term)
+        if not tokens:
+            return queryset.none()
+
+        scores = self.score(tokens, using=queryset.db)
+        if not scores:
+            return queryset.none()
+        limit = _search_settings().get("MEMORY_MAX_MATCHES", 1000)
+        if len(scores) > limit:
+            scores = dict(heapq.nlargest(limit, scores.items(), key=itemgetter(1)))
+
+        by_score = {}
+        for customer_id, score in scores.items():
+            by_score.setdefault(score, []).append(customer_id)
+        rank = Case(
+            *[When(id__in=ids, then=Value(score)) for score, ids in by_score.items()],
+            default=Value(0.0),
+            output_field=FloatField(),
+        )
+        return queryset.filter(id__in=list(scores)).annotate(search_rank=rank)
+
+    def score(self, tokens, using="default"):
+        """Return ``{customer_id: rank}`` for customers matching every token."""
+        with self._lock:
+            self._ensure_loaded(using)
+            scores = None
+            for word, fields in (
+                (word, token.fields) for token in tokens for word in token.words
+            ):
+                matches = {}
+                start = bisect.bisect_left(self._words, word)
+                for indexed in self._words[start:]:
+                    if not indexed.startswith(word):
+                        break
+                    for customer_id, found in self._postings[indexed].items():
+                        weight = max(
+                            (
+                                FIELD_WEIGHTS[field]
+                                for field in fields
+                                if field in found
+                            ),
+                            default=0.0,
+                        )
+                        if weight > matches.get(customer_id, 0.0):
+                            matches[customer_id] = weight
+                if scores is None:
+                    scores = matches
+                else:
+                    scores = {
+                        customer_id: score + matches[customer_id]
+                        for customer_id, score in scores.items()
+                        if customer_id in matches
+                    }
+                if not scores:
+                    return {}
+            return scores or {}
+
+    def rebuild(self, using="default", batch_size=5000, progress=None):
+        with self._lock:
+            self._adopt(self._load(using, batch_size))
+            return len(self._documents)
+
+    def customer_saved(self, instance):
+        values = {field: getattr(instance, field) for field in FIELD_WEIGHTS}
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            self._unindex(instance.pk)
+            self._index(instance.pk, values)
+            if self._changes is not None:
+                self._changes.append((instance.pk, values))
+
+    def customer_deleted(self, instance):
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            self._unindex(instance.pk)
+            if self._changes is not None:
+                self._changes.append((instance.pk, None))
+
+    def _ensure_loaded(self, using):
+        if self._loaded_at is None:
+            self.rebuild(using)
+            return
+        ttl = _search_settings().get("MEMORY_INDEX_TTL", 300)
+        if self._changes is None and time.monotonic() - self._loaded_at > ttl:
+            self._changes = []
+            threading.Thread(
+                target=self._refresh_in_thread, args=(using,), daemon=True
+            ).start()
+
+    def _refresh_in_thread(self, using):
+        try:
+            self._refresh(using)
+        finally:
+            connections[using].close()
+
+    def _refresh(self, using):
+        """Reload the index without holding the lock, then swap it in."""
+        try:
+            fresh = self._load(using)
+        except Exception:
+            with self._lock:
+                self._changes = None
+            raise
+        with self._lock:
+            for customer_id, values in self._changes:
+                fresh._unindex(customer_id)
+                if values is not None:
+                    fresh._index(customer_id, values)
+            self._adopt(fresh)
+            self._changes = None
+
+    def _load(self, using, batch_size=5000):
+        """Return a new backend whose index holds every customer."""
+        from customers.models import Customer
+
+        fresh = type(self)()
+        rows = (
+            Customer.objects.using(using)
+            .order_by()
+            .values_list("id", *FIELD_WEIGHTS)
+            .iterator(chunk_size=batch_size)
+        )
+        for row in rows:
+            fresh._index(row[0], dict(zip(FIELD_WEIGHTS, row[1:])))
+        return fresh
+
+    def _adopt(self, fresh):
+        self._postings = fresh._postings
+        self._documents = fresh._documents
+        self._words = fresh._words
+        self._loaded_at = time.monotonic()
+
+    def _index(self, customer_id, values):
+        columns = {}
+        for field, value in values.items():
+            for word in document_tokens(field, value):
+                columns.setdefault(word, set()).add(field)
+        for word, fields in columns.items():
+            postings = self._postings.get(word)
+            if postings is None:
+                postings = self._postings[word] = {}
+                bisect.insort(self._words, word)
+            postings[customer_id] = frozenset(fields)
+        self._documents[customer_id] = list(columns)
+
+    def _unindex(self, customer_id):
+        for word in self._documents.pop(customer_id, []):
+            postings = self._postings[word]
+            postings.pop(customer_id, None)
+            if not postings:
+                del self._postings[word]
+                del self._words[bisect.bisect_left(self._words, word)]
@@ -0,0 +1,183 @@
+from django.conf import settings  # type: ignore
+from django.contrib.postgres.lookups import TrigramWordSimilar  # type: ignore
+from django.contrib.postgres.search import (  # type: ignore
+    SearchQuery,
+    SearchRank,
+    TrigramWordSimilarity,
+)
+from django.db import connections, transaction  # type: ignore
+from django.db.models import F, Q, TextField, Value  # type: ignore
+from django.db.models.functions import Cast, Greatest, Upper  # type: ignore
+
+from ..phone import phone_filter
+from .base import BaseSearchBackend
+from .query import EMAIL, PHONE, WORD, parse_query
+
+SEARCH_CONFIG = "simple"
+SEARCH_INDEX_NAME = "customers_search_vector_gin"
+
+# Names weigh most, then email (whole address plus its local/domain parts),
+# then phone (digits only plus each digit group).  ``{row}`` is ``NEW.`` inside
+# the trigger and empty in the rebuild UPDATE.
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce({row}first_name, '') || ' ' || "
+    "coalesce({row}last_name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce({row}email, '') || ' ' || "
+    "translate(coalesce({row}email, ''), '@.', '  ')), 'B') || "
+    "setweight(to_tsvector('simple', "
+    "regexp_replace(coalesce({row}phone, ''), '\\D', '', 'g') || ' ' || "
+    "regexp_replace(coalesce({row}phone, ''), '\\D', ' ', 'g')), 'C')"
+)
+
+# ts_rank weights for D, C, B and A, mirroring ``FIELD_WEIGHTS``.
+RANK_WEIGHTS = [0.1, 0.2, 0.4, 1.0]
+
+# tsvector weight labels each kind of query token may match.
+TOKEN_WEIGHTS = {WORD: "AB", EMAIL: "B", PHONE: "C"}
+
+# Columns covered by ``GIN (UPPER(col::text) gin_trgm_ops)`` indexes.
+TRIGRAM_FIELDS = ("first_name", "last_name", "email")
+
+
+def build_tsquery(term):
+    """
+    Turn free text into a raw tsquery.
+
+    Every word becomes a prefix match restricted to the weights of the
+    columns its token is routed to, e.g. ``john:*AB & 5551:*C``.
+    """
+    return " & ".join(
+        f"{word}:*{TOKEN_WEIGHTS[token.kind]}"
+        for token in parse_query(term)
+        for word in token.words
+    )
+
+
+def get_trigram_threshold():
+    """Return the configured word-similarity threshold for fuzzy search."""
+    return getattr(settings, "CUSTOMER_SEARCH", {}).get("TRIGRAM_THRESHOLD", 0.3)
+
+
+def set_trigram_threshold(connection):
+    """
+    Set ``pg_trgm.word_similarity_threshold`` for a new PostgreSQL connection.
+
+    Runs once per connection, from the ``connection_created`` signal, so the
+    ``%>`` operator of ``fuzzy`` applies ``get_trigram_threshold()`` and
+    every request on the connection sees the same cut-off.
+    """
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT set_config('pg_trgm.word_similarity_threshold', %s, false)",
+            [str(get_trigram_threshold())],
+        )
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """
+    Search served by PostgreSQL indexes.
+
+    ``fulltext`` uses the trigger-maintained ``search_vector`` column and
+    its GIN index, routing tokens to columns through tsquery weight labels;
+    ``substring`` and ``fuzzy`` use the pg_trgm GIN indexes
+    on ``UPPER(col::text)``, an expression that matches what Django emits
+    for ``icontains`` so one index serves both modes.
+    """
+
+    def fulltext(self, queryset, term):
+        tsquery = build_tsquery(term)
+        if not tsquery:
+            return queryset.none()
+
+        query = SearchQuery(tsquery, search_type="raw", config=SEARCH_CONFIG)
+        return queryset.filter(search_vector=query).annotate(
+            search_rank=SearchRank(F("search_vector"), query, weights=RANK_WEIGHTS)
+        )
+
+    def fuzzy(self, queryset, term):
+        """
+        Every name or email token must be similar to a word in its columns.
+
+        Uses the index-backed ``%>`` operator, whose cut-off is the
+        connection's ``pg_trgm.word_similarity_threshold`` as set by
+        ``set_trigram_threshold``, and ranks by the summed best word
+        similarity of each query word.  Phone tokens are matched as a
+        prefix of the normalized phone digits.
+        """
+        tokens = parse_query(term)
+        if not tokens:
+            return queryset.none()
+
+        rank = Value(0.0)
+        for token in tokens:
+            if token.kind == PHONE:
+                queryset = queryset.filter(phone_filter(token.text, prefix=True))
+                continue
+
+            columns = [
+                Upper(Cast(F(field), TextField()))
+                for field in token.fields
+                if field in TRIGRAM_FIELDS
+            ]
+            for word in token.words:
+                word = word.upper()
+                condition = Q()
+                for column in columns:
+                    condition |= Q(TrigramWordSimilar(column, Value(word)))
+                queryset = queryset.filter(condition)
+
+                similarities = [
+                    TrigramWordSimilarity(word, column) for column in columns
+                ]
+                best = (
+                    Greatest(*similarities)
+                    if len(similarities) > 1
+                    else similarities[0]
+                )
+                rank = rank + best
+
+        return queryset.annotate(search_rank=rank)
+
+    def rebuild(self, using="default", batch_size=5000, progress=None):
+        """
+        Recompute ``search_vector`` in short id-range batches.
+
+        Each batch runs in its own transaction and only rows whose stored
+        vector differs are written, so the rebuild can run online.
+        """
+        from customers.models import Customer
+
+        connection = connections[using]
+        table = connection.ops.quote_name(Customer._meta.db_table)
+        expression = SEARCH_VECTOR_SQL.format(row="")
+
+        last_id = 0
+        updated = 0
+        while True:
+            with transaction.atomic(using=using), connection.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT max(id) FROM (SELECT id FROM {table} WHERE id > %s "
+                    "ORDER BY id LIMIT %s) AS batch",
+                    [last_id, batch_size],
+                )
+                upper = cursor.fetchone()[0]
+                if upper is None:
+                    break
+                cursor.execute(
+                    f"UPDATE {table} SET search_vector = {expression} "
+                    "WHERE id > %s AND id <= %s "
+                    f"AND search_vector IS DISTINCT FROM {expression}",
+                    [last_id, upper],
+                )
+                updated += cursor.rowcount
+            last_id = upper
+            if progress:
+                progress(last_id)
+        return updated
+
+    def reindex(self, using="default"):
+        """Rebuild the GIN index without blocking writes."""
+        with connections[using].cursor() as cursor:
+            cursor.execute(f"REINDEX INDEX CONCURRENTLY {SEARCH_INDEX_NAME}")
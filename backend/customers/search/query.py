@@ -0,0 +1,60 @@
+"""
+Search query parsing.
+
+A query is split on whitespace and each token is routed to the columns it
+can match: tokens with an ``@`` or a dotted word (``john.doe``) are email
+fragments, tokens made only of digits and phone punctuation are phone
+fragments, and anything else is a word matched against names and, with
+lower rank, the email address.  Every token must match.
+"""
+
+import re
+from typing import NamedTuple
+
+WORD = "word"
+EMAIL = "email"
+PHONE = "phone"
+
+# Columns each kind of token is matched against.
+TOKEN_FIELDS = {
+    WORD: ("first_name", "last_name", "email"),
+    EMAIL: ("email",),
+    PHONE: ("phone",),
+}
+
+_WORD_RE = re.compile(r"[^\W_]+")
+_NON_DIGIT_RE = re.compile(r"\D")
+_PHONE_RE = re.compile(r"^\+?[\d\-().]*\d[\d\-().]*$")
+_DOTTED_RE = re.compile(r"[^\W_]\.[^\W_]")
+
+
+class QueryToken(NamedTuple):
+    """One whitespace-separated piece of a search query."""
+
+    kind: str
+    text: str
+    words: tuple
+
+    @property
+    def fields(self):
+        return TOKEN_FIELDS[self.kind]
+
+
+def tokenize(text):
+    """Split free text into lowercase words, dropping punctuation."""
+    return _WORD_RE.findall(text.lower())
+
+
+def parse_query(term):
+    """Return the routed tokens of ``term``, skipping ones with no words."""
+    tokens = []
+    for text in term.split():
+        if "@" in text or _DOTTED_RE.search(text):
+            kind, words = EMAIL, tuple(tokenize(text))
+        elif _PHONE_RE.match(text):
+            kind, words = PHONE, (_NON_DIGIT_RE.sub("", text),)
+        else:
+            kind, words = WORD, tuple(tokenize(text))
+        if words:
+            tokens.append(QueryToken(kind, text, words))
+    return tokens
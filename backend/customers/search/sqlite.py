@@ -0,0 +1,118 @@
+from django.db import connections  # type: ignore
+from django.db.models.expressions import RawSQL  # type: ignore
+
+from .base import FIELD_WEIGHTS, BaseSearchBackend
+from .query import parse_query
+
+FTS_TABLE = "customers_fts"
+
+# The phone column is indexed as typed plus its digits, like PostgreSQL's
+# ``regexp_replace(phone, '\D', '', 'g')``.
+_PHONE_DIGITS_SQL = (
+    "replace(replace(replace(replace(replace(replace({row}phone, '-', ''), "
+    "' ', ''), '+', ''), '(', ''), ')', ''), '.', '')"
+)
+_ROW_SQL = (
+    "{row}id, {row}first_name, {row}last_name, {row}email, "
+    "{row}phone || ' ' || " + _PHONE_DIGITS_SQL
+)
+_INSERT_SQL = (
+    f"INSERT INTO {FTS_TABLE}(rowid, first_name, last_name, email, phone) "
+    "VALUES (" + _ROW_SQL + ")"
+)
+_FILL_SQL = (
+    f"INSERT INTO {FTS_TABLE}(rowid, first_name, last_name, email, phone) "
+    "SELECT " + _ROW_SQL.format(row="") + " FROM customers"
+)
+
+# Also run by migration 0011, which keeps its own copy of these statements.
+INSTALL_SQL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    "first_name, last_name, email, phone, "
+    "tokenize = 'unicode61 remove_diacritics 0')",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_insert AFTER INSERT ON customers "
+    "BEGIN " + _INSERT_SQL.format(row="new.") + "; END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_update AFTER UPDATE ON customers "
+    f"BEGIN DELETE FROM {FTS_TABLE} WHERE rowid = old.id; "
+    + _INSERT_SQL.format(row="new.")
+    + "; END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_delete AFTER DELETE ON customers "
+    f"BEGIN DELETE FROM {FTS_TABLE} WHERE rowid = old.id; END",
+]
+
+# bm25() weights per FTS column, scaled from ``FIELD_WEIGHTS``.
+_BM25_WEIGHTS = ", ".join(
+    str(FIELD_WEIGHTS[field] * 10)
+    for field in ("first_name", "last_name", "email", "phone")
+)
+
+
+def install_index(using="default"):
+    """
+    Create the FTS5 table and its triggers unless they exist, and fill it.
+
+    Migrations do this for real databases; it is for databases built
+    without them, such as the ``--nomigrations`` test database, and for
+    ``rebuild``.  Returns whether anything was created.
+    """
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+            [FTS_TABLE],
+        )
+        if cursor.fetchone():
+            return False
+        for statement in INSTALL_SQL:
+            cursor.execute(statement)
+        cursor.execute(_FILL_SQL)
+    return True
+
+
+def build_match(term):
+    """
+    Turn free text into an FTS5 query.
+
+    Every word becomes a prefix match under a column filter naming the
+    columns its token is routed to, e.g. ``{first_name last_name email} :
+    "john"* AND phone : "5551"*``.
+    """
+    return " AND ".join(
+        f'{{{" ".join(token.fields)}}} : "{word}"*'
+        for token in parse_query(term)
+        for word in token.words
+    )
+
+
+class SQLiteSearchBackend(BaseSearchBackend):
+    """
+    Search served by an SQLite FTS5 table kept in sync by triggers.
+
+    The table and triggers are created by migration 0011 (or
+    ``install_index``), so searching only reads.  Ranking uses ``bm25()``
+    with per-column weights, negated so higher is better.
+    """
+
+    def fulltext(self, queryset, term):
+        match = build_match(term)
+        if not match:
+            return queryset.none()
+
+        table = connections[queryset.db].ops.quote_name(queryset.model._meta.db_table)
+        return queryset.filter(
+            id__in=RawSQL(
+                f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match]
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                f"SELECT -bm25({FTS_TABLE}, {_BM25_WEIGHTS}) FROM {FTS_TABLE} "
+                f"WHERE {FTS_TABLE} MATCH %s AND rowid = {table}.id",
+                [match],
+            )
+        )
+
+    def rebuild(self, using="default", batch_size=5000, progress=None):
+        install_index(using)
+        with connections[using].cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE}")
+            cursor.execute(_FILL_SQL)
+            return cursor.rowcount
@@ -1,12 +1,34 @@
+from django.utils.html import escape  # type: ignore
 from rest_framework import serializers  # type: ignore
 
 from .models import Customer
 
 
-class CustomerSerializer(serializers.ModelSerializer):
+class SparseFieldsMixin:
+    """
+    Serializer that renders only the fields named by its ``fields`` argument.
+
+    ``fields=None`` keeps every field.
+    """
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class EscapedReadOnlyField(serializers.ReadOnlyField):
+    """Read-only text rendered HTML-escaped, for values stored raw."""
+
+    def to_representation(self, value):
+        return escape(value)
+
+
+class CustomerSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for Customer model."""
 
-    full_name = serializers.ReadOnlyField()
+    full_name = EscapedReadOnlyField()
 
     class Meta:
         model = Customer
@@ -43,11 +65,47 @@ class CustomerSerializer(serializers.ModelSerializer):
         return data
 
 
-class CustomerListSerializer(serializers.ModelSerializer):
+class CustomerListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Lightweight serializer for listing customers."""
 
-    full_name = serializers.ReadOnlyField()
+    full_name = EscapedReadOnlyField()
 
     class Meta:
         model = Customer
         fields = ["id", "full_name", "email", "phone", "is_active"]
+
+
+class CustomerBulkStatusSerializer(serializers.Serializer):
+    """Request body for the bulk activate/deactivate actions."""
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=False,
+        max_length=10000,
+    )
+
+
+class CustomerBulkItemSerializer(CustomerSerializer):
+    """
+    Field validation for one record of a bulk create or upsert.
+
+    Email uniqueness is checked for the whole batch at once, so the
+    per-record unique validator and ``exists()`` query are dropped.
+    """
+
+    class Meta(CustomerSerializer.Meta):
+        extra_kwargs = {"email": {"validators": []}}
+
+    def validate(self, data):
+        return data
+
+
+class CustomerBulkCreateSerializer(serializers.Serializer):
+    """Request body for the bulk create and upsert actions."""
+
+    customers = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=1000,
+    )
@@ -0,0 +1,48 @@
+from django.db.backends.signals import connection_created  # type: ignore
+from django.db.models.signals import post_delete, post_save  # type: ignore
+from django.dispatch import receiver  # type: ignore
+
+from .cache import collection_changed
+from .models import Customer, CustomerTombstone
+from .search import get_search_backend
+from .search.postgres import set_trigram_threshold
+from .stats import adjust_customer_stats, invalidate_customer_stats
+
+
+@receiver(post_save, sender=Customer)
+def customer_saved(sender, instance, created, using, update_fields, **kwargs):
+    """Keep in-process search indexes and cached counts in step with writes."""
+    get_search_backend(using).customer_saved(instance)
+    collection_changed(using)
+
+    if created:
+        adjust_customer_stats(total=1, active=int(instance.is_active), using=using)
+    elif update_fields is None or "is_active" in update_fields:
+        was_active = instance._stored_is_active
+        if was_active is None:
+            invalidate_customer_stats(using)
+        elif was_active != instance.is_active:
+            adjust_customer_stats(active=1 if instance.is_active else -1, using=using)
+    instance._stored_is_active = instance.is_active
+
+
+@receiver(post_delete, sender=Customer)
+def customer_deleted(sender, instance, using, **kwargs):
+    """
+    Drop deleted customers from in-process search indexes and caches, and
+    leave a tombstone for the change feed.
+    """
+    get_search_backend(using).customer_deleted(instance)
+    CustomerTombstone.objects.using(using).create(customer_id=instance.pk)
+    collection_changed(using)
+
+    was_active = instance._stored_is_active
+    if was_active is None:
+        was_active = instance.is_active
+    adjust_customer_stats(total=-1, active=-int(was_active), using=using)
+
+
+@receiver(connection_created)
+def connection_opened(sender, connection, **kwargs):
+    """Apply the fuzzy search cut-off to each new database connection."""
+    set_trigram_threshold(connection)
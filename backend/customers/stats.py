@@ -0,0 +1,72 @@
+"""
+Cached customer statistics for the dashboard.
+
+The total and active counts live in two cache keys that are adjusted with
+atomic ``incr``/``decr`` as customers are created, deleted, activated and
+deactivated, so reading them costs two cache lookups however large the
+table is.  Adjustments are applied once the writing transaction commits.
+Both keys expire after ``CUSTOMER_STATS["RECONCILE_INTERVAL"]`` seconds and
+are then recomputed from the database (from ``customers.counters`` on
+PostgreSQL), which bounds any drift from writes that bypass the ORM.  Bulk
+writes whose effect on the counts is unknown drop the keys instead.
+"""
+
+from django.conf import settings  # type: ignore
+from django.core.cache import cache  # type: ignore
+from django.db import transaction  # type: ignore
+
+from .counters import count_customers, counters_available, read_counters
+
+TOTAL_KEY = "customers:stats:total"
+ACTIVE_KEY = "customers:stats:active"
+
+
+def get_reconcile_interval():
+    """Return how long, in seconds, cached counts are trusted."""
+    return getattr(settings, "CUSTOMER_STATS", {}).get("RECONCILE_INTERVAL", 600)
+
+
+def compute_customer_stats(using="default"):
+    """Read the trigger-maintained counters, or count rows without them."""
+    if counters_available(using):
+        return read_counters(using)
+    return count_customers(using)
+
+
+def get_customer_stats(using="default"):
+    """Return ``{"total": n, "active": n}``, from the cache when possible."""
+    cached = cache.get_many([TOTAL_KEY, ACTIVE_KEY])
+    if len(cached) == 2:
+        return {"total": cached[TOTAL_KEY], "active": cached[ACTIVE_KEY]}
+
+    stats = compute_customer_stats(using)
+    cache.set_many(
+        {TOTAL_KEY: stats["total"], ACTIVE_KEY: stats["active"]},
+        get_reconcile_interval(),
+    )
+    return stats
+
+
+def adjust_customer_stats(total=0, active=0, using="default"):
+    """Apply a change to the cached counts once the transaction commits."""
+    if total or active:
+        transaction.on_commit(lambda: _apply(total, active), using=using)
+
+
+def invalidate_customer_stats(using="default"):
+    """Drop the cached counts once the transaction commits."""
+    transaction.on_commit(
+        lambda: cache.delete_many([TOTAL_KEY, ACTIVE_KEY]), using=using
+    )
+
+
+def _apply(total, active):
+    for key, delta in ((TOTAL_KEY, total), (ACTIVE_KEY, active)):
+        if not delta:
+            continue
+        try:
+            cache.incr(key, delta)
+        except ValueError:
+            # Not cached: the next read recomputes both counts.
+            cache.delete_many([TOTAL_KEY, ACTIVE_KEY])
+            return
@@ -0,0 +1,105 @@
+"""
+Typeahead suggestions for customer names and emails.
+
+Single-word prefixes are answered from sorted-key indexes: for each of
+``first_name``, ``last_name`` and ``email`` the prefix becomes a range
+``key >= 'jo' AND key < 'jp'`` over ``lower(col)`` in byte order, which an
+expression index can satisfy in order, so ``ORDER BY key LIMIT n`` reads
+only ``n`` index entries per column however many customers match.
+Multi-word prefixes ("john sm") go through the search backend instead.
+"""
+
+from django.db import connections  # type: ignore
+from django.db.models import F  # type: ignore
+from django.db.models.functions import Collate, Lower  # type: ignore
+from django.utils.html import escape  # type: ignore
+
+from .search import search_customers
+
+SUGGEST_FIELDS = ("first_name", "last_name", "email")
+SUGGEST_COLUMNS = ("id", "full_name", "email")
+
+# Collation giving byte-order comparisons, so range bounds match prefixes.
+_BYTE_COLLATIONS = {"postgresql": "C"}
+
+
+_MAX_CODE_POINT = 0x10FFFF
+_SURROGATES = range(0xD800, 0xE000)
+
+
+def prefix_upper_bound(prefix):
+    """
+    Return the smallest string above every string that starts with ``prefix``.
+
+    Trailing U+10FFFF characters cannot be incremented and are dropped, and
+    surrogates, which cannot be stored, are skipped.  Returns ``None`` when
+    nothing is left: every string from ``prefix`` upwards then starts with
+    it, so no upper bound is needed.
+    """
+    stem = prefix.rstrip(chr(_MAX_CODE_POINT))
+    if not stem:
+        return None
+    code_point = ord(stem[-1]) + 1
+    if code_point in _SURROGATES:
+        code_point = _SURROGATES.stop
+    return stem[:-1] + chr(code_point)
+
+
+def _sort_key(field, vendor):
+    key = Lower(field)
+    collation = _BYTE_COLLATIONS.get(vendor)
+    if collation:
+        key = Collate(key, collation)
+    return key
+
+
+def _row(values):
+    customer_id, full_name, email = values
+    return {
+        "id": customer_id,
+        "full_name": escape(full_name),
+        "email": email,
+    }
+
+
+def suggest_customers(queryset, prefix, limit):
+    """Return up to ``limit`` suggestions for ``prefix`` as small dicts."""
+    prefix = " ".join(prefix.lower().split())
+    if not prefix:
+        return []
+    # Select the alias ``Customer.objects`` computes the name under.
+    queryset = queryset.annotate(full_name=F("full_name"))
+
+    if " " in prefix:
+        matches = search_customers(queryset, prefix).order_by(
+            "-search_rank", "last_name", "first_name", "id"
+        )
+        return [
+            _row(values) for values in matches.values_list(*SUGGEST_COLUMNS)[:limit]
+        ]
+
+    vendor = connections[queryset.db].vendor
+    upper = prefix_upper_bound(prefix)
+    candidates = []
+    for field in SUGGEST_FIELDS:
+        rows = queryset.annotate(suggest_key=_sort_key(field, vendor)).filter(
+            suggest_key__gte=prefix
+        )
+        if upper is not None:
+            rows = rows.filter(suggest_key__lt=upper)
+        rows = rows.order_by("suggest_key", "id").values_list(
+            "suggest_key", *SUGGEST_COLUMNS
+        )[:limit]
+        candidates.extend(rows)
+
+    candidates.sort(key=lambda row: (row[0], row[1]))
+    suggestions = []
+    seen = set()
+    for row in candidates:
+        if row[1] in seen:
+            continue
+        seen.add(row[1])
+        suggestions.append(_row(row[1:]))
+        if len(suggestions) == limit:
+            break
+    return suggestions
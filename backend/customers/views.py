@@ -1,11 +1,65 @@
-from django.db.models import Q  # type: ignore
+import io
+from collections import Counter
+
+from django.core.exceptions import ValidationError as DjangoValidationError  # type: ignore  # noqa: E501
+from django.db import transaction  # type: ignore
+from django.http import StreamingHttpResponse  # type: ignore
+from django.utils.cache import (  # type: ignore
+    get_conditional_response,
+    patch_cache_control,
+)
+from django.utils.html import escape  # type: ignore
+from django.utils.http import http_date  # type: ignore
 from django_filters.rest_framework import DjangoFilterBackend  # type: ignore
-from rest_framework import filters, viewsets  # type: ignore
+from rest_framework import serializers, status, viewsets  # type: ignore
 from rest_framework.decorators import action  # type: ignore
+from rest_framework.exceptions import (  # type: ignore
+    NotAcceptable,
+    NotFound,
+    ValidationError,
+)
+from rest_framework.parsers import MultiPartParser  # type: ignore
+from rest_framework.permissions import IsAuthenticated  # type: ignore
 from rest_framework.response import Response  # type: ignore
 
+from .bulk import (
+    INSERTED,
+    UNCHANGED,
+    UPDATED,
+    bulk_create_customers,
+    upsert_customers,
+)
+from .cache import get_collection_version
+from .csv_import import import_customers
+from .etags import customer_etag, if_match_versions, list_etag
+from .exceptions import CustomerImportError, PreconditionFailed, StaleCustomerError
+from .export import (
+    COLUMNAR_FORMATS,
+    EXPORT_FORMATS,
+    ExportContentNegotiation,
+    columnar_available,
+    export_customers,
+    parse_columns,
+)
+from .fieldsets import fieldset_columns, parse_fieldset
+from .filters import (
+    FILTER_PARAMS,
+    CustomerFilterSet,
+    CustomerOrderingFilter,
+    filter_customers,
+)
+from .listing import encode_list_rows, list_rows
 from .models import Customer
-from .serializers import CustomerListSerializer, CustomerSerializer
+from .pagination import CustomerPagination
+from .serializers import (
+    CustomerBulkCreateSerializer,
+    CustomerBulkStatusSerializer,
+    CustomerListSerializer,
+    CustomerSerializer,
+)
+from .stats import get_customer_stats
+from .suggest import suggest_customers
+from .sync import read_changes
 
 
 class CustomerViewSet(viewsets.ModelViewSet):
@@ -17,15 +71,20 @@ class CustomerViewSet(viewsets.ModelViewSet):
 
     queryset = Customer.objects.all()
     serializer_class = CustomerSerializer
+    pagination_class = CustomerPagination
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
-        filters.OrderingFilter,
+        CustomerOrderingFilter,
     ]
-    filterset_fields = ["is_active"]
-    search_fields = ["first_name", "last_name", "email", "phone"]
-    ordering_fields = ["first_name", "last_name", "email", "created_at"]
+    filterset_class = CustomerFilterSet
+    ordering_fields = ["first_name", "last_name", "full_name", "email", "created_at"]
     ordering = ["last_name", "first_name"]
+    suggest_limit = 8
+    max_suggest_limit = 20
+    changes_limit = 100
+    max_changes_limit = 1000
+    bulk_batch_size = 1000
+    filter_params = FILTER_PARAMS
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -38,30 +97,144 @@ class CustomerViewSet(viewsets.ModelViewSet):
         Optionally restricts the returned customers,
         by filtering against query parameters.
         """
-        queryset = Customer.objects.all()
-
-        # Filter by active status
-        is_active = self.request.query_params.get("is_active")
-        if is_active is not None:
-            queryset = queryset.filter(is_active=is_active.lower() == "true")
-
-        # Custom search across multiple fields
-        search = self.request.query_params.get("search")
-        if search:
-            queryset = queryset.filter(
-                Q(first_name__icontains=search)
-                | Q(last_name__icontains=search)
-                | Q(email__icontains=search)
-                | Q(phone__icontains=search)
+        fields = self.get_fieldset()
+        if self.action == "retrieve" and fields is not None:
+            queryset = Customer.objects.only(*fieldset_columns(fields))
+        else:
+            # The search vector is only ever read by the database.
+            queryset = Customer.objects.defer("search_vector")
+        return filter_customers(queryset, self.request.query_params)
+
+    def get_fieldset(self):
+        """
+        Return the fields selected by ``?fields=`` and ``?exclude=``.
+
+        Only the list and retrieve actions take a sparse fieldset; ``None``
+        means the full representation.
+        """
+        if self.action not in ("list", "retrieve"):
+            return None
+        if not hasattr(self, "_fieldset"):
+            available = self.get_serializer_class().Meta.fields
+            self._fieldset = parse_fieldset(self.request.query_params, available)
+        return self._fieldset
+
+    def get_serializer(self, *args, **kwargs):
+        fields = self.get_fieldset()
+        if fields is not None:
+            kwargs.setdefault("fields", fields)
+        return super().get_serializer(*args, **kwargs)
+
+    def list(self, request, *args, **kwargs):
+        """List customers, answering 304 while the collection is unchanged."""
+        version = get_collection_version(self.get_queryset().db)
+        etag = list_etag(request, version)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            self.paginator.collection_version = version
+            response = self.list_response(request)
+        return self.set_validators(response, etag)
+
+    def list_response(self, request):
+        """
+        Build the list response from value rows instead of model instances.
+
+        The body is identical to rendering ``CustomerListSerializer``; see
+        ``customers.listing``.
+        """
+        fields = self.get_fieldset()
+        rows = list_rows(self.filter_queryset(self.get_queryset()), fields)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(encode_list_rows(page, fields))
+        return Response(encode_list_rows(rows, fields))
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Retrieve a customer, checking validators before loading it.
+
+        Only ``id``, ``version`` and ``updated_at`` are read to build the ETag and
+        Last-Modified validators, so an unchanged customer gets a 304 without
+        being fetched or serialized.
+        """
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset()).order_by()
+        try:
+            row = (
+                queryset.filter(**{self.lookup_field: kwargs[lookup_url_kwarg]})
+                .values_list("id", "version", "updated_at")
+                .first()
+            )
+        except (TypeError, ValueError, DjangoValidationError):
+            row = None
+        if row is None:
+            return super().retrieve(request, *args, **kwargs)
+
+        etag = customer_etag(request, *row)
+        last_modified = int(row[2].timestamp())
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = super().retrieve(request, *args, **kwargs)
+        return self.set_validators(response, etag, last_modified)
+
+    def update(self, request, *args, **kwargs):
+        """Update a customer, honouring ``If-Match`` and returning its new ETag."""
+        response = super().update(request, *args, **kwargs)
+        return self.set_customer_etag(response, self.saved_customer)
+
+    def perform_update(self, serializer):
+        """
+        Save the customer, only at the version ``If-Match`` names if given.
+
+        The row is locked at that version before the save, so a concurrent
+        write either lands first and fails the check with 412, or waits.
+        """
+        customer = serializer.instance
+        versions = if_match_versions(self.request, customer.pk)
+        if versions is None:
+            serializer.save()
+        elif customer.version not in versions:
+            raise PreconditionFailed()
+        else:
+            using = customer._state.db
+            with transaction.atomic(using=using):
+                try:
+                    locked = Customer.objects.using(using).lock_at_version(
+                        customer.pk, versions
+                    )
+                except StaleCustomerError:
+                    raise PreconditionFailed()
+                if not locked:
+                    raise NotFound()
+                serializer.save()
+        self.saved_customer = customer
+
+    def set_customer_etag(self, response, customer):
+        """Give a write response the ETag of the customer's new version."""
+        if response.status_code == 200:
+            response["ETag"] = customer_etag(
+                self.request, customer.pk, customer.version, customer.updated_at
             )
+        return response
 
-        return queryset
+    def set_validators(self, response, etag, last_modified=None):
+        """Attach validators to successful responses and require revalidation."""
+        if response.status_code not in (200, 304):
+            return response
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
 
     @action(detail=False, methods=["get"])
     def stats(self, request):
-        """Get customer statistics."""
-        total_customers = Customer.objects.count()
-        active_customers = Customer.objects.filter(is_active=True).count()
+        """Get customer statistics from the write-maintained cache."""
+        stats = get_customer_stats()
+        total_customers = stats["total"]
+        active_customers = stats["active"]
         inactive_customers = total_customers - active_customers
 
         return Response(
@@ -72,30 +245,284 @@ class CustomerViewSet(viewsets.ModelViewSet):
             }
         )
 
-    @action(detail=True, methods=["post"])
-    def deactivate(self, request, pk=None):
-        """Deactivate a customer."""
-        customer = self.get_object()
-        customer.is_active = False
-        customer.save()
+    @action(detail=False, methods=["get"])
+    def suggest(self, request):
+        """Get name/email completions for the prefix in ``q``."""
+        try:
+            limit = int(request.query_params.get("limit", self.suggest_limit))
+        except ValueError:
+            raise ValidationError({"limit": "Must be an integer."})
+        limit = max(1, min(limit, self.max_suggest_limit))
 
-        return Response(
+        suggestions = suggest_customers(
+            self.get_queryset(), request.query_params.get("q", ""), limit
+        )
+        response = Response({"suggestions": suggestions})
+        patch_cache_control(response, private=True, max_age=30)
+        return response
+
+    @action(detail=False, methods=["get"])
+    def changes(self, request):
+        """
+        Get customers changed and deleted since the delta token in ``since``.
+
+        Omit ``since`` for the initial sync.  Follow ``next_token`` while
+        ``has_more`` is true, then store it for the next sync.
+        """
+        try:
+            limit = int(request.query_params.get("limit", self.changes_limit))
+        except ValueError:
+            raise ValidationError({"limit": "Must be an integer."})
+        limit = max(1, min(limit, self.max_changes_limit))
+
+        try:
+            page = read_changes(request.query_params.get("since") or None, limit)
+        except ValueError:
+            raise ValidationError({"since": "Invalid delta token."})
+
+        timestamp = serializers.DateTimeField()
+        response = Response(
             {
-                "message": f"Customer {customer.full_name} has been deactivated.",
-                "customer": CustomerSerializer(customer).data,
+                "changed": CustomerSerializer(page["changed"], many=True).data,
+                "deleted": [
+                    {
+                        "id": tombstone.customer_id,
+                        "deleted_at": timestamp.to_representation(tombstone.deleted_at),
+                    }
+                    for tombstone in page["deleted"]
+                ],
+                "next_token": page["next_token"],
+                "has_more": page["has_more"],
             }
         )
+        patch_cache_control(response, private=True, no_store=True)
+        return response
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path=r"export/(?P<export_format>csv|ndjson|parquet|arrow)",
+        content_negotiation_class=ExportContentNegotiation,
+    )
+    def export(self, request, export_format):
+        """
+        Stream every customer matching the list filters in ``export_format``.
+
+        Unlike the list endpoint there is no pagination and no count; rows
+        are streamed from a database cursor as they are encoded.  ``columns``
+        limits the export to a comma-separated subset of the fields, and the
+        ``created_at``/``updated_at`` range filters select snapshots.
+        Parquet and Arrow require ``pyarrow``.
+        """
+        if export_format in COLUMNAR_FORMATS and not columnar_available():
+            raise NotAcceptable(
+                f"The {export_format} format requires pyarrow, which is not "
+                "installed."
+            )
+        columns = parse_columns(request.query_params.get("columns"))
+        queryset = self.filter_queryset(self.get_queryset())
+        response = StreamingHttpResponse(
+            export_customers(queryset, export_format, columns),
+            content_type=EXPORT_FORMATS[export_format],
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="customers.{export_format}"'
+        )
+        return response
+
+    @action(detail=True, methods=["post"])
+    def deactivate(self, request, pk=None):
+        """Deactivate a customer."""
+        return self.set_active(request, pk, False)
 
     @action(detail=True, methods=["post"])
     def activate(self, request, pk=None):
         """Activate a customer."""
-        customer = self.get_object()
-        customer.is_active = True
-        customer.save()
+        return self.set_active(request, pk, True)
+
+    @action(detail=False, methods=["post"])
+    def bulk_activate(self, request):
+        """Activate customers selected by ``ids`` and/or list filters."""
+        return self.bulk_set_active(request, True)
+
+    @action(detail=False, methods=["post"])
+    def bulk_deactivate(self, request):
+        """Deactivate customers selected by ``ids`` and/or list filters."""
+        return self.bulk_set_active(request, False)
+
+    @action(detail=False, methods=["post"])
+    def bulk_create(self, request):
+        """
+        Create many customers from a ``customers`` list in one request.
+
+        Records are validated together and the valid ones inserted with a
+        single ``bulk_create``; invalid records are reported by their index
+        without failing the rest.  Responds 201 when every record was
+        created, 207 when only some were and 400 when none were.
+        """
+        serializer = CustomerBulkCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        created, errors = bulk_create_customers(serializer.validated_data["customers"])
+
+        return self.bulk_response(
+            f"Created {len(created)} customers.",
+            "created",
+            [
+                {"index": index, "id": customer.id, "email": customer.email}
+                for index, customer in sorted(created.items())
+            ],
+            errors,
+            status.HTTP_201_CREATED,
+        )
+
+    @action(detail=False, methods=["post"])
+    def upsert(self, request):
+        """
+        Insert or update many customers from a ``customers`` list, by email.
+
+        Each record is reported as inserted, updated or unchanged; unchanged
+        customers are not written.  Invalid records are reported by their
+        index without failing the rest.  Responds 200 when every record was
+        valid, 207 when only some were and 400 when none were.
+        """
+        serializer = CustomerBulkCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results, errors = upsert_customers(serializer.validated_data["customers"])
+
+        counts = Counter(result for result, _ in results.values())
+        return self.bulk_response(
+            f"Inserted {counts[INSERTED]}, updated {counts[UPDATED]} and left "
+            f"{counts[UNCHANGED]} customers unchanged.",
+            "results",
+            [
+                {
+                    "index": index,
+                    "id": customer.id,
+                    "email": customer.email,
+                    "status": result,
+                }
+                for index, (result, customer) in sorted(results.items())
+            ],
+            errors,
+            status.HTTP_200_OK,
+        )
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=[MultiPartParser],
+        permission_classes=[IsAuthenticated],
+    )
+    def import_csv(self, request):
+        """
+        Import customers from an uploaded CSV ``file``, keyed on email.
+
+        The upload is streamed through ``customers.csv_import``; the response
+        summarizes the rows inserted, updated, unchanged and rejected.
+        """
+        upload = request.FILES.get("file")
+        if upload is None:
+            raise ValidationError({"file": "Upload a CSV file."})
+        stream = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+        try:
+            result = import_customers(stream)
+        except CustomerImportError as exc:
+            raise ValidationError({"file": str(exc)})
+        return Response(result)
 
+    def bulk_response(self, message, key, items, errors, success_status):
+        """
+        Build the response of a bulk write with per-record errors.
+
+        ``success_status`` is used when no record failed, 207 when some did
+        and 400 when every record did.
+        """
+        if not errors:
+            response_status = success_status
+        elif items:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
         return Response(
             {
-                "message": f"Customer {customer.full_name} has been activated.",
-                "customer": CustomerSerializer(customer).data,
+                "message": message,
+                key: items,
+                "errors": [
+                    {"index": index, "errors": errors[index]}
+                    for index in sorted(errors)
+                ],
+            },
+            status=response_status,
+        )
+
+    def bulk_set_active(self, request, is_active):
+        """
+        Change the status of many customers with batched set-based UPDATEs.
+
+        Customers are selected by an ``ids`` list in the body, by the list
+        endpoint's filter and search query parameters, or by both; one of
+        them is required so an empty request cannot touch every customer.
+        """
+        serializer = CustomerBulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data.get("ids")
+        if ids is None and not any(
+            request.query_params.get(param) for param in self.filter_params
+        ):
+            raise ValidationError(
+                {"ids": "Provide customer ids or at least one list filter."}
+            )
+
+        queryset = self.filter_queryset(self.get_queryset())
+        if ids is not None:
+            queryset = queryset.filter(id__in=ids)
+        affected = queryset.bulk_set_active(is_active, self.bulk_batch_size)
+
+        verb = "Activated" if is_active else "Deactivated"
+        return Response(
+            {"message": f"{verb} {affected} customers.", "affected": affected}
+        )
+
+    def set_active(self, request, pk, is_active):
+        """
+        Flip ``is_active`` with one conditional UPDATE and a minimal response.
+
+        The customer is neither loaded through ``get_object`` nor re-validated
+        or serialized; the response carries only the fields the status change
+        affects.  ``If-Match`` is enforced by the UPDATE itself.
+        """
+        try:
+            customer_id = int(pk)
+        except (TypeError, ValueError):
+            raise NotFound()
+
+        versions = if_match_versions(request, customer_id)
+        if versions is not None and not versions:
+            raise PreconditionFailed()
+        try:
+            row, _ = Customer.objects.set_active(customer_id, is_active, versions)
+        except StaleCustomerError:
+            raise PreconditionFailed()
+        if row is None:
+            raise NotFound()
+
+        full_name = escape(f"{row['first_name']} {row['last_name']}")
+        verb = "activated" if is_active else "deactivated"
+        response = Response(
+            {
+                "message": f"Customer {full_name} has been {verb}.",
+                "customer": {
+                    "id": row["id"],
+                    "is_active": row["is_active"],
+                    "updated_at": serializers.DateTimeField().to_representation(
+                        row["updated_at"]
+                    ),
+                    "version": row["version"],
+                },
             }
         )
+        response["ETag"] = customer_etag(
+            request, row["id"], row["version"], row["updated_at"]
+        )
+        return response
@@ -1,5 +1,11 @@
 import axios, { AxiosResponse, AxiosError, InternalAxiosRequestConfig } from 'axios'
-import { Customer, CustomerFormData, CustomerStats, PaginatedResponse } from '../types'
+import {
+  Customer,
+  CustomerFormData,
+  CustomerStats,
+  CustomerStatusUpdate,
+  PaginatedResponse,
+} from '../types'
 import { safeConsole, sanitizeForLogging } from '../utils/logSanitization'
 
 const API_BASE_URL = import.meta.env.VITE_API_URL || '/api'
@@ -78,14 +84,14 @@ export const customerApi = {
     return response.data
   },
 
-  // Activate a customer
-  activateCustomer: async (id: number): Promise<Customer> => {
+  // Activate a customer; resolves to the changed status fields only
+  activateCustomer: async (id: number): Promise<CustomerStatusUpdate> => {
     const response = await api.post(`/customers/${id}/activate/`)
     return response.data.customer
   },
 
-  // Deactivate a customer
-  deactivateCustomer: async (id: number): Promise<Customer> => {
+  // Deactivate a customer; resolves to the changed status fields only
+  deactivateCustomer: async (id: number): Promise<CustomerStatusUpdate> => {
     const response = await api.post(`/customers/${id}/deactivate/`)
     return response.data.customer
   },
@@ -10,6 +10,14 @@ export interface Customer {
   updated_at: string
 }
 
+// The activate/deactivate endpoints return only the fields they change.
+export interface CustomerStatusUpdate {
+  id: number
+  is_active: boolean
+  updated_at: string
+  version: number
+}
+
 export interface CustomerFormData {
   first_name: string
   last_name: string
@@ -0,0 +1,29 @@
+import pytest
+from django.core.cache import cache
+from django.db import connections
+
+from customers.search.sqlite import install_index
+
+
+@pytest.fixture(scope="session")
+def django_db_setup(django_db_setup, django_db_blocker):
+    """
+    Add the SQLite search table, which migration 0011 creates and
+    ``--nomigrations`` therefore leaves out.
+    """
+    with django_db_blocker.unblock():
+        for connection in connections.all():
+            if connection.vendor == "sqlite":
+                install_index(connection.alias)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Start every test with an empty cache.
+
+    Cached counts are keyed by a collection version that is bumped on
+    writes, but a rolled-back test transaction does not bump it back.
+    """
+    cache.clear()
+    yield
@@ -0,0 +1,265 @@
+from unittest import mock
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from customers.models import Customer
+from customers.views import CustomerViewSet
+
+# pyright: reportAttributeAccessIssue=false
+
+
+class BulkStatusTest(APITestCase):
+    """Test cases for the bulk activate/deactivate actions."""
+
+    def setUp(self):
+        self.customers = [
+            Customer.objects.create(
+                first_name="Pat" if i % 2 else "Sam",
+                last_name="Lee",
+                email=f"bulk{i}@example.com",
+                phone=f"555-{i:04d}",
+                is_active=i != 0,
+            )
+            for i in range(6)
+        ]
+        self.deactivate_url = reverse("customer-bulk-deactivate")
+        self.activate_url = reverse("customer-bulk-activate")
+
+    def active_ids(self):
+        return set(Customer.objects.filter(is_active=True).values_list("id", flat=True))
+
+    def test_deactivate_by_ids(self):
+        """Only listed customers change, and only changed rows are counted."""
+        ids = [c.id for c in self.customers[:3]]
+        response = self.client.post(self.deactivate_url, {"ids": ids}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["affected"], 2)
+        self.assertEqual(self.active_ids(), {c.id for c in self.customers[3:]})
+
+    def test_deactivate_by_list_filters(self):
+        """The list endpoint's search and filter parameters select customers."""
+        with mock.patch.object(CustomerViewSet, "bulk_batch_size", 2):
+            response = self.client.post(
+                self.deactivate_url + "?search=pat&is_active=true", format="json"
+            )
+
+        self.assertEqual(response.data["affected"], 3)
+        self.assertEqual(
+            self.active_ids(), {self.customers[2].id, self.customers[4].id}
+        )
+        self.assertEqual(
+            self.client.post(self.activate_url + "?search=pat").data["affected"], 3
+        )
+
+    def test_selection_is_required(self):
+        """A request with neither ids nor filters is rejected."""
+        response = self.client.post(self.deactivate_url, {}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(len(self.active_ids()), 5)
+
+        response = self.client.post(self.deactivate_url, {"ids": []}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_date_range_filters_count_as_selection(self):
+        """The ``created_at`` and ``updated_at`` bounds select customers too."""
+        response = self.client.post(
+            self.deactivate_url + "?created_at_after=2000-01-01T00:00:00Z"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["affected"], 5)
+
+        response = self.client.post(
+            self.activate_url + "?updated_at_before=2000-01-01T00:00:00Z"
+        )
+        self.assertEqual(response.data["affected"], 0)
+
+    def test_stats_stay_consistent(self):
+        """Cached stats are adjusted by the number of changed rows."""
+        stats_url = reverse("customer-stats")
+        self.assertEqual(self.client.get(stats_url).data["active_customers"], 5)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                self.activate_url,
+                {"ids": [c.id for c in self.customers]},
+                format="json",
+            )
+        with self.assertNumQueries(0):
+            response = self.client.get(stats_url)
+        self.assertEqual(response.data["active_customers"], 6)
+        self.assertEqual(response.data["inactive_customers"], 0)
+
+
+class BulkCreateTest(APITestCase):
+    """Test cases for the bulk create action."""
+
+    def setUp(self):
+        Customer.objects.create(
+            first_name="Ann", last_name="Ray", email="ann@example.com", phone="555-1111"
+        )
+        self.url = reverse("customer-bulk-create")
+
+    def record(self, i, **overrides):
+        return {
+            "first_name": "Pat",
+            "last_name": "Lee",
+            "email": f"new{i}@example.com",
+            "phone": f"555-{i:04d}",
+            **overrides,
+        }
+
+    def test_creates_batch_with_constant_queries(self):
+        """Validation is set-based, so the query count does not grow per record."""
+        records = [self.record(i) for i in range(50)]
+        # One email IN query, then the insert inside a savepoint.
+        with self.assertNumQueries(4):
+            response = self.client.post(self.url, {"customers": records}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data["created"]), 50)
+        self.assertEqual(response.data["errors"], [])
+        created = Customer.objects.get(email="new7@example.com")
+        self.assertEqual(created.phone_digits, "5550007")
+        self.assertIn(
+            {"index": 7, "id": created.id, "email": "new7@example.com"},
+            response.data["created"],
+        )
+
+    def test_reports_errors_per_record(self):
+        """Invalid records are reported by index and the rest are created."""
+        records = [
+            self.record(0, email=" NEW0@Example.com "),
+            self.record(1, email="ANN@example.com"),
+            self.record(2, email="new0@example.com"),
+            self.record(3, phone="not a phone"),
+            self.record(4, first_name="Pat<script>"),
+            self.record(5),
+        ]
+        response = self.client.post(self.url, {"customers": records}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual([item["index"] for item in response.data["created"]], [0, 5])
+        errors = {item["index"]: item["errors"] for item in response.data["errors"]}
+        self.assertEqual(set(errors), {1, 2, 3, 4})
+        self.assertIn("already exists", str(errors[1]["email"]))
+        self.assertIn("more than once", str(errors[2]["email"]))
+        self.assertIn("phone", errors[3])
+        self.assertIn("first_name", errors[4])
+        self.assertTrue(Customer.objects.filter(email="new0@example.com").exists())
+
+    def test_rejects_batch_without_valid_records(self):
+        """Nothing is written when every record is invalid."""
+        response = self.client.post(
+            self.url,
+            {"customers": [self.record(0, email="ann@example.com")]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Customer.objects.count(), 1)
+
+        response = self.client.post(self.url, {"customers": []}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class UpsertTest(APITestCase):
+    """Test cases for the upsert action."""
+
+    def setUp(self):
+        self.ann = Customer.objects.create(
+            first_name="Ann", last_name="Ray", email="ann@example.com", phone="555-1111"
+        )
+        self.ben = Customer.objects.create(
+            first_name="Ben",
+            last_name="Ray",
+            email="ben@example.com",
+            phone="555-2222",
+            is_active=False,
+        )
+        self.url = reverse("customer-upsert")
+
+    def test_classifies_and_writes_changed_rows(self):
+        """Records are inserted, updated or skipped after normalization."""
+        records = [
+            # Same as stored once cleaned, so nothing is written.
+            {
+                "first_name": " ann ",
+                "last_name": "ray",
+                "email": " ANN@Example.com",
+                "phone": "555-1111",
+            },
+            # Omitting is_active keeps Ben inactive.
+            {
+                "first_name": "Ben",
+                "last_name": "Roe",
+                "email": "ben@example.com",
+                "phone": "555-2222",
+            },
+            {
+                "first_name": "Cal",
+                "last_name": "Ray",
+                "email": "cal@example.com",
+                "phone": "555-3333",
+            },
+        ]
+        response = self.client.post(self.url, {"customers": records}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item["status"] for item in response.data["results"]],
+            ["unchanged", "updated", "inserted"],
+        )
+        self.assertEqual(response.data["results"][0]["id"], self.ann.id)
+
+        ann = Customer.objects.get(id=self.ann.id)
+        self.assertEqual((ann.updated_at, ann.version), (self.ann.updated_at, 1))
+        ben = Customer.objects.get(id=self.ben.id)
+        self.assertEqual((ben.last_name, ben.is_active, ben.version), ("Roe", False, 2))
+        self.assertGreater(ben.updated_at, self.ben.updated_at)
+        cal = Customer.objects.get(email="cal@example.com")
+        self.assertEqual(response.data["results"][2]["id"], cal.id)
+        self.assertEqual(cal.phone_digits, "5553333")
+
+    def test_unchanged_batch_does_not_write(self):
+        """A batch with nothing to change only reads."""
+        record = {
+            "first_name": "Ann",
+            "last_name": "Ray",
+            "email": "ann@example.com",
+            "phone": "555-1111",
+            "is_active": True,
+        }
+        with self.assertNumQueries(1):
+            response = self.client.post(
+                self.url, {"customers": [record]}, format="json"
+            )
+        self.assertEqual(response.data["results"][0]["status"], "unchanged")
+
+    def test_reports_errors_per_record(self):
+        """Invalid and repeated records are reported without failing the rest."""
+        records = [
+            {
+                "first_name": "Ann",
+                "last_name": "Ray",
+                "email": "ann@example.com",
+                "phone": "555-9999",
+            },
+            {
+                "first_name": "Ann",
+                "last_name": "Ray",
+                "email": "ann@example.com",
+                "phone": "555-8888",
+            },
+            {"first_name": "Dee", "email": "dee@example.com", "phone": "555-4444"},
+        ]
+        response = self.client.post(self.url, {"customers": records}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual(
+            [(item["index"], item["status"]) for item in response.data["results"]],
+            [(0, "updated")],
+        )
+        self.assertEqual([item["index"] for item in response.data["errors"]], [1, 2])
+        self.assertEqual(Customer.objects.get(id=self.ann.id).phone, "555-9999")
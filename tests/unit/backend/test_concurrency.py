@@ -0,0 +1,127 @@
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from customers.exceptions import StaleCustomerError
+from customers.models import Customer, CustomerQuerySet
+
+# pyright: reportAttributeAccessIssue=false
+
+
+class CustomerVersionTest(TestCase):
+    """Test cases for version-checked saves."""
+
+    def setUp(self):
+        self.customer = Customer.objects.create(
+            first_name="Ann", last_name="Ray", email="ann@example.com", phone="555-1111"
+        )
+
+    def test_saves_increment_version(self):
+        """Every kind of write moves the version forward."""
+        self.assertEqual(self.customer.version, 1)
+        self.customer.first_name = "Anna"
+        self.customer.save()
+        self.assertEqual(self.customer.version, 2)
+
+        self.customer.save(update_fields=["first_name"])
+        Customer.objects.filter(pk=self.customer.pk).update(is_active=False)
+        self.customer.refresh_from_db()
+        self.assertEqual(self.customer.version, 4)
+
+    def test_saves_of_the_same_read_get_distinct_versions(self):
+        """The version is bumped in SQL, so stale instances do not reuse one."""
+        first = Customer.objects.get(pk=self.customer.pk)
+        second = Customer.objects.get(pk=self.customer.pk)
+        first.save()
+        second.save()
+        self.assertEqual((first.version, second.version), (2, 3))
+
+    def test_derived_fields_keep_version(self):
+        """Saving only ``UNVERSIONED_FIELDS`` leaves the version alone."""
+        self.customer.save(update_fields=["phone_digits"])
+        self.customer.refresh_from_db()
+        self.assertEqual(self.customer.version, 1)
+
+    def test_lock_at_version(self):
+        """Only a row still at an expected version is locked for writing."""
+        self.assertTrue(Customer.objects.lock_at_version(self.customer.pk, {1}))
+        self.customer.refresh_from_db()
+        self.assertEqual(self.customer.version, 1)
+
+        self.customer.first_name = "Anna"
+        self.customer.save()
+        with self.assertRaises(StaleCustomerError):
+            Customer.objects.lock_at_version(self.customer.pk, {1})
+        self.assertTrue(Customer.objects.lock_at_version(self.customer.pk, {1, 2}))
+        self.assertFalse(Customer.objects.lock_at_version(self.customer.pk + 1, {1}))
+
+
+class IfMatchTest(APITestCase):
+    """Test cases for If-Match on customer writes."""
+
+    def setUp(self):
+        self.customer = Customer.objects.create(
+            first_name="Ann", last_name="Ray", email="ann@example.com", phone="555-1111"
+        )
+        self.detail_url = reverse("customer-detail", kwargs={"pk": self.customer.pk})
+
+    def patch(self, data, etag=None):
+        headers = {"HTTP_IF_MATCH": etag} if etag else {}
+        return self.client.patch(self.detail_url, data, format="json", **headers)
+
+    def test_matching_etag_updates(self):
+        """A current ETag is accepted and the response carries the next one."""
+        etag = self.client.get(self.detail_url)["ETag"]
+        response = self.patch({"first_name": "Anna"}, etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(self.client.get(self.detail_url)["ETag"], response["ETag"])
+
+    def test_stale_etag_is_rejected(self):
+        """Writes based on an outdated ETag fail with 412 and change nothing."""
+        etag = self.client.get(self.detail_url)["ETag"]
+        self.assertEqual(self.patch({"first_name": "Anna"}, etag).status_code, 200)
+
+        response = self.patch({"first_name": "Bea"}, etag)
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+
+        response = self.client.post(
+            reverse("customer-deactivate", kwargs={"pk": self.customer.pk}),
+            HTTP_IF_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+
+        self.customer.refresh_from_db()
+        self.assertEqual(self.customer.first_name, "Anna")
+        self.assertTrue(self.customer.is_active)
+
+    def test_write_between_read_and_save_is_rejected(self):
+        """A write landing after the customer was loaded still fails the check."""
+        etag = self.client.get(self.detail_url)["ETag"]
+        original = CustomerQuerySet.lock_at_version
+
+        def write_first(queryset, pk, versions):
+            Customer.objects.filter(pk=pk).update(last_name="Roe")
+            return original(queryset, pk, versions)
+
+        with mock.patch.object(
+            CustomerQuerySet, "lock_at_version", autospec=True, side_effect=write_first
+        ):
+            response = self.patch({"first_name": "Anna"}, etag)
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+
+        self.customer.refresh_from_db()
+        self.assertEqual(self.customer.first_name, "Ann")
+
+    def test_if_match_is_optional(self):
+        """Requests without If-Match, or with ``*``, are still accepted."""
+        self.assertEqual(self.patch({"first_name": "Anna"}).status_code, 200)
+        self.assertEqual(self.patch({"first_name": "Bea"}, "*").status_code, 200)
+        self.assertEqual(
+            self.patch({"first_name": "Cat"}, '"other"').status_code,
+            status.HTTP_412_PRECONDITION_FAILED,
+        )
@@ -0,0 +1,95 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from customers.models import Customer
+
+# pyright: reportAttributeAccessIssue=false
+
+
+class ConditionalGetTest(APITestCase):
+    """Test cases for ETag and Last-Modified handling."""
+
+    def setUp(self):
+        self.customer = Customer.objects.create(
+            first_name="Ann", last_name="Ray", email="ann@example.com", phone="555-1111"
+        )
+        self.list_url = reverse("customer-list")
+        self.detail_url = reverse("customer-detail", kwargs={"pk": self.customer.pk})
+
+    def test_list_not_modified(self):
+        """
+        A matching list ETag is answered without loading customers; only
+        PostgreSQL reads the collection version from the database.
+        """
+        response = self.client.get(self.list_url)
+        etag = response["ETag"]
+        self.assertIn("no-cache", response["Cache-Control"])
+
+        with self.assertNumQueries(1 if connection.vendor == "postgresql" else 0):
+            response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_list_etag_covers_query_and_writes(self):
+        """Different filters and any write produce a new list ETag."""
+        etag = self.client.get(self.list_url)["ETag"]
+        filtered = self.client.get(self.list_url, {"is_active": "true"})["ETag"]
+        self.assertNotEqual(etag, filtered)
+
+        Customer.objects.create(
+            first_name="Ben", last_name="Ray", email="ben@example.com", phone="555-2222"
+        )
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+        self.assertNotEqual(response["ETag"], etag)
+
+    @skipUnless(connection.vendor == "postgresql", "requires PostgreSQL")
+    def test_list_etag_follows_writes_outside_the_orm(self):
+        """The list ETag is derived from database state, not a process cache."""
+        etag = self.client.get(self.list_url)["ETag"]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "UPDATE customers SET first_name = 'Anne' WHERE id = %s",
+                [self.customer.pk],
+            )
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_detail_not_modified_skips_loading(self):
+        """A matching detail ETag costs one narrow query and no body."""
+        response = self.client.get(self.detail_url)
+        etag = response["ETag"]
+        self.assertIn("Last-Modified", response)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+
+        response = self.client.get(
+            self.detail_url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_detail_changes_after_update(self):
+        """Updating a customer changes its ETag."""
+        etag = self.client.get(self.detail_url)["ETag"]
+        self.customer.first_name = "Anna"
+        self.customer.save()
+
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["first_name"], "Anna")
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_missing_customer_has_no_validators(self):
+        """Errors are not given validators."""
+        response = self.client.get(reverse("customer-detail", kwargs={"pk": 999}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertNotIn("ETag", response)
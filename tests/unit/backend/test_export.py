@@ -0,0 +1,165 @@
+import csv
+import io
+import json
+import tempfile
+from datetime import datetime, timezone
+from unittest import mock, skipUnless
+
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from customers.export import columnar_available
+from customers.models import Customer
+
+if columnar_available():
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+# pyright: reportAttributeAccessIssue=false
+
+
+class CustomerExportTest(APITestCase):
+    """Test cases for the streaming CSV/NDJSON export."""
+
+    def setUp(self):
+        self.john = Customer.objects.create(
+            first_name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            phone="555-1234",
+        )
+        self.jane = Customer.objects.create(
+            first_name="Jane",
+            last_name="Smith",
+            email="jane.smith@example.com",
+            phone="555-5678",
+            is_active=False,
+        )
+
+    def export(self, export_format, query=""):
+        url = reverse("customer-export", kwargs={"export_format": export_format})
+        response = self.client.get(url + query, HTTP_ACCEPT="text/csv")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return response, b"".join(response.streaming_content).decode("utf-8")
+
+    def test_csv_export(self):
+        """CSV has a header and one row per customer in list order."""
+        response, body = self.export("csv")
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertIn('filename="customers.csv"', response["Content-Disposition"])
+
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual(
+            [row["email"] for row in rows], [self.john.email, self.jane.email]
+        )
+        self.assertEqual(rows[1]["is_active"], "false")
+        self.assertEqual(rows[0]["created_at"], self.john.created_at.isoformat())
+
+    def test_ndjson_export_honors_filters(self):
+        """The list endpoint's filters and search select the exported rows."""
+        _, body = self.export("ndjson", "?is_active=true")
+        records = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([record["id"] for record in records], [self.john.id])
+        self.assertIs(records[0]["is_active"], True)
+
+        _, body = self.export("ndjson", "?search=jane&search_mode=substring")
+        self.assertEqual(json.loads(body)["email"], self.jane.email)
+
+    def test_invalid_search_mode(self):
+        """Filter errors are reported before streaming starts."""
+        url = reverse("customer-export", kwargs={"export_format": "csv"})
+        response = self.client.get(url + "?search=x&search_mode=bogus")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_command_exports_to_file(self):
+        """The management command writes filtered rows in id order."""
+        with tempfile.NamedTemporaryFile("r", suffix=".ndjson") as output:
+            call_command("export_customers", "--format=ndjson", "-o", output.name)
+            records = [json.loads(line) for line in output]
+        self.assertEqual(
+            [record["id"] for record in records], [self.john.id, self.jane.id]
+        )
+
+        out = io.StringIO()
+        call_command("export_customers", "--is-active=false", stdout=out)
+        rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+        self.assertEqual([row["email"] for row in rows], [self.jane.email])
+
+        with self.assertRaises(CommandError):
+            call_command("export_customers", "--search=x", "--search-mode=bogus")
+
+    def test_columns_and_date_ranges(self):
+        """Exports can be projected and limited to a time window."""
+        Customer.objects.filter(id=self.jane.id).update(
+            created_at=datetime(2020, 1, 1, tzinfo=timezone.utc)
+        )
+        _, body = self.export(
+            "ndjson", "?columns=email,id&created_at_after=2021-01-01T00:00:00Z"
+        )
+        self.assertEqual(
+            json.loads(body), {"email": self.john.email, "id": self.john.id}
+        )
+
+        _, body = self.export("csv", "?columns=email&created_at_before=2020-06-01")
+        self.assertEqual(body.splitlines(), ["email", self.jane.email])
+
+        url = reverse("customer-export", kwargs={"export_format": "csv"})
+        response = self.client.get(url + "?columns=email,password")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@skipUnless(columnar_available(), "requires pyarrow")
+class CustomerColumnarExportTest(APITestCase):
+    """Test cases for the Parquet and Arrow exports."""
+
+    def setUp(self):
+        Customer.objects.bulk_create(
+            Customer(
+                first_name="Pat",
+                last_name="Lee",
+                email=f"columnar{i}@example.com",
+                phone=f"555-{i:04d}",
+                is_active=i % 2 == 0,
+            )
+            for i in range(5)
+        )
+
+    def test_parquet_export_in_row_groups(self):
+        """Rows are written in row groups with the projected columns."""
+        url = reverse("customer-export", kwargs={"export_format": "parquet"})
+        with mock.patch("customers.export.ROW_GROUP_SIZE", 2):
+            response = self.client.get(url + "?columns=id,is_active,created_at")
+            content = b"".join(response.streaming_content)
+
+        self.assertEqual(response["Content-Type"], "application/vnd.apache.parquet")
+        parquet = pq.ParquetFile(io.BytesIO(content))
+        self.assertEqual(parquet.metadata.num_row_groups, 3)
+        table = parquet.read()
+        self.assertEqual(table.column_names, ["id", "is_active", "created_at"])
+        self.assertEqual(table.num_rows, 5)
+        self.assertEqual(
+            str(table.schema.field("created_at").type), "timestamp[us, tz=UTC]"
+        )
+
+    def test_arrow_export_from_command(self):
+        """The command writes an Arrow IPC stream to a file."""
+        with tempfile.NamedTemporaryFile(suffix=".arrow") as output:
+            call_command(
+                "export_customers",
+                "--format=arrow",
+                "--columns=email",
+                "--is-active=true",
+                "-o",
+                output.name,
+            )
+            table = pa.ipc.open_stream(output.read()).read_all()
+        self.assertEqual(
+            table.column("email").to_pylist(),
+            ["columnar0@example.com", "columnar2@example.com", "columnar4@example.com"],
+        )
+
+        with self.assertRaisesMessage(CommandError, "needs --output"):
+            call_command("export_customers", "--format=parquet")
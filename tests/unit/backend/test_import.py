@@ -0,0 +1,121 @@
+import io
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from customers.csv_import import import_customers
+from customers.exceptions import CustomerImportError
+from customers.models import Customer
+
+# pyright: reportAttributeAccessIssue=false
+
+CSV = """\
+"first_name","last_name","email","phone"
+"john","doe","JOHN.DOE@example.com","555-1234"
+"Ann","Ray","ann@example.com","555-1111"
+"Ben","Roe","ben@example.com","555-2222"
+"Eve<script>","Lee","eve@example.com","555-3333"
+"Cal","Ray","cal@example.com","not a phone"
+"""
+
+
+class CustomerImportTest(TestCase):
+    """Test cases for the streaming CSV import."""
+
+    def setUp(self):
+        Customer.objects.create(
+            first_name="Ann", last_name="Ray", email="ann@example.com", phone="555-1111"
+        )
+        self.ben = Customer.objects.create(
+            first_name="Ben",
+            last_name="Ray",
+            email="ben@example.com",
+            phone="555-2222",
+            is_active=False,
+        )
+
+    def test_import_merges_rows(self):
+        """Rows are normalized, validated and merged by email."""
+        result = import_customers(io.StringIO(CSV), batch_size=2)
+
+        self.assertEqual(
+            {key: value for key, value in result.items() if key != "errors"},
+            {
+                "rows": 5,
+                "inserted": 1,
+                "updated": 1,
+                "unchanged": 1,
+                "invalid": 2,
+                "duplicates": 0,
+            },
+        )
+        self.assertEqual([error["line"] for error in result["errors"]], [5, 6])
+        self.assertIn("first_name", result["errors"][0]["errors"])
+
+        john = Customer.objects.get(email="john.doe@example.com")
+        self.assertEqual((john.first_name, john.phone_digits), ("John", "5551234"))
+        ben = Customer.objects.get(id=self.ben.id)
+        self.assertEqual((ben.last_name, ben.is_active, ben.version), ("Roe", False, 2))
+
+    def test_missing_columns_are_rejected(self):
+        """A file without the expected header fails before anything is written."""
+        with self.assertRaisesMessage(CustomerImportError, "missing columns: phone"):
+            import_customers(io.StringIO("first_name,last_name,email\nA,B,c@d.com\n"))
+
+    def test_command_imports_file(self):
+        """The management command streams a file and prints a summary."""
+        with tempfile.NamedTemporaryFile("w", suffix=".csv") as csv_file:
+            csv_file.write(CSV)
+            csv_file.flush()
+            out, err = io.StringIO(), io.StringIO()
+            call_command("import_customers", csv_file.name, stdout=out, stderr=err)
+
+        self.assertIn("1 inserted, 1 updated, 1 unchanged, 2 invalid", out.getvalue())
+        self.assertIn("Line 6: phone:", err.getvalue())
+
+        with self.assertRaises(CommandError):
+            call_command("import_customers", "/nonexistent.csv")
+
+
+class CustomerImportEndpointTest(APITestCase):
+    """Test cases for the CSV upload endpoint."""
+
+    def setUp(self):
+        self.url = reverse("customer-import-csv")
+        self.user = get_user_model().objects.create_user("importer", password="x")
+
+    def upload(self, content):
+        return self.client.post(
+            self.url,
+            {"file": SimpleUploadedFile("customers.csv", content.encode("utf-8"))},
+            format="multipart",
+        )
+
+    def test_requires_authentication(self):
+        """Anonymous uploads are refused."""
+        response = self.upload(CSV)
+        self.assertIn(
+            response.status_code,
+            (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN),
+        )
+        self.assertFalse(Customer.objects.exists())
+
+    def test_upload_imports_customers(self):
+        """An authenticated upload is imported and summarized."""
+        self.client.force_authenticate(self.user)
+        response = self.upload("\ufeff" + CSV)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["inserted"], 3)
+        self.assertEqual(response.data["invalid"], 2)
+        self.assertEqual(Customer.objects.count(), 3)
+
+        response = self.upload("name,email\nx,y\n")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("missing columns", str(response.data["file"]))
@@ -0,0 +1,264 @@
+import time
+
+import pytest
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from customers.listing import encode_list_rows, list_rows
+from customers.models import Customer
+from customers.serializers import CustomerListSerializer, CustomerSerializer
+
+# pyright: reportAttributeAccessIssue=false
+
+
+def render(data):
+    return JSONRenderer().render(data)
+
+
+class ListFastPathTest(APITestCase):
+    """The value-row list path matches ``CustomerListSerializer`` exactly."""
+
+    def setUp(self):
+        Customer.objects.create(
+            first_name="Sean",
+            last_name="O'Brien",
+            email="sean@example.com",
+            phone="555-1234",
+        )
+        Customer.objects.create(
+            first_name="Mary-Jo",
+            last_name="Smith Jones",
+            email="mj@example.com",
+            phone="+15551234567",
+            is_active=False,
+        )
+        Customer.objects.create(
+            first_name="Ann",
+            last_name="Ray",
+            email="ann@example.com",
+            phone="5551112222",
+        )
+        self.url = reverse("customer-list")
+
+    def assert_same_as_serializer(self, query, expected_ids):
+        response = self.client.get(self.url + query)
+        results = response.json()["results"]
+        self.assertEqual([row["id"] for row in results], expected_ids)
+
+        customers = Customer.objects.in_bulk(expected_ids)
+        serialized = CustomerListSerializer(
+            [customers[pk] for pk in expected_ids], many=True
+        ).data
+        self.assertIn(render(serialized), response.content)
+
+    def test_page_number_mode(self):
+        """Page-number responses carry the serializer's representation."""
+        ids = list(
+            Customer.objects.order_by("last_name", "first_name").values_list(
+                "id", flat=True
+            )
+        )
+        self.assert_same_as_serializer("", ids)
+
+    def test_keyset_mode_with_ordering_outside_list_columns(self):
+        """Cursors are built from ordering fields the page does not render."""
+        Customer.objects.bulk_create(
+            Customer(
+                first_name="Pat",
+                last_name="Lee",
+                email=f"page{i}@example.com",
+                phone=f"555-{i:04d}",
+            )
+            for i in range(25)
+        )
+        ids = list(
+            Customer.objects.order_by("-created_at", "-id").values_list("id", flat=True)
+        )
+        response = self.client.get(self.url + "?cursor=&ordering=-created_at")
+        pages = [response.json()["results"]]
+        response = self.client.get(response.json()["next"])
+        pages.append(response.json()["results"])
+        self.assertEqual([row["id"] for page in pages for row in page], ids)
+
+    def test_search_results(self):
+        """Search results keep their representation and rank ordering."""
+        ids = list(
+            Customer.objects.filter(email="mj@example.com").values_list("id", flat=True)
+        )
+        self.assert_same_as_serializer("?search=mary", ids)
+
+    def test_encoder_escapes_like_full_name(self):
+        """Names are HTML-escaped exactly as ``Customer.full_name`` does."""
+        rows = list_rows(Customer.objects.order_by("id"))
+        self.assertEqual(
+            render(encode_list_rows(rows)),
+            render(
+                CustomerListSerializer(Customer.objects.order_by("id"), many=True).data
+            ),
+        )
+        self.assertIn(b"O&#x27;Brien", render(encode_list_rows(rows)))
+
+
+class SparseFieldsetTest(APITestCase):
+    """``?fields=`` and ``?exclude=`` trim the output and the columns read."""
+
+    def setUp(self):
+        self.customer = Customer.objects.create(
+            first_name="Sean",
+            last_name="O'Brien",
+            email="sean@example.com",
+            phone="555-1234",
+        )
+        Customer.objects.create(
+            first_name="Ann", last_name="Ray", email="ann@example.com", phone="555-1"
+        )
+        self.url = reverse("customer-list")
+        self.detail_url = reverse("customer-detail", kwargs={"pk": self.customer.pk})
+
+    def get_selects(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        selects = [q["sql"] for q in queries if 'FROM "customers"' in q["sql"]]
+        return response, selects[-1]
+
+    def test_list_fields(self):
+        """The list renders and reads only the selected fields."""
+        response, sql = self.get_selects(self.url + "?fields=email,full_name")
+        customers = Customer.objects.order_by("last_name", "first_name")
+        self.assertIn(
+            render(
+                CustomerListSerializer(
+                    customers, many=True, fields=["full_name", "email"]
+                ).data
+            ),
+            response.content,
+        )
+        self.assertEqual(list(response.json()["results"][0]), ["full_name", "email"])
+        self.assertNotIn('"phone"', sql)
+        self.assertNotIn('"is_active"', sql)
+
+    def test_list_exclude_with_cursor(self):
+        """Keyset pages still get cursors when ``id`` is not rendered."""
+        Customer.objects.bulk_create(
+            Customer(
+                first_name="Pat",
+                last_name="Lee",
+                email=f"page{i:02d}@example.com",
+                phone=f"555-{i:04d}",
+            )
+            for i in range(25)
+        )
+        response = self.client.get(
+            self.url + "?exclude=id,phone&cursor=&ordering=email"
+        )
+        first = response.json()["results"]
+        self.assertEqual(
+            first[0],
+            {"full_name": "Ann Ray", "email": "ann@example.com", "is_active": True},
+        )
+        rest = self.client.get(response.json()["next"]).json()["results"]
+        self.assertEqual(
+            [row["email"] for row in first + rest],
+            list(Customer.objects.order_by("email").values_list("email", flat=True)),
+        )
+
+    def test_retrieve_fields(self):
+        """A detail request loads only the columns its fields need."""
+        response, sql = self.get_selects(self.detail_url + "?fields=id,email")
+        self.assertEqual(
+            response.json(), {"id": self.customer.pk, "email": "sean@example.com"}
+        )
+        self.assertNotIn('"first_name"', sql)
+        self.assertNotIn('"search_vector"', sql)
+
+        response = self.client.get(self.detail_url + "?exclude=created_at,updated_at")
+        self.assertEqual(
+            render(response.data),
+            render(CustomerSerializer(self.customer, fields=list(response.data)).data),
+        )
+        self.assertNotIn("created_at", response.data)
+
+    def test_fieldset_changes_etag(self):
+        """Sparse representations get their own validators."""
+        full = self.client.get(self.detail_url)["ETag"]
+        self.assertNotEqual(
+            self.client.get(self.detail_url + "?fields=id")["ETag"], full
+        )
+
+    def test_invalid_fieldsets(self):
+        """Unknown or empty selections are rejected with 400."""
+        for query in ("?fields=id,password", "?exclude=version", "?fields="):
+            with self.subTest(query=query):
+                response = self.client.get(self.url + query)
+                self.assertEqual(response.status_code, 400)
+        # ``created_at`` is only a detail field.
+        response = self.client.get(self.url + "?fields=created_at")
+        self.assertIn("fields", response.json())
+        response = self.client.get(self.detail_url + "?fields=id&exclude=id")
+        self.assertEqual(response.status_code, 400)
+
+
+class ListFastPathPageTest(TestCase):
+    """A full page from the value-row path matches the serializer."""
+
+    def test_hundred_row_page(self):
+        """Both paths render a 100-row page to the same bytes."""
+        Customer.objects.bulk_create(
+            Customer(
+                first_name="Pat",
+                last_name=f"Lee{chr(97 + i % 26)}",
+                email=f"listpage{i}@example.com",
+                phone=f"555{i:07d}",
+            )
+            for i in range(100)
+        )
+        queryset = Customer.objects.defer("search_vector").order_by("last_name", "id")
+
+        self.assertEqual(
+            render(CustomerListSerializer(list(queryset), many=True).data),
+            render(encode_list_rows(list(list_rows(queryset)))),
+        )
+
+
+class ListFastPathBenchmarkTest(TestCase):
+    """Benchmark of the value-row list path."""
+
+    @pytest.mark.benchmark
+    def test_benchmark(self):
+        """Report serializer vs value-row encoding time for 100-row pages."""
+        Customer.objects.bulk_create(
+            Customer(
+                first_name="Pat",
+                last_name=f"Lee{chr(97 + i % 26)}",
+                email=f"listbench{i}@example.com",
+                phone=f"555{i:07d}",
+            )
+            for i in range(100)
+        )
+        queryset = Customer.objects.defer("search_vector").order_by("last_name", "id")
+
+        def serializer_page():
+            return render(CustomerListSerializer(list(queryset), many=True).data)
+
+        def fast_page():
+            return render(encode_list_rows(list(list_rows(queryset))))
+
+        self.assertEqual(serializer_page(), fast_page())
+        timings = {}
+        for name, build in (("serializer", serializer_page), ("values", fast_page)):
+            start = time.perf_counter()
+            for _ in range(50):
+                build()
+            timings[name] = (time.perf_counter() - start) / 50
+
+        print(
+            f"\n100-row page: serializer {timings['serializer'] * 1000:.2f} ms, "
+            f"values {timings['values'] * 1000:.2f} ms "
+            f"({timings['serializer'] / timings['values']:.1f}x)"
+        )
+        self.assertLess(timings["values"], timings["serializer"])
@@ -1,8 +1,12 @@
+from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
+from django.db.models import F
 from django.test import TestCase
+from django.urls import reverse
 
 from customers.models import Customer
+from customers.serializers import CustomerSerializer
 
 
 class CustomerModelTest(TestCase):
@@ -138,3 +142,63 @@ class CustomerModelTest(TestCase):
 
         customer = Customer.objects.create(**data)
         self.assertEqual(customer.email, "john.doe@example.com")
+
+
+class FullNameExpressionTest(TestCase):
+    """Test cases for ``full_name`` as computed by the database."""
+
+    def setUp(self):
+        self.customer = Customer.objects.create(
+            first_name="Sean",
+            last_name="O'Brien",
+            email="sean@example.com",
+            phone="555-1234",
+        )
+        Customer.objects.create(
+            first_name="Ann", last_name="Ray", email="ann@example.com", phone="555-1"
+        )
+
+    def database_name(self):
+        return (
+            Customer.objects.annotate(full_name=F("full_name"))
+            .values_list("full_name", flat=True)
+            .get(pk=self.customer.pk)
+        )
+
+    def test_raw_and_escaped_when_rendered(self):
+        """The database and the model agree on the raw name; the API escapes it."""
+        self.assertEqual(self.customer.full_name, "Sean O'Brien")
+        self.assertEqual(self.database_name(), "Sean O'Brien")
+        self.assertEqual(
+            CustomerSerializer(self.customer).data["full_name"], "Sean O&#x27;Brien"
+        )
+
+    def test_follows_updates(self):
+        """Every write path changes the name without storing it."""
+        self.customer.first_name = "Shaun"
+        with self.assertNumQueries(2):
+            self.customer.save()
+        self.assertEqual(self.customer.full_name, "Shaun O'Brien")
+        self.assertEqual(self.database_name(), "Shaun O'Brien")
+
+        Customer.objects.filter(pk=self.customer.pk).update(last_name="Brien")
+        self.assertEqual(self.database_name(), "Shaun Brien")
+
+    def test_not_selected_unless_asked_for(self):
+        """Loading customers reads the name columns, not the expression."""
+        self.assertNotIn("full_name", str(Customer.objects.all().query))
+
+    def test_sort_and_search_in_database(self):
+        """The API orders by the expression and the admin searches it."""
+        response = self.client.get(reverse("customer-list") + "?ordering=-full_name")
+        self.assertEqual(
+            [row["full_name"] for row in response.json()["results"]],
+            ["Sean O&#x27;Brien", "Ann Ray"],
+        )
+
+        admin = User.objects.create_superuser("admin", "admin@example.com", "pw")
+        self.client.force_login(admin)
+        url = reverse("admin:customers_customer_changelist")
+        response = self.client.get(url, {"q": "n o'b", "o": "1"})
+        self.assertEqual(list(response.context["cl"].result_list), [self.customer])
+        self.assertContains(response, "Sean O&#x27;Brien")
@@ -0,0 +1,222 @@
+import base64
+import json
+from unittest import mock, skipUnless
+
+from django.db import connection
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from customers.models import Customer
+from customers.pagination import estimate_count
+
+# pyright: reportAttributeAccessIssue=false
+
+
+class CustomerKeysetPaginationTest(APITestCase):
+    """Test cases for the keyset (cursor) pagination mode."""
+
+    def setUp(self):
+        """Create enough customers for several pages, with duplicate names."""
+        names = ["Adams", "Baker", "Clark", "Davis", "Evans"]
+        for i in range(45):
+            Customer.objects.create(
+                first_name="Pat" if i % 3 else "Sam",
+                last_name=names[i % len(names)],
+                email=f"customer{i:02d}@example.com",
+                phone=f"555-{i:04d}",
+            )
+        self.list_url = reverse("customer-list")
+
+    def walk(self, params):
+        """Follow ``next`` links from the first keyset page to the end."""
+        response = self.client.get(self.list_url, {"cursor": "", **params})
+        pages = []
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append(response.data)
+            if not response.data["next"]:
+                return pages
+            response = self.client.get(response.data["next"])
+
+    def test_first_page_has_no_count(self):
+        """Keyset pages omit the count and the previous link."""
+        response = self.client.get(self.list_url, {"cursor": ""})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", response.data)
+        self.assertIsNone(response.data["previous"])
+        self.assertIsNotNone(response.data["next"])
+        self.assertEqual(len(response.data["results"]), 20)
+
+    def test_walk_matches_default_ordering(self):
+        """Walking every page yields each row once, in default order."""
+        pages = self.walk({})
+        ids = [row["id"] for page in pages for row in page["results"]]
+
+        expected = list(
+            Customer.objects.order_by("last_name", "first_name", "id").values_list(
+                "id", flat=True
+            )
+        )
+        self.assertEqual(ids, expected)
+        self.assertEqual([len(page["results"]) for page in pages], [20, 20, 5])
+
+    def test_walk_each_ordering_field(self):
+        """Every allowed ordering, ascending and descending, pages without gaps."""
+        for field in ["first_name", "last_name", "email", "created_at"]:
+            for ordering in [field, f"-{field}"]:
+                with self.subTest(ordering=ordering):
+                    pages = self.walk({"ordering": ordering})
+                    ids = [row["id"] for page in pages for row in page["results"]]
+                    tiebreak = "-id" if ordering.startswith("-") else "id"
+                    expected = list(
+                        Customer.objects.order_by(ordering, tiebreak).values_list(
+                            "id", flat=True
+                        )
+                    )
+                    self.assertEqual(ids, expected)
+
+    def test_previous_link_returns_prior_page(self):
+        """Following ``previous`` from page two returns page one."""
+        first = self.client.get(self.list_url, {"cursor": ""})
+        second = self.client.get(first.data["next"])
+        back = self.client.get(second.data["previous"])
+
+        self.assertEqual(back.status_code, status.HTTP_200_OK)
+        self.assertEqual(back.data["results"], first.data["results"])
+        self.assertIsNotNone(back.data["next"])
+
+    def test_keyset_respects_filters(self):
+        """Filters apply in keyset mode just like in page-number mode."""
+        Customer.objects.filter(first_name="Sam").update(is_active=False)
+
+        pages = self.walk({"is_active": "false"})
+        rows = [row for page in pages for row in page["results"]]
+
+        self.assertEqual(len(rows), 15)
+        self.assertTrue(all(not row["is_active"] for row in rows))
+
+    def test_invalid_cursor(self):
+        """Garbage or mismatched cursors are rejected with 404."""
+        response = self.client.get(self.list_url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        first = self.client.get(self.list_url, {"cursor": ""})
+        cursor = first.data["next"].split("cursor=")[1]
+        response = self.client.get(
+            self.list_url, {"cursor": cursor, "ordering": "email"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_tampered_cursor_positions(self):
+        """Well-formed cursors with values of the wrong type give 404."""
+        cases = [
+            ("-created_at", {"o": "-created_at,-id", "p": ["notadate", 1]}),
+            ("-created_at", {"o": "-created_at,-id", "p": [None, 1]}),
+            ("email", {"o": "email,id", "p": ["a@example.com", "zz"]}),
+            ("email", {"o": "email,id", "p": ["a@example.com", [1]]}),
+        ]
+        for ordering, payload in cases:
+            cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+            with self.subTest(payload=payload):
+                response = self.client.get(
+                    self.list_url, {"cursor": cursor, "ordering": ordering}
+                )
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_page_number_mode_unchanged(self):
+        """Without a cursor the response keeps the page-number shape."""
+        response = self.client.get(self.list_url, {"page": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 45)
+        self.assertEqual(len(response.data["results"]), 20)
+
+
+class CustomerCountCacheTest(APITestCase):
+    """Test cases for cached and estimated list counts."""
+
+    def setUp(self):
+        for i in range(5):
+            Customer.objects.create(
+                first_name="Pat",
+                last_name="Lee",
+                email=f"count{i}@example.com",
+                phone=f"555-{i:04d}",
+                is_active=i % 2 == 0,
+            )
+        self.list_url = reverse("customer-list")
+
+    def test_count_is_cached_per_filter_set(self):
+        """Repeated lists skip COUNT(*), whatever the parameter order."""
+        response = self.client.get(self.list_url + "?is_active=true&phone_prefix=555")
+        self.assertEqual(response.data["count"], 3)
+        self.assertTrue(response.data["count_exact"])
+
+        # PostgreSQL also reads the collection version from the database.
+        queries = 2 if connection.vendor == "postgresql" else 1
+        with self.assertNumQueries(queries):
+            response = self.client.get(
+                self.list_url + "?phone_prefix=555-&is_active=true"
+            )
+        self.assertEqual(response.data["count"], 3)
+
+        response = self.client.get(self.list_url, {"is_active": "false"})
+        self.assertEqual(response.data["count"], 2)
+
+    def test_writes_invalidate_counts(self):
+        """Saves, deletes and bulk updates refresh the cached count."""
+        self.assertEqual(self.client.get(self.list_url).data["count"], 5)
+
+        Customer.objects.create(
+            first_name="New", last_name="Lee", email="new@example.com", phone="5551111"
+        )
+        self.assertEqual(self.client.get(self.list_url).data["count"], 6)
+
+        Customer.objects.filter(email="new@example.com").delete()
+        self.assertEqual(self.client.get(self.list_url).data["count"], 5)
+
+        response = self.client.get(self.list_url, {"is_active": "true"})
+        self.assertEqual(response.data["count"], 3)
+        Customer.objects.update(is_active=True)
+        response = self.client.get(self.list_url, {"is_active": "true"})
+        self.assertEqual(response.data["count"], 5)
+
+    @skipUnless(connection.vendor == "postgresql", "requires PostgreSQL")
+    def test_writes_outside_the_orm_invalidate_counts(self):
+        """The version comes from the database, not from this process."""
+        self.assertEqual(self.client.get(self.list_url).data["count"], 5)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "DELETE FROM customers WHERE email = %s", ["count0@example.com"]
+            )
+        self.assertEqual(self.client.get(self.list_url).data["count"], 4)
+
+    @override_settings(CUSTOMER_LIST={"COUNT_ESTIMATE_THRESHOLD": 1000})
+    def test_large_estimates_replace_counts(self):
+        """Planner estimates above the threshold are reported as inexact."""
+        with mock.patch("customers.pagination.estimate_count", return_value=250000):
+            response = self.client.get(self.list_url)
+        self.assertEqual(response.data["count"], 250000)
+        self.assertFalse(response.data["count_exact"])
+
+        Customer.objects.create(
+            first_name="New", last_name="Lee", email="new@example.com", phone="5551111"
+        )
+        with mock.patch("customers.pagination.estimate_count", return_value=10):
+            response = self.client.get(self.list_url)
+        self.assertEqual(response.data["count"], 6)
+        self.assertTrue(response.data["count_exact"])
+
+    @skipUnless(connection.vendor == "postgresql", "requires PostgreSQL")
+    def test_planner_estimates(self):
+        """PostgreSQL estimates come from reltuples and EXPLAIN."""
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE customers")
+        self.assertIsInstance(estimate_count(Customer.objects.all()), int)
+        self.assertIsInstance(
+            estimate_count(Customer.objects.filter(is_active=True)), int
+        )
@@ -0,0 +1,119 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from customers.models import Customer
+from customers.phone import normalize_phone
+
+# pyright: reportAttributeAccessIssue=false
+
+
+class NormalizePhoneTest(SimpleTestCase):
+    """Test cases for phone normalization."""
+
+    def test_accepted_formats(self):
+        """Every accepted format reduces to digits with a country code."""
+        self.assertEqual(normalize_phone("555-1234"), "5551234")
+        self.assertEqual(normalize_phone("5551234567"), "15551234567")
+        self.assertEqual(normalize_phone("+15551234567"), "15551234567")
+        self.assertEqual(normalize_phone("15551234567"), "15551234567")
+        self.assertEqual(normalize_phone(""), "")
+
+
+class PhoneDigitsSyncTest(TestCase):
+    """Test that phone_digits follows every kind of write."""
+
+    def make(self, email, phone):
+        return Customer(first_name="Pat", last_name="Lee", email=email, phone=phone)
+
+    def test_save_and_update_fields(self):
+        """Saving a customer stores its normalized phone."""
+        customer = self.make("pat@example.com", "5551234567")
+        customer.save()
+        self.assertEqual(customer.phone_digits, "15551234567")
+
+        customer.phone = "555-9999"
+        customer.save(update_fields=["phone"])
+        customer.refresh_from_db()
+        self.assertEqual(customer.phone_digits, "5559999")
+
+    def test_bulk_writes(self):
+        """bulk_create, bulk_update and update keep phone_digits in sync."""
+        Customer.objects.bulk_create(
+            [
+                self.make("a@example.com", "555-1234"),
+                self.make("b@example.com", "+15550001111"),
+            ]
+        )
+        self.assertEqual(
+            sorted(Customer.objects.values_list("phone_digits", flat=True)),
+            ["15550001111", "5551234"],
+        )
+
+        customers = list(Customer.objects.order_by("email"))
+        customers[0].phone = "5552223333"
+        Customer.objects.bulk_update(customers, ["phone"])
+        customers[0].refresh_from_db()
+        self.assertEqual(customers[0].phone_digits, "15552223333")
+
+        Customer.objects.filter(email="b@example.com").update(phone="555-7777")
+        self.assertEqual(
+            Customer.objects.get(email="b@example.com").phone_digits, "5557777"
+        )
+
+    def test_backfill_command(self):
+        """The backfill command fills rows written before the column existed."""
+        Customer.objects.bulk_create(
+            [self.make(f"c{i}@example.com", f"555000{i:04d}") for i in range(5)]
+        )
+        Customer.objects.update(phone_digits="")
+
+        out = StringIO()
+        call_command("backfill_phone_digits", batch_size=2, stdout=out)
+
+        self.assertIn("Backfilled phone digits for 5 customers.", out.getvalue())
+        self.assertFalse(Customer.objects.filter(phone_digits="").exists())
+        # Derived columns alone do not move the version clients see.
+        self.assertEqual(set(Customer.objects.values_list("version", flat=True)), {1})
+        self.assertEqual(
+            Customer.objects.get(email="c3@example.com").phone_digits, "15550000003"
+        )
+
+
+class PhoneFilterViewTest(APITestCase):
+    """Test the phone and phone_prefix list filters."""
+
+    def setUp(self):
+        self.local = Customer.objects.create(
+            first_name="Ann", last_name="Ray", email="ann@example.com", phone="555-1234"
+        )
+        self.national = Customer.objects.create(
+            first_name="Ben",
+            last_name="Ray",
+            email="ben@example.com",
+            phone="5551234567",
+        )
+        self.url = reverse("customer-list")
+
+    def ids(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {row["id"] for row in response.data["results"]}
+
+    def test_exact_phone_ignores_formatting(self):
+        """An exact lookup matches any formatting of the same number."""
+        self.assertEqual(self.ids(phone="+1 (555) 123-4567"), {self.national.id})
+        self.assertEqual(self.ids(phone="555 1234"), {self.local.id})
+        self.assertEqual(self.ids(phone="555"), set())
+
+    def test_phone_prefix(self):
+        """A prefix lookup matches with or without the country code."""
+        self.assertEqual(
+            self.ids(phone_prefix="555-123"), {self.local.id, self.national.id}
+        )
+        self.assertEqual(self.ids(phone_prefix="1555123"), {self.national.id})
+        self.assertEqual(self.ids(phone_prefix="--"), set())
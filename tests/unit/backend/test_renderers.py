@@ -0,0 +1,143 @@
+import io
+import time
+import uuid
+from datetime import date, datetime
+from datetime import time as dt_time
+from datetime import timedelta, timezone
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+import pytest
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ErrorDetail, ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+from customer_management.parsers import ORJSONParser
+from customer_management.renderers import ORJSONRenderer
+
+SAMPLES = {
+    "scalars": {"int": 1, "float": 1.5, "bool": False, "none": None, "str": "x"},
+    "unicode": {"name": "Zoë Ünal 東京 🙂", "quote": 'say "hi"\n\t\\'},
+    "separators": {"text": "line\u2028separator\u2029paragraph"},
+    "datetimes": [
+        datetime(2024, 5, 6, 7, 8, 9, 123456, tzinfo=timezone.utc),
+        datetime(2024, 5, 6, 7, 8, 9, tzinfo=ZoneInfo("Europe/London")),
+        datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=5, minutes=30))),
+        datetime(2024, 5, 6, 7, 8, 9),
+        date(2024, 5, 6),
+        dt_time(7, 8, 9, 500),
+    ],
+    "decimals": [Decimal("12.50"), Decimal("0.1")],
+    "misc": [
+        uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        gettext_lazy("Customer"),
+        timedelta(seconds=90),
+        {3, 3},
+        (1, 2),
+        {1: "int key", True: "bool key"},  # noqa: F601
+    ],
+    "drf": ReturnDict(
+        {
+            "errors": ReturnList(
+                [ErrorDetail("Enter a valid email.", code="invalid")], serializer=None
+            )
+        },
+        serializer=None,
+    ),
+    "big_int": 2**70,
+}
+
+
+def list_page():
+    """A 100-customer list page as the list endpoint returns it."""
+    return {
+        "count": 1000,
+        "count_exact": True,
+        "next": "http://testserver/api/customers/?page=2",
+        "previous": None,
+        "results": [
+            {
+                "id": i,
+                "full_name": f"Customer {i}",
+                "email": f"customer{i}@example.com",
+                "phone": f"555-{i:04d}",
+                "is_active": i % 2 == 0,
+                "updated_at": datetime(2024, 5, 6, 7, 8, i % 60, tzinfo=timezone.utc),
+            }
+            for i in range(100)
+        ],
+    }
+
+
+class ORJSONRendererCompatibilityTest(SimpleTestCase):
+    """The orjson renderer matches DRF's JSONRenderer byte for byte."""
+
+    def assert_same(self, data, media_type=None):
+        self.assertEqual(
+            ORJSONRenderer().render(data, media_type),
+            JSONRenderer().render(data, media_type),
+        )
+
+    def test_samples(self):
+        for name, data in SAMPLES.items():
+            with self.subTest(name):
+                self.assert_same(data)
+
+    def test_line_separators_are_escaped(self):
+        """U+2028 and U+2029 are escaped so the output is valid JavaScript."""
+        rendered = ORJSONRenderer().render(SAMPLES["separators"])
+        self.assertEqual(rendered, b'{"text":"line\\u2028separator\\u2029paragraph"}')
+
+    def test_indent_and_empty(self):
+        """Indented output and empty bodies behave like JSONRenderer."""
+        self.assert_same(SAMPLES["unicode"], "application/json; indent=4")
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+    def test_unserializable_data_raises_like_json_renderer(self):
+        """Errors come from the stock renderer's encoder."""
+        with self.assertRaises(TypeError):
+            ORJSONRenderer().render({"obj": object()})
+        with self.assertRaises(ValueError):
+            ORJSONRenderer().render(dt_time(1, 2, tzinfo=timezone.utc))
+
+    def test_list_page(self):
+        """A 100-customer list page renders identically."""
+        self.assert_same(list_page())
+
+    @pytest.mark.benchmark
+    def test_benchmark(self):
+        """Report render times for a 100-customer list page."""
+        page = list_page()
+        timings = {}
+        for renderer in (JSONRenderer(), ORJSONRenderer()):
+            start = time.perf_counter()
+            for _ in range(500):
+                renderer.render(page)
+            timings[type(renderer).__name__] = (time.perf_counter() - start) / 500
+        print(
+            "\n" + ", ".join(f"{name} {t * 1e6:.0f} us" for name, t in timings.items())
+        )
+        self.assertLess(timings["ORJSONRenderer"], timings["JSONRenderer"])
+
+
+class ORJSONParserCompatibilityTest(SimpleTestCase):
+    """The orjson parser accepts and rejects what JSONParser does."""
+
+    def parse(self, parser, body, encoding="utf-8"):
+        return parser.parse(io.BytesIO(body), parser_context={"encoding": encoding})
+
+    def test_parses_like_json_parser(self):
+        body = '{"name":"Zoë","ids":[1,2],"active":true,"x":null}'.encode()
+        self.assertEqual(
+            self.parse(ORJSONParser(), body), self.parse(JSONParser(), body)
+        )
+        latin = '{"name":"Zoë"}'.encode("latin-1")
+        self.assertEqual(self.parse(ORJSONParser(), latin, "latin-1"), {"name": "Zoë"})
+
+    def test_rejects_invalid_json(self):
+        for body in (b"", b"{", b'{"a": NaN}', b"[1,]"):
+            with self.subTest(body=body), self.assertRaises(ParseError):
+                self.parse(ORJSONParser(), body)
@@ -0,0 +1,114 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from customers.models import Customer
+from customers.search import search_customers
+from customers.search.postgres import build_tsquery, get_trigram_threshold
+from customers.search.query import EMAIL, PHONE, WORD, parse_query
+
+
+class BuildTsqueryTest(SimpleTestCase):
+    """Test cases for turning search text into a tsquery."""
+
+    def test_words_become_prefix_terms(self):
+        """Every word is lowercased and matched as a prefix."""
+        self.assertEqual(build_tsquery("John Smi"), "john:*AB & smi:*AB")
+
+    def test_punctuation_is_dropped(self):
+        """Operators and punctuation cannot leak into the raw tsquery."""
+        self.assertEqual(build_tsquery("john.doe@ex"), "john:*B & doe:*B & ex:*B")
+        self.assertEqual(build_tsquery("a & !b | c:*"), "a:*AB & b:*AB & c:*AB")
+        self.assertEqual(build_tsquery("__"), "")
+
+    def test_phone_tokens_are_digits(self):
+        """Phone tokens match the phone weight by their digits only."""
+        self.assertEqual(build_tsquery("smith 555-1234"), "smith:*AB & 5551234:*C")
+
+
+class ParseQueryTest(SimpleTestCase):
+    """Test routing of query tokens to columns."""
+
+    def test_tokens_are_routed_by_shape(self):
+        """Digits go to phone, email-like tokens to email, words to names."""
+        tokens = parse_query("Smith john.doe@ex +1(555)123-4567 jo")
+        self.assertEqual([t.kind for t in tokens], [WORD, EMAIL, PHONE, WORD])
+        self.assertEqual(tokens[1].words, ("john", "doe", "ex"))
+        self.assertEqual(tokens[2].words, ("15551234567",))
+        self.assertEqual(tokens[0].fields, ("first_name", "last_name", "email"))
+        self.assertEqual(tokens[2].fields, ("phone",))
+
+    def test_dotted_words_are_email(self):
+        """A dotted word is treated as an email fragment."""
+        self.assertEqual(parse_query("example.org")[0].kind, EMAIL)
+        self.assertEqual(parse_query("o'brien")[0].kind, WORD)
+
+    def test_tokens_without_words_are_dropped(self):
+        """Bare punctuation does not become a token."""
+        self.assertEqual(parse_query("@@ -- ()"), [])
+
+
+class SearchCustomersTest(TestCase):
+    """Test cases for the customer search entry point."""
+
+    def setUp(self):
+        """Set up test data."""
+        Customer.objects.create(
+            first_name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            phone="555-1234",
+        )
+        Customer.objects.create(
+            first_name="Bob",
+            last_name="Johnson",
+            email="bob.johnson@example.com",
+            phone="555-9999",
+        )
+
+    def search(self, term):
+        return search_customers(Customer.objects.all(), term)
+
+    def test_matches_names_and_email(self):
+        """Search finds customers by name fragment and by email."""
+        self.assertEqual(self.search("John").count(), 2)
+        self.assertEqual(self.search("john.doe").get().first_name, "John")
+
+    def test_substring_mode_matches_fragments(self):
+        """Substring mode matches a fragment anywhere in a name or email."""
+        results = search_customers(Customer.objects.all(), "ohn oe", "substring")
+        self.assertEqual(results.get().first_name, "John")
+
+    @skipUnless(connection.vendor == "postgresql", "requires PostgreSQL")
+    def test_fuzzy_mode_tolerates_misspellings(self):
+        """Fuzzy mode matches transposed letters and ranks the best match first."""
+        results = list(
+            search_customers(Customer.objects.all(), "jonh", "fuzzy").order_by(
+                "-search_rank"
+            )
+        )
+        self.assertEqual(results[0].first_name, "John")
+
+    @skipUnless(connection.vendor == "postgresql", "requires PostgreSQL")
+    def test_fuzzy_threshold_is_set_per_connection(self):
+        """Connections carry the configured cut-off of the ``%>`` operator."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT current_setting('pg_trgm.word_similarity_threshold', true)"
+            )
+            self.assertEqual(float(cursor.fetchone()[0]), get_trigram_threshold())
+
+
+class SearchModeViewTest(TestCase):
+    """Test cases for the ``search_mode`` query parameter."""
+
+    def test_unknown_search_mode_is_rejected(self):
+        """An unsupported search mode returns a 400 naming the valid modes."""
+        response = self.client.get(
+            reverse("customer-list"), {"search": "john", "search_mode": "regex"}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("search_mode", response.json())
@@ -0,0 +1,231 @@
+"""
+Conformance and benchmark suite shared by every customer search backend.
+
+Each backend test case runs the same assertions, so all engines agree on
+which customers match a query and on the relative ranking of name, email
+and phone matches.  The benchmark is marked ``benchmark`` and only runs
+with ``pytest -m benchmark``.
+"""
+
+import time
+from unittest import mock, skipUnless
+
+import pytest
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from customers.models import Customer
+from customers.search.memory import InMemorySearchBackend
+from customers.search.postgres import PostgresSearchBackend
+from customers.search.sqlite import SQLiteSearchBackend
+
+
+class SearchBackendConformanceMixin:
+    """Assertions every search backend must satisfy."""
+
+    def make_backend(self):
+        raise NotImplementedError
+
+    def setUp(self):
+        """Set up customers whose matches differ by column."""
+        self.john = Customer.objects.create(
+            first_name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            phone="555-1234",
+        )
+        self.bob = Customer.objects.create(
+            first_name="Bob",
+            last_name="Johnson",
+            email="bob.johnson@example.com",
+            phone="555-9999",
+        )
+        self.jane = Customer.objects.create(
+            first_name="Jane",
+            last_name="Roe",
+            email="doe.jane@example.org",
+            phone="5551234567",
+        )
+        self.mary = Customer.objects.create(
+            first_name="Mary-Kate",
+            last_name="O'Brien",
+            email="mk@example.net",
+            phone="+15557654321",
+        )
+        self.backend = self.make_backend()
+
+    def search(self, term, mode="fulltext"):
+        return self.backend.search(Customer.objects.all(), term, mode)
+
+    def ids(self, term, mode="fulltext"):
+        return set(self.search(term, mode).values_list("id", flat=True))
+
+    def test_prefix_matches(self):
+        """Every query word matches as a prefix of an indexed word."""
+        self.assertEqual(self.ids("john"), {self.john.id, self.bob.id})
+        self.assertEqual(self.ids("JOHNS"), {self.bob.id})
+        self.assertEqual(self.ids("ro"), {self.jane.id})
+
+    def test_words_are_anded_across_columns(self):
+        """Each word may match a different column, but all must match."""
+        self.assertEqual(self.ids("bob johns"), {self.bob.id})
+        self.assertEqual(self.ids("jane doe"), {self.jane.id})
+        self.assertEqual(self.ids("bob doe"), set())
+
+    def test_email_parts_and_punctuation(self):
+        """Email local and domain parts are words; punctuation is ignored."""
+        self.assertEqual(self.ids("john.doe"), {self.john.id})
+        self.assertEqual(self.ids("example.org"), {self.jane.id})
+        self.assertEqual(self.ids("o'brien"), {self.mary.id})
+        self.assertEqual(self.ids("mary-kate"), {self.mary.id})
+
+    def test_phone_groups_and_digits(self):
+        """Phone numbers match by digit group and by leading digits."""
+        self.assertEqual(self.ids("1234"), {self.john.id})
+        self.assertEqual(self.ids("5551234"), {self.john.id, self.jane.id})
+        self.assertEqual(self.ids("1555765"), {self.mary.id})
+
+    def test_empty_query_matches_nothing(self):
+        """A query without words returns no customers."""
+        self.assertEqual(self.ids("@@ --"), set())
+
+    def test_name_outranks_email(self):
+        """Name matches rank above email matches."""
+        ranked = list(self.search("doe").order_by("-search_rank"))
+        self.assertEqual([c.id for c in ranked], [self.john.id, self.jane.id])
+
+    def test_tokens_are_routed_to_columns(self):
+        """Digits only match phones and email fragments only match emails."""
+        Customer.objects.filter(pk=self.bob.pk).update(phone="555-0000")
+        Customer.objects.filter(pk=self.mary.pk).update(email="0000.mk@example.net")
+        self.backend = self.make_backend()
+        self.assertEqual(self.ids("0000"), {self.bob.id})
+        self.assertEqual(self.ids("0000.mk"), {self.mary.id})
+        self.assertEqual(self.ids("doe.jane"), {self.jane.id})
+        self.assertEqual(self.ids("john 555-1234"), {self.john.id})
+
+    def test_substring_mode(self):
+        """Substring mode matches fragments inside names and emails."""
+        self.assertEqual(self.ids("ohn", "substring"), {self.john.id, self.bob.id})
+        self.assertEqual(self.ids("ohn oe", "substring"), {self.john.id})
+        self.assertEqual(self.ids("555-123", "substring"), {self.john.id, self.jane.id})
+
+    def test_larger_table(self):
+        """Multi-word queries stay exact over a few hundred customers."""
+        first_names = ["John", "Jane", "Alice", "Bob", "Carol", "Dave", "Erin"]
+        last_names = ["Smith", "Jones", "Brown", "Taylor", "Wilson", "Evans"]
+        Customer.objects.bulk_create(
+            Customer(
+                first_name=first_names[i % len(first_names)],
+                last_name=last_names[i % len(last_names)],
+                email=f"bulk{i}@example.com",
+                phone=f"555{i:07d}",
+            )
+            for i in range(300)
+        )
+        self.backend = self.make_backend()
+
+        expected = set(
+            Customer.objects.filter(first_name="Alice", last_name="Taylor").values_list(
+                "id", flat=True
+            )
+        )
+        self.assertTrue(expected)
+        self.assertEqual(self.ids("alice tay"), expected)
+
+    @pytest.mark.benchmark
+    def test_benchmark(self):
+        """Report the average full-text query latency over 5,000 customers."""
+        first_names = ["John", "Jane", "Alice", "Bob", "Carol", "Dave", "Erin"]
+        last_names = ["Smith", "Jones", "Brown", "Taylor", "Wilson", "Evans"]
+        Customer.objects.bulk_create(
+            Customer(
+                first_name=first_names[i % len(first_names)],
+                last_name=last_names[i % len(last_names)],
+                email=f"bench{i}@example.com",
+                phone=f"555{i:07d}",
+            )
+            for i in range(5000)
+        )
+        self.backend = self.make_backend()
+        list(self.search("warmup"))
+
+        queries = ["jo", "smith", "alice tay", "bench42", "5550001"]
+        start = time.perf_counter()
+        for _ in range(10):
+            for query in queries:
+                list(self.search(query)[:20])
+        elapsed = (time.perf_counter() - start) / (10 * len(queries))
+
+        print(f"\n{type(self.backend).__name__}: {elapsed * 1000:.2f} ms/query")
+        self.assertTrue(self.ids("alice tay"))
+
+
+class InMemorySearchBackendTest(SearchBackendConformanceMixin, TestCase):
+    """Conformance tests for the in-process inverted index."""
+
+    def make_backend(self):
+        return InMemorySearchBackend()
+
+    def test_index_follows_saves_and_deletes(self):
+        """Saves and deletes update a loaded index without a reload."""
+        self.ids("warmup")
+        self.john.first_name = "Jonathan"
+        self.backend.customer_saved(self.john)
+        self.assertEqual(self.ids("jonathan"), {self.john.id})
+
+        self.backend.customer_deleted(self.bob)
+        self.assertEqual(self.ids("johns"), set())
+
+    @override_settings(CUSTOMER_SEARCH={"MEMORY_MAX_MATCHES": 1})
+    def test_matches_are_capped_to_the_best_ranked(self):
+        """Only the best-ranked ids reach the database query."""
+        self.assertEqual(self.ids("doe"), {self.john.id})
+
+    def test_stale_index_reloads_in_the_background(self):
+        """
+        A stale index keeps serving searches while a thread reloads it,
+        and writes made during the reload survive the swap.
+        """
+        self.ids("warmup")
+        self.backend._loaded_at -= 3600
+        with mock.patch("customers.search.memory.threading.Thread") as thread:
+            with self.assertNumQueries(1):
+                self.assertEqual(self.ids("bob"), {self.bob.id})
+            self.ids("bob")
+        thread.return_value.start.assert_called_once()
+
+        # Bypasses signals, so only the reload sees it.
+        Customer.objects.filter(pk=self.bob.pk).update(first_name="Robert")
+        self.john.first_name = "Jonathan"
+        self.backend.customer_saved(self.john)
+        self.backend._refresh("default")
+
+        self.assertEqual(self.ids("robert"), {self.bob.id})
+        self.assertEqual(self.ids("jonathan"), {self.john.id})
+
+
+@skipUnless(connection.vendor == "sqlite", "requires SQLite")
+class SQLiteSearchBackendTest(SearchBackendConformanceMixin, TestCase):
+    """Conformance tests for the SQLite FTS5 backend."""
+
+    def make_backend(self):
+        return SQLiteSearchBackend()
+
+    def test_triggers_follow_writes(self):
+        """Rows written after the FTS table exists are indexed by triggers."""
+        self.ids("warmup")
+        self.john.first_name = "Jonathan"
+        self.john.save()
+        self.bob.delete()
+
+        self.assertEqual(self.ids("jonathan"), {self.john.id})
+        self.assertEqual(self.ids("johns"), set())
+
+
+@skipUnless(connection.vendor == "postgresql", "requires PostgreSQL")
+class PostgresSearchBackendTest(SearchBackendConformanceMixin, TestCase):
+    """Conformance tests for the PostgreSQL tsvector/trigram backend."""
+
+    def make_backend(self):
+        return PostgresSearchBackend()
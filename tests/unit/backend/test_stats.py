@@ -0,0 +1,164 @@
+from io import StringIO
+from unittest import skipIf, skipUnless
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from customers.counters import read_counters
+from customers.models import Customer
+
+# pyright: reportAttributeAccessIssue=false
+
+
+class CustomerStatsCacheTest(APITestCase):
+    """Test cases for the write-maintained stats cache."""
+
+    def setUp(self):
+        self.active = Customer.objects.create(
+            first_name="Ann", last_name="Ray", email="ann@example.com", phone="555-1111"
+        )
+        self.inactive = Customer.objects.create(
+            first_name="Ben",
+            last_name="Ray",
+            email="ben@example.com",
+            phone="555-2222",
+            is_active=False,
+        )
+        self.stats_url = reverse("customer-stats")
+
+    def stats(self, cached=True):
+        if cached:
+            with self.assertNumQueries(0):
+                response = self.client.get(self.stats_url)
+        else:
+            response = self.client.get(self.stats_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return (
+            response.data["total_customers"],
+            response.data["active_customers"],
+            response.data["inactive_customers"],
+        )
+
+    def test_stats_are_cached(self):
+        """The first read goes to the database; later reads hit the cache."""
+        self.assertEqual(self.stats(cached=False), (2, 1, 1))
+        self.assertEqual(self.stats(), (2, 1, 1))
+
+    def test_api_writes_adjust_cached_stats(self):
+        """Create, activate, deactivate and delete update the counts in place."""
+        self.stats(cached=False)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("customer-list"),
+                {
+                    "first_name": "Cal",
+                    "last_name": "Ray",
+                    "email": "cal@example.com",
+                    "phone": "555-3333",
+                },
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.stats(), (3, 2, 1))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                reverse("customer-activate", kwargs={"pk": self.inactive.pk})
+            )
+        self.assertEqual(self.stats(), (3, 3, 0))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                reverse("customer-deactivate", kwargs={"pk": self.active.pk})
+            )
+            self.client.post(
+                reverse("customer-deactivate", kwargs={"pk": self.active.pk})
+            )
+        self.assertEqual(self.stats(), (3, 2, 1))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(
+                reverse("customer-detail", kwargs={"pk": self.active.pk})
+            )
+        self.assertEqual(self.stats(), (2, 2, 0))
+
+    def test_uncommitted_writes_are_not_counted(self):
+        """Adjustments wait for the transaction to commit."""
+        self.stats(cached=False)
+        with self.captureOnCommitCallbacks(execute=False):
+            self.active.delete()
+        self.assertEqual(self.stats(), (2, 1, 1))
+
+    def test_bulk_status_changes_trigger_reconcile(self):
+        """Bulk status updates drop the cached counts."""
+        self.stats(cached=False)
+        with self.captureOnCommitCallbacks(execute=True):
+            Customer.objects.update(is_active=True)
+        self.assertEqual(self.stats(cached=False), (2, 2, 0))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Customer.objects.bulk_create(
+                [
+                    Customer(
+                        first_name="Dee",
+                        last_name="Ray",
+                        email="dee@example.com",
+                        phone="555-4444",
+                        is_active=False,
+                    )
+                ]
+            )
+        self.assertEqual(self.stats(), (3, 2, 1))
+
+
+@skipUnless(connection.vendor == "postgresql", "requires PostgreSQL")
+class CustomerCounterTest(TestCase):
+    """Test cases for the trigger-maintained counter table."""
+
+    def test_counters_follow_writes(self):
+        """Inserts, status updates and deletes adjust the counters."""
+        before = read_counters()
+        Customer.objects.bulk_create(
+            Customer(
+                first_name="Pat",
+                last_name="Lee",
+                email=f"counter{i}@example.com",
+                phone=f"555-{i:04d}",
+                is_active=i % 2 == 0,
+            )
+            for i in range(10)
+        )
+        Customer.objects.filter(email="counter1@example.com").update(is_active=True)
+        Customer.objects.filter(email="counter0@example.com").delete()
+
+        after = read_counters()
+        self.assertEqual(after["total"] - before["total"], 9)
+        self.assertEqual(after["active"] - before["active"], 5)
+
+    def test_verify_command_repairs_drift(self):
+        """The verify command reports drift and resets the counters."""
+        with connection.cursor() as cursor:
+            cursor.execute("UPDATE customers_counters SET total = total + 3")
+
+        with self.assertRaises(CommandError):
+            call_command("verify_customer_counters", stdout=StringIO())
+
+        out = StringIO()
+        call_command("verify_customer_counters", fix=True, stdout=out)
+        self.assertIn("Reset customer counters", out.getvalue())
+        self.assertEqual(read_counters()["total"], Customer.objects.count())
+
+
+@skipIf(connection.vendor == "postgresql", "counters exist on PostgreSQL")
+class CustomerCounterFallbackTest(TestCase):
+    """Test the behaviour without a counter table."""
+
+    def test_verify_command_requires_counters(self):
+        """The verify command explains that counters need PostgreSQL."""
+        with self.assertRaisesMessage(CommandError, "only on PostgreSQL"):
+            call_command("verify_customer_counters")
@@ -0,0 +1,102 @@
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from customers.models import Customer
+from customers.suggest import prefix_upper_bound
+
+# pyright: reportAttributeAccessIssue=false
+
+
+class PrefixUpperBoundTest(SimpleTestCase):
+    """Test cases for the prefix range bound."""
+
+    def test_bounds_every_extension(self):
+        """The bound sorts after every string with the prefix."""
+        bound = prefix_upper_bound("jo")
+        self.assertEqual(bound, "jp")
+        for value in ["jo", "joe", "jozzz", "jo\uffff"]:
+            self.assertLess(value, bound)
+        self.assertGreaterEqual("jp", bound)
+
+    def test_highest_code_points(self):
+        """Trailing U+10FFFF is dropped and surrogates are skipped."""
+        self.assertEqual(prefix_upper_bound("j\U0010ffff\U0010ffff"), "k")
+        self.assertEqual(prefix_upper_bound("\ud7ff"), "\ue000")
+        self.assertIsNone(prefix_upper_bound("\U0010ffff"))
+
+
+class CustomerSuggestTest(APITestCase):
+    """Test cases for the suggest action."""
+
+    def setUp(self):
+        """Set up test data."""
+        Customer.objects.create(
+            first_name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            phone="555-1234",
+        )
+        Customer.objects.create(
+            first_name="Bob",
+            last_name="Johnson",
+            email="bob.johnson@example.com",
+            phone="555-9999",
+        )
+        Customer.objects.create(
+            first_name="Jane",
+            last_name="Smith",
+            email="jo.smith@example.com",
+            phone="555-5678",
+            is_active=False,
+        )
+        self.suggest_url = reverse("customer-suggest")
+
+    def test_prefix_matches_names_and_emails(self):
+        """A prefix matches first names, last names and emails, once each."""
+        response = self.client.get(self.suggest_url, {"q": "Jo"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        names = [s["full_name"] for s in response.data["suggestions"]]
+        self.assertEqual(names, ["Jane Smith", "John Doe", "Bob Johnson"])
+        self.assertEqual(
+            set(response.data["suggestions"][0]), {"id", "full_name", "email"}
+        )
+
+    def test_limit_and_filters(self):
+        """``limit`` caps the result and list filters still apply."""
+        response = self.client.get(
+            self.suggest_url, {"q": "jo", "limit": 1, "is_active": "true"}
+        )
+
+        self.assertEqual(len(response.data["suggestions"]), 1)
+        self.assertEqual(response.data["suggestions"][0]["full_name"], "John Doe")
+
+    def test_multi_word_prefix(self):
+        """Several words narrow suggestions through the search backend."""
+        response = self.client.get(self.suggest_url, {"q": "bob jo"})
+
+        names = [s["full_name"] for s in response.data["suggestions"]]
+        self.assertEqual(names, ["Bob Johnson"])
+
+    def test_empty_prefix_and_cache_headers(self):
+        """An empty prefix returns nothing and responses are privately cacheable."""
+        response = self.client.get(self.suggest_url, {"q": "  "})
+
+        self.assertEqual(response.data["suggestions"], [])
+        self.assertIn("max-age=30", response["Cache-Control"])
+        self.assertIn("private", response["Cache-Control"])
+
+    def test_prefix_of_highest_code_point(self):
+        """A prefix with no upper bound is answered, not a server error."""
+        response = self.client.get(self.suggest_url, {"q": "\U0010ffff"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["suggestions"], [])
+
+    def test_invalid_limit(self):
+        """A non-numeric limit is rejected."""
+        response = self.client.get(self.suggest_url, {"q": "jo", "limit": "x"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,113 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from customers.models import Customer, CustomerTombstone
+from customers.sync import encode_token
+
+# pyright: reportAttributeAccessIssue=false
+
+
+@override_settings(CUSTOMER_SYNC={"SETTLE_SECONDS": 0})
+class CustomerChangeFeedTest(APITestCase):
+    """Test cases for the incremental sync endpoint."""
+
+    def setUp(self):
+        self.customers = [
+            Customer.objects.create(
+                first_name="Pat",
+                last_name="Lee",
+                email=f"sync{i}@example.com",
+                phone=f"555-{i:04d}",
+            )
+            for i in range(5)
+        ]
+        self.url = reverse("customer-changes")
+
+    def changes(self, since=None, **params):
+        if since is not None:
+            params["since"] = since
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def sync(self, since=None, limit=2):
+        """Follow ``next_token`` until caught up; return ids and the token."""
+        changed, deleted = [], []
+        while True:
+            page = self.changes(since, limit=limit)
+            changed += [customer["id"] for customer in page["changed"]]
+            deleted += [tombstone["id"] for tombstone in page["deleted"]]
+            since = page["next_token"]
+            if not page["has_more"]:
+                return changed, deleted, since
+
+    def test_initial_sync_pages_through_all_customers(self):
+        """Without a token every customer is returned, in keyset pages."""
+        changed, deleted, _ = self.sync()
+        self.assertEqual(changed, [customer.id for customer in self.customers])
+        self.assertEqual(deleted, [])
+
+    def test_delta_returns_only_changes_and_tombstones(self):
+        """A token yields later updates and deletions, then nothing."""
+        _, _, token = self.sync()
+
+        updated, removed = self.customers[3], self.customers[1]
+        updated.last_name = "Roe"
+        updated.save()
+        removed_id = removed.id
+        removed.delete()
+
+        with self.assertNumQueries(2):
+            page = self.changes(token)
+        self.assertEqual([c["id"] for c in page["changed"]], [updated.id])
+        self.assertEqual(page["changed"][0]["last_name"], "Roe")
+        self.assertEqual([t["id"] for t in page["deleted"]], [removed_id])
+
+        page = self.changes(page["next_token"])
+        self.assertEqual((page["changed"], page["deleted"]), ([], []))
+
+    def test_bulk_deletes_leave_tombstones(self):
+        """Queryset deletes are reported too."""
+        _, _, token = self.sync()
+        Customer.objects.filter(id__in=[c.id for c in self.customers[:3]]).delete()
+
+        changed, deleted, _ = self.sync(token)
+        self.assertEqual(changed, [])
+        self.assertEqual(sorted(deleted), [c.id for c in self.customers[:3]])
+
+    def test_recent_changes_are_held_back(self):
+        """Writes inside the settle window wait for the next sync."""
+        with override_settings(CUSTOMER_SYNC={"SETTLE_SECONDS": 60}):
+            self.assertEqual(self.changes()["changed"], [])
+
+    def test_invalid_and_expired_tokens(self):
+        """Malformed tokens are rejected and stale ones require a resync."""
+        response = self.client.get(self.url, {"since": "not-a-token"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        stale = timezone.now() - timedelta(days=31)
+        response = self.client.get(
+            self.url, {"since": encode_token(None, [stale.isoformat(), 0])}
+        )
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+
+    def test_purge_command(self):
+        """Tombstones past the retention period are purged."""
+        CustomerTombstone.objects.create(
+            customer_id=1, deleted_at=timezone.now() - timedelta(days=40)
+        )
+        CustomerTombstone.objects.create(customer_id=2)
+
+        out = StringIO()
+        call_command("purge_customer_tombstones", stdout=out)
+        self.assertIn("Purged 1 customer tombstones", out.getvalue())
+        self.assertEqual(
+            list(CustomerTombstone.objects.values_list("customer_id", flat=True)), [2]
+        )
@@ -0,0 +1,191 @@
+import itertools
+import re
+import time
+from unittest import mock
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase, TestCase
+
+from customers.models import Customer
+from customers.validation import clean_fields, clean_records, find_dangerous
+
+
+def legacy_clean(first_name, last_name, email, phone):
+    """``Customer.clean`` as it was before ``customers.validation``."""
+    dangerous_patterns = re.compile(
+        r"<script|<iframe|<object|<embed|javascript:|data:|on\w+="
+        r"|<\s*\/?\s*(script|iframe|object|embed|svg|img)",
+        re.IGNORECASE,
+    )
+    if first_name:
+        first_name = first_name.strip()
+        if dangerous_patterns.search(first_name):
+            raise ValidationError(
+                {"first_name": "First name contains invalid characters."}
+            )
+        if len(first_name) > 50:
+            raise ValidationError({"first_name": "First name is too long."})
+        if not re.match(r"^[a-zA-Z\s\-\'\.]+$", first_name):
+            raise ValidationError(
+                {"first_name": "First name contains invalid characters."}
+            )
+        first_name = first_name.title()
+    if last_name:
+        last_name = last_name.strip()
+        if dangerous_patterns.search(last_name):
+            raise ValidationError(
+                {"last_name": "Last name contains invalid characters."}
+            )
+        if len(last_name) > 50:
+            raise ValidationError({"last_name": "Last name is too long."})
+        if not re.match(r"^[a-zA-Z\s\-\'\.]+$", last_name):
+            raise ValidationError(
+                {"last_name": "Last name contains invalid characters."}
+            )
+        last_name = last_name.title()
+    if email:
+        email = email.lower().strip()
+        if dangerous_patterns.search(email):
+            raise ValidationError({"email": "Email contains invalid characters."})
+        if len(email) > 254:
+            raise ValidationError({"email": "Email is too long."})
+    if phone:
+        phone = phone.strip()
+        if dangerous_patterns.search(phone):
+            raise ValidationError(
+                {"phone": "Phone number contains invalid characters."}
+            )
+        if len(phone) > 15:
+            raise ValidationError({"phone": "Phone number is too long."})
+    return first_name, last_name, email, phone
+
+
+def outcome(clean, values):
+    try:
+        return clean(*values)
+    except ValidationError as exc:
+        return exc.message_dict
+
+
+NAMES = ["", None, " mary-jo ", "o'brien", "Ann2", "x" * 51, "<script>", "Onload="]
+EMAILS = ["", " Ann@Example.COM ", "javascript:x@example.com", "a" * 255, "a\x00b"]
+PHONES = ["", " 555-1234 ", "5" * 16, "data:555", "<img src=x>"]
+
+
+class CleanFieldsTest(SimpleTestCase):
+    """``clean_fields`` applies the rules ``Customer.clean`` always had."""
+
+    def test_matches_legacy_rules(self):
+        """Results and the first reported error match for every combination."""
+        for values in itertools.product(NAMES, NAMES, EMAILS, PHONES):
+            with self.subTest(values=values):
+                self.assertEqual(
+                    outcome(clean_fields, values), outcome(legacy_clean, values)
+                )
+
+    def test_find_dangerous(self):
+        """The single scan reports the first field with markup."""
+        self.assertIsNone(find_dangerous(["Ann", "Ray", "a@b.co", "555-1234"]))
+        self.assertIsNone(find_dangerous(["on", "load=", "", ""]))
+        self.assertEqual(find_dangerous(["Ann", "x\x00y", "<svg>", "<img>"]), 2)
+        self.assertEqual(find_dangerous(["Ann", "", "", "data:"]), 3)
+
+    def test_clean_records(self):
+        """Records are cleaned by index and omitted fields stay omitted."""
+        cleaned, errors = clean_records(
+            [
+                {"first_name": " ann ", "email": "ANN@example.com", "is_active": False},
+                {"first_name": "Ann", "last_name": "<script>"},
+            ]
+        )
+        self.assertEqual(
+            cleaned,
+            {0: {"first_name": "Ann", "email": "ann@example.com", "is_active": False}},
+        )
+        self.assertEqual(
+            errors, {1: {"last_name": ["Last name contains invalid characters."]}}
+        )
+
+
+class CustomerCleanTest(TestCase):
+    """``Customer.save`` validates only when validated fields are written."""
+
+    def test_status_save_skips_validation(self):
+        customer = Customer.objects.create(
+            first_name="Ann", last_name="Ray", email="ann@example.com", phone="555-1"
+        )
+        customer.is_active = False
+        with mock.patch.object(Customer, "clean") as clean:
+            customer.save(update_fields=["is_active"])
+            clean.assert_not_called()
+            customer.save(update_fields=["is_active", "phone"])
+            clean.assert_called_once()
+
+
+class CleanRecordsBatchTest(SimpleTestCase):
+    """Batch validation agrees with the legacy rules record by record."""
+
+    def test_batch_matches_legacy_rules(self):
+        records = [
+            {
+                "first_name": f"pat{'x' * (i % 5)}",
+                "last_name": "o'lee" if i % 7 else "<script>",
+                "email": f"Pat{i}@Example.com",
+                "phone": f"555-{i % 10000:04d}",
+            }
+            for i in range(500)
+        ]
+        cleaned, errors = clean_records(records)
+        for index, record in enumerate(records):
+            with self.subTest(index=index):
+                expected = outcome(legacy_clean, tuple(record.values()))
+                if isinstance(expected, dict):
+                    self.assertEqual(errors[index], expected)
+                else:
+                    self.assertEqual(
+                        tuple(cleaned[index][field] for field in record), expected
+                    )
+
+
+class ValidationBenchmarkTest(SimpleTestCase):
+    """Benchmark of per-record validation cost."""
+
+    @pytest.mark.benchmark
+    def test_benchmark(self):
+        """Report the legacy rules vs ``clean_fields`` vs ``clean_records``."""
+        records = [
+            {
+                "first_name": f"pat{'x' * (i % 5)}",
+                "last_name": "o'lee",
+                "email": f"Pat{i}@Example.com",
+                "phone": f"555-{i % 10000:04d}",
+            }
+            for i in range(5000)
+        ]
+        rows = [tuple(record.values()) for record in records]
+
+        def run_legacy():
+            for row in rows:
+                outcome(legacy_clean, row)
+
+        def run_fields():
+            for row in rows:
+                outcome(clean_fields, row)
+
+        timings = {}
+        for name, run in (
+            ("legacy", run_legacy),
+            ("clean_fields", run_fields),
+            ("clean_records", lambda: clean_records(records)),
+        ):
+            start = time.perf_counter()
+            for _ in range(5):
+                run()
+            timings[name] = (time.perf_counter() - start) / (5 * len(records))
+
+        print(
+            "\nper record: "
+            + ", ".join(f"{name} {t * 1e6:.2f} us" for name, t in timings.items())
+        )
+        self.assertLess(timings["clean_fields"], timings["legacy"])
@@ -284,3 +284,37 @@ class CustomerViewSetTest(APITestCase):
         # Verify customer was activated
         updated_customer = Customer.objects.get(pk=self.customer3.pk)
         self.assertTrue(updated_customer.is_active)
+
+    def test_status_actions_are_single_statements(self):
+        """Status changes run one UPDATE and return only the changed fields."""
+        deactivate_url = reverse(
+            "customer-deactivate", kwargs={"pk": self.customer1.pk}
+        )
+        with self.assertNumQueries(1):
+            response = self.client.post(deactivate_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["message"], "Customer John Doe has been deactivated."
+        )
+        customer = response.data["customer"]  # type: ignore
+        self.assertEqual(set(customer), {"id", "is_active", "updated_at", "version"})
+        self.assertFalse(customer["is_active"])
+        self.assertEqual(customer["version"], 2)
+        self.assertEqual(
+            response["ETag"],
+            self.client.get(self.detail_url(self.customer1.pk))["ETag"],
+        )
+
+    def test_status_actions_are_idempotent(self):
+        """Repeating a status change writes nothing and keeps the version."""
+        activate_url = reverse("customer-activate", kwargs={"pk": self.customer1.pk})
+        response = self.client.post(activate_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["customer"]["version"], 1)  # type: ignore
+
+    def test_status_action_missing_customer(self):
+        """Unknown customers give 404."""
+        response = self.client.post(reverse("customer-activate", kwargs={"pk": 999}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)